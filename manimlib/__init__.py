@@ -9,6 +9,8 @@ except PackageNotFoundError:
     __version__ = "unknown"
 
 
+import importlib
+
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -16,70 +18,121 @@ if TYPE_CHECKING:
 
 from manimlib.constants import *
 
-from manimlib.window import *
-
-from manimlib.animation.animation import *
-from manimlib.animation.composition import *
-from manimlib.animation.creation import *
-from manimlib.animation.fading import *
-from manimlib.animation.growing import *
-from manimlib.animation.indication import *
-from manimlib.animation.movement import *
-from manimlib.animation.numbers import *
-from manimlib.animation.rotation import *
-from manimlib.animation.specialized import *
-from manimlib.animation.transform import *
-from manimlib.animation.transform_matching_parts import *
-from manimlib.animation.update import *
-
-from manimlib.camera.camera import *
-
-from manimlib.mobject.boolean_ops import *
-from manimlib.mobject.changing import *
-from manimlib.mobject.coordinate_systems import *
-from manimlib.mobject.frame import *
-from manimlib.mobject.functions import *
-from manimlib.mobject.geometry import *
-from manimlib.mobject.interactive import *
-from manimlib.mobject.matrix import *
-from manimlib.mobject.mobject import *
-from manimlib.mobject.mobject_update_utils import *
-from manimlib.mobject.number_line import *
-from manimlib.mobject.numbers import *
-from manimlib.mobject.probability import *
-from manimlib.mobject.shape_matchers import *
-from manimlib.mobject.svg.brace import *
-from manimlib.mobject.svg.drawings import *
-from manimlib.mobject.svg.string_mobject import *
-from manimlib.mobject.svg.svg_mobject import *
-from manimlib.mobject.svg.special_tex import *
-from manimlib.mobject.svg.tex_mobject import *
-from manimlib.mobject.svg.text_mobject import *
-from manimlib.mobject.three_dimensions import *
-from manimlib.mobject.types.dot_cloud import *
-from manimlib.mobject.types.image_mobject import *
-from manimlib.mobject.types.point_cloud_mobject import *
-from manimlib.mobject.types.surface import *
-from manimlib.mobject.types.vectorized_mobject import *
-from manimlib.mobject.value_tracker import *
-from manimlib.mobject.vector_field import *
-
-from manimlib.scene.interactive_scene import *
-from manimlib.scene.scene import *
-
-from manimlib.utils.bezier import *
-from manimlib.utils.cache import *
-from manimlib.utils.color import *
-from manimlib.utils.dict_ops import *
-from manimlib.utils.debug import *
-from manimlib.utils.directories import *
-from manimlib.utils.file_ops import *
-from manimlib.utils.images import *
-from manimlib.utils.iterables import *
-from manimlib.utils.paths import *
-from manimlib.utils.rate_functions import *
-from manimlib.utils.simple_functions import *
-from manimlib.utils.shaders import *
-from manimlib.utils.sounds import *
-from manimlib.utils.space_ops import *
-from manimlib.utils.tex import *
+# The rest of the library is loaded lazily (PEP 562), so that importing
+# manimlib, e.g. to run the command line tool, does not import every
+# animation, mobject and utility module, and all of their dependencies, up
+# front.  These are the submodules which were once star imported here, in
+# order.  The first access to any name they export, like `from manimlib
+# import *`, imports all of them, taking each module's `__all__`, or else its
+# public names, so that nothing needs to be listed here by hand.
+
+_LAZY_MODULES: tuple[str, ...] = (
+    "manimlib.window",
+
+    "manimlib.animation.animation",
+    "manimlib.animation.composition",
+    "manimlib.animation.creation",
+    "manimlib.animation.fading",
+    "manimlib.animation.growing",
+    "manimlib.animation.indication",
+    "manimlib.animation.movement",
+    "manimlib.animation.numbers",
+    "manimlib.animation.rotation",
+    "manimlib.animation.specialized",
+    "manimlib.animation.transform",
+    "manimlib.animation.transform_matching_parts",
+    "manimlib.animation.update",
+
+    "manimlib.camera.camera",
+
+    "manimlib.mobject.boolean_ops",
+    "manimlib.mobject.changing",
+    "manimlib.mobject.coordinate_systems",
+    "manimlib.mobject.frame",
+    "manimlib.mobject.functions",
+    "manimlib.mobject.geometry",
+    "manimlib.mobject.interactive",
+    "manimlib.mobject.matrix",
+    "manimlib.mobject.mobject",
+    "manimlib.mobject.mobject_update_utils",
+    "manimlib.mobject.number_line",
+    "manimlib.mobject.numbers",
+    "manimlib.mobject.probability",
+    "manimlib.mobject.shape_matchers",
+    "manimlib.mobject.svg.brace",
+    "manimlib.mobject.svg.drawings",
+    "manimlib.mobject.svg.string_mobject",
+    "manimlib.mobject.svg.svg_mobject",
+    "manimlib.mobject.svg.special_tex",
+    "manimlib.mobject.svg.tex_mobject",
+    "manimlib.mobject.svg.text_mobject",
+    "manimlib.mobject.three_dimensions",
+    "manimlib.mobject.types.dot_cloud",
+    "manimlib.mobject.types.image_mobject",
+    "manimlib.mobject.types.point_cloud_mobject",
+    "manimlib.mobject.types.surface",
+    "manimlib.mobject.types.vectorized_mobject",
+    "manimlib.mobject.value_tracker",
+    "manimlib.mobject.vector_field",
+
+    "manimlib.scene.interactive_scene",
+    "manimlib.scene.scene",
+
+    "manimlib.utils.bezier",
+    "manimlib.utils.cache",
+    "manimlib.utils.color",
+    "manimlib.utils.dict_ops",
+    "manimlib.utils.debug",
+    "manimlib.utils.directories",
+    "manimlib.utils.file_ops",
+    "manimlib.utils.images",
+    "manimlib.utils.iterables",
+    "manimlib.utils.paths",
+    "manimlib.utils.rate_functions",
+    "manimlib.utils.simple_functions",
+    "manimlib.utils.shaders",
+    "manimlib.utils.sounds",
+    "manimlib.utils.space_ops",
+    "manimlib.utils.tex",
+)
+
+_all_exports_loaded = False
+
+
+def _load_all_exports() -> None:
+    # Equivalent to star importing each submodule in order, so that later
+    # modules take precedence, and names which they import, e.g. np, are
+    # exported as well
+    global _all_exports_loaded
+    if _all_exports_loaded:
+        return
+    for module_name in _LAZY_MODULES:
+        module = importlib.import_module(module_name)
+        names = getattr(module, "__all__", None)
+        if names is None:
+            names = [name for name in vars(module) if not name.startswith("_")]
+        globals().update({name: getattr(module, name) for name in names})
+    _all_exports_loaded = True
+
+
+def __getattr__(name: str):
+    if name == "__all__":
+        _load_all_exports()
+        return [key for key in globals() if not key.startswith("_")]
+    if name.startswith("__"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # E.g. from manimlib import extract_scene
+    try:
+        return importlib.import_module(f"{__name__}.{name}")
+    except ModuleNotFoundError as error:
+        if error.name != f"{__name__}.{name}":
+            raise
+    _load_all_exports()
+    if name in globals():
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    _load_all_exports()
+    return sorted(globals())
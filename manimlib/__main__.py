@@ -1,4 +1,6 @@
 #!/usr/bin/env python
+import sys
+
 from addict import Dict
 
 from manimlib import __version__
@@ -6,10 +8,8 @@ from manimlib.config import manim_config
 from manimlib.config import parse_cli
 import manimlib.extract_scene
 from manimlib.utils.cache import clear_cache
-from manimlib.window import Window
-
-
-from IPython.terminal.embed import KillEmbedded
+from manimlib.utils.profiler import PROFILER
+from manimlib.utils.profiler import profile_startup
 
 
 from typing import TYPE_CHECKING
@@ -27,6 +27,7 @@ def run_scenes():
     run_config = manim_config.run
 
     if run_config.show_in_window:
+        from manimlib.window import Window
         # Create a reusable window
         window = Window(**manim_config.window)
         scene_config.update(window=window)
@@ -35,15 +36,28 @@ def run_scenes():
         try:
             # Blocking call since a scene may init an IPython shell()
             scenes = manimlib.extract_scene.main(scene_config, run_config)
+            if run_config.profile:
+                PROFILER.enable()
             for scene in scenes:
                 scene.run()
+            if run_config.profile:
+                PROFILER.report(run_config.profile)
             return
-        except KillEmbedded:
-            # Requested via the `exit_raise` IPython runline magic
-            # by means of the reload_scene() command
-            pass
         except KeyboardInterrupt:
             break
+        except Exception as error:
+            if not is_reload_request(error):
+                raise
+
+
+def is_reload_request(error: Exception) -> bool:
+    """
+    Whether error was raised by the `exit_raise` IPython runline magic,
+    by means of the reload_scene() command.  IPython is only imported
+    once a scene embeds a shell.
+    """
+    embed = sys.modules.get("IPython.terminal.embed")
+    return embed is not None and isinstance(error, embed.KillEmbedded)
 
 
 def main():
@@ -57,6 +71,26 @@ def main():
         return
     if args.clear_cache:
         clear_cache()
+    if args.profile_startup:
+        argv = [arg for arg in sys.argv[1:] if arg != "--profile_startup"]
+        sys.exit(profile_startup(argv))
+    if args.connect:
+        from manimlib.render_client import run_job
+        argv = [arg for arg in sys.argv[1:] if arg != "--connect"]
+        sys.exit(run_job(argv, args.socket))
+    if args.serve:
+        from manimlib.render_server import RenderServer
+        RenderServer(args.socket).serve_forever()
+        return
+    if args.watch:
+        from manimlib.watch import SceneWatcher
+        SceneWatcher().watch_forever()
+        return
+    if args.benchmark is not None:
+        # Imported here, since the benchmark scenes import much of the library
+        import manimlib.benchmarks
+        manimlib.benchmarks.main(args.benchmark, args.benchmark_output)
+        return
 
     run_scenes()
 
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from copy import deepcopy
 
+import numpy as np
+
 from manimlib.mobject.mobject import _AnimationBuilder
 from manimlib.mobject.mobject import Mobject
 from manimlib.utils.iterables import remove_list_redundancies
@@ -181,6 +183,24 @@ class Animation(object):
         raw_sub_alpha = clip((value - lower), 0, 1)
         return self.rate_func(raw_sub_alpha)
 
+    def get_sub_alphas(
+        self,
+        alpha: float,
+        num_submobjects: int
+    ) -> np.ndarray:
+        """
+        Same as get_sub_alpha, for all indices at once.  The rate function
+        is only evaluated once for each distinct value, since most of these
+        are typically 0 or 1.
+        """
+        lag_ratio = self.lag_ratio
+        full_length = (num_submobjects - 1) * lag_ratio + 1
+        value = alpha * full_length
+        lowers = lag_ratio * np.arange(num_submobjects)
+        raw_sub_alphas = np.clip(value - lowers, 0, 1)
+        values, inverse = np.unique(raw_sub_alphas, return_inverse=True)
+        return np.array([self.rate_func(x) for x in values], dtype=float)[inverse]
+
     # Getters and setters
     def set_run_time(self, run_time: float):
         self.run_time = run_time
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import inspect
+from operator import attrgetter
+from operator import is_
 
 import numpy as np
 
@@ -11,6 +13,7 @@ from manimlib.mobject.mobject import Group
 from manimlib.mobject.mobject import Mobject
 from manimlib.utils.paths import path_along_arc
 from manimlib.utils.paths import straight_path
+from manimlib.utils.shaders import LAG_TABLE_WIDTH
 
 from typing import TYPE_CHECKING
 
@@ -31,12 +34,16 @@ class Transform(Animation):
         path_arc: float | Tuple[float, float] = 0.0,
         path_arc_axis: np.ndarray = OUT,
         path_func: Callable | None = None,
+        interpolate_on_gpu: bool = False,
         **kwargs
     ):
         self.target_mobject = target_mobject
         self.path_arc = path_arc
         self.path_arc_axis = path_arc_axis
         self.path_func = path_func
+        self.interpolate_on_gpu = interpolate_on_gpu
+        self.batch_groups = None
+        self.lag_table = None
         super().__init__(mobject, **kwargs)
         self.init_path_func()
 
@@ -70,10 +77,198 @@ class Transform(Animation):
                 self.starting_mobject,
                 self.target_copy,
             )
+        if self.interpolate_on_gpu and self.can_batch_interpolation():
+            self.init_gpu_interpolation()
+        else:
+            self.init_batched_interpolation()
 
     def finish(self) -> None:
+        self.end_gpu_interpolation()
         super().finish()
         self.mobject.unlock_data()
+        self.end_batched_interpolation()
+
+    def can_batch_interpolation(self) -> bool:
+        if self.path_func is not straight_path:
+            return False
+        # Subclasses with their own notion of interpolation
+        if type(self).interpolate_submobject is not Transform.interpolate_submobject:
+            return False
+        if type(self).interpolate_mobject is not Transform.interpolate_mobject:
+            return False
+        # Updaters could change the data out from under the batch
+        if any(mob.has_updaters() for mob in (self.mobject, self.starting_mobject, self.target_copy)):
+            return False
+        return all(
+            type(sm).interpolate is Mobject.interpolate
+            and sm.data.dtype == start.data.dtype == target.data.dtype
+            and len(sm.data) == len(start.data) == len(target.data)
+            for sm, start, target in self.families
+        )
+
+    def init_batched_interpolation(self) -> None:
+        """
+        Rather than having each family member interpolate its own data, the
+        start and target data of all members sharing a dtype are stacked into
+        contiguous arrays, and the members' data arrays are replaced by views
+        into one array per dtype.  Each frame then takes one numpy operation
+        per unlocked data key, however large the family.
+        """
+        self.batch_groups = None
+        if not self.can_batch_interpolation():
+            return
+
+        members_by_dtype = dict()
+        for index, (sm, start, target) in enumerate(self.families):
+            if len(sm.data) > 0:
+                members_by_dtype.setdefault(sm.data.dtype, []).append(index)
+
+        self.batch_groups = []
+        self.batch_data_mask = np.zeros(len(self.families), dtype=bool)
+        for dtype, indices in members_by_dtype.items():
+            mobs, starts, targets = zip(*(self.families[i] for i in indices))
+            lengths = [len(sm.data) for sm in mobs]
+            ends = np.cumsum(lengths)
+            data = np.concatenate([sm.data for sm in mobs])
+            for sm, end, length in zip(mobs, ends, lengths):
+                sm.data = data[end - length:end]
+            row_indices = np.repeat(indices, lengths)
+
+            keys = []
+            for key in dtype.names:
+                unlocked = [key not in sm.locked_data_keys for sm in mobs]
+                if not any(unlocked):
+                    continue
+                self.batch_data_mask[np.array(indices)[unlocked]] = True
+                if all(unlocked):
+                    rows = None
+                    start_data = np.concatenate([start.data[key] for start in starts])
+                    target_data = np.concatenate([target.data[key] for target in targets])
+                else:
+                    rows = np.flatnonzero(np.repeat(unlocked, lengths))
+                    start_data = np.concatenate([start.data[key] for start in starts])[rows]
+                    target_data = np.concatenate([target.data[key] for target in targets])[rows]
+                key_row_indices = row_indices if rows is None else row_indices[rows]
+                alpha_shape = (-1, *(1,) * (start_data.ndim - 1))
+                keys.append((key, rows, key_row_indices, alpha_shape, start_data, target_data))
+            self.batch_groups.append((data, [sm.data for sm in mobs], mobs, keys))
+        self.init_member_interpolation()
+
+    def end_batched_interpolation(self) -> None:
+        """
+        Gives each member still holding a view into a batch its own copy of
+        its data, so that the batch's arrays can be freed
+        """
+        if self.batch_groups is None:
+            return
+        for data, views, mobs, keys in self.batch_groups:
+            for sm, view in zip(mobs, views):
+                if sm.data is view:
+                    sm.data = view.copy()
+        self.batch_groups = None
+
+    def init_gpu_interpolation(self) -> None:
+        """
+        Each family member keeps its starting data, and is drawn interpolated
+        towards its target by its vertex shaders, with the sub-alphas of all
+        members living in a lag table which is all that changes from frame to
+        frame.  Until the animation finishes, the members' data is not updated
+        on the cpu side.
+        """
+        num_rows = -(-len(self.families) // LAG_TABLE_WIDTH)
+        self.lag_table = np.zeros((num_rows, LAG_TABLE_WIDTH), dtype=np.float32)
+        for index, (sm, start, target) in enumerate(self.families):
+            sm.interpolate(start, target, 0)
+            sm.gpu_interpolation = (target, index, self.lag_table)
+        self.init_member_interpolation()
+        self.mobject.note_changed_data()
+
+    def init_member_interpolation(self) -> None:
+        """
+        Stacks the start and target bounding boxes of all family members, and
+        notes which members have uniforms that change at all, so that frames
+        only do per-member work where it's needed
+        """
+        self.start_bounding_boxes = np.array([start.bounding_box for sm, start, target in self.families])
+        self.bounding_box_diffs = np.array([
+            target.bounding_box - start.bounding_box
+            for sm, start, target in self.families
+        ])
+        self.uniforms_change = np.array([
+            any(
+                key in target.uniforms and not np.array_equal(value, target.uniforms[key])
+                for key, value in start.uniforms.items()
+            )
+            for sm, start, target in self.families
+        ], dtype=bool)
+        self.last_sub_alphas = np.full(len(self.families), np.nan)
+
+    def end_gpu_interpolation(self) -> None:
+        if self.lag_table is None:
+            return
+        for sm, start, target in self.families:
+            sm.gpu_interpolation = None
+        self.lag_table = None
+        self.mobject.note_changed_data()
+
+    def batch_is_valid(self) -> bool:
+        # A member's data may have been replaced since the batch was set up
+        get_data = attrgetter("data")
+        return all(
+            all(map(is_, map(get_data, mobs), views))
+            for data, views, mobs, keys in self.batch_groups
+        )
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        if self.batch_groups is not None and not self.batch_is_valid():
+            self.end_batched_interpolation()
+        if self.batch_groups is None and self.lag_table is None:
+            super().interpolate_mobject(alpha)
+            return
+
+        sub_alphas = self.get_sub_alphas(self.time_spanned_alpha(alpha), len(self.families))
+        changed = np.flatnonzero(sub_alphas != self.last_sub_alphas)
+        if len(changed) == 0:
+            return
+        self.last_sub_alphas = sub_alphas
+
+        if self.lag_table is not None:
+            self.lag_table.flat[:len(sub_alphas)] = sub_alphas
+            self.interpolate_members(changed, sub_alphas)
+            return
+
+        for data, views, mobs, keys in self.batch_groups:
+            for key, rows, row_indices, alpha_shape, start_data, target_data in keys:
+                row_alphas = sub_alphas[row_indices].reshape(alpha_shape)
+                result = row_alphas * target_data
+                result += (1 - row_alphas) * start_data
+                if rows is None:
+                    data[key] = result
+                else:
+                    data[key][rows] = result
+
+        self.interpolate_members(changed, sub_alphas, self.batch_data_mask)
+        self.mobject.note_changed_data()
+
+    def interpolate_members(
+        self,
+        indices: np.ndarray,
+        sub_alphas: np.ndarray,
+        data_mask: np.ndarray | None = None,
+    ) -> None:
+        """
+        Interpolates the bounding boxes and uniforms of the family members at
+        the given indices, noting a change of data for those in data_mask
+        """
+        boxes = self.start_bounding_boxes[indices]
+        boxes += sub_alphas[indices].reshape(-1, 1, 1) * self.bounding_box_diffs[indices]
+        for index, box in zip(indices.tolist(), boxes):
+            sm, start, target = self.families[index]
+            if self.uniforms_change[index]:
+                sm.interpolate_uniforms(start, target, sub_alphas[index])
+            sm.set_bounding_box(box)
+            if data_mask is not None and data_mask[index]:
+                sm.note_changed_data(recurse_up=False)
 
     def create_target(self) -> Mobject:
         # Has no meaningful effect here, but may be useful
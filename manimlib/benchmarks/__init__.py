@@ -0,0 +1,5 @@
+from manimlib.benchmarks.runner import main
+from manimlib.benchmarks.runner import run_benchmarks
+from manimlib.benchmarks.scenes import BENCHMARK_SCENES
+
+__all__ = ["main", "run_benchmarks", "BENCHMARK_SCENES"]
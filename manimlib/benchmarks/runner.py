@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import copy
+import json
+import multiprocessing as mp
+import platform
+import sys
+import tempfile
+import time
+import traceback
+from collections import defaultdict
+
+from addict import Dict
+import numpy as np
+
+from manimlib.animation.transform import Transform
+from manimlib.benchmarks.scenes import BENCHMARK_SCENES
+from manimlib.camera.camera import Camera
+from manimlib.config import manim_config
+from manimlib.constants import RIGHT
+from manimlib.constants import UP
+from manimlib.logger import log
+from manimlib.mobject.geometry import Circle
+from manimlib.mobject.geometry import Square
+from manimlib.mobject.types.vectorized_mobject import VGroup
+from manimlib.utils.profiler import PROFILER
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Iterable, Optional
+
+
+# Largest difference in any color channel, out of 255, allowed between frames
+# which should match, leaving room for rounding in the shaders
+MAX_CHECK_PIXEL_ERROR = 2
+
+def get_peak_rss() -> Optional[int]:
+    """
+    Peak resident set size of the current process, in bytes
+    """
+    try:
+        import resource
+    except ImportError:
+        # Not available on Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else 1024 * peak
+
+
+def get_benchmark_scene_config(output_directory: str) -> Dict:
+    """
+    Frames are rendered without a window, and written to a scratch directory,
+    so that readback and encoding are measured along with everything else
+    """
+    config = copy.deepcopy(Dict(manim_config.scene))
+    config.update(
+        skip_animations=False,
+        start_at_animation_number=None,
+        end_at_animation_number=None,
+        presenter_mode=False,
+    )
+    config.file_writer_config.update(
+        write_to_movie=True,
+        save_last_frame=False,
+        subdivide_output=False,
+        cache_partial_movies=False,
+        output_directory=output_directory,
+        file_name=None,
+        quiet=True,
+        open_file_upon_completion=False,
+        show_file_location_upon_completion=False,
+    )
+    return config
+
+
+def run_benchmark(scene_name: str, scene_config: Dict) -> dict:
+    """
+    Runs in its own process, so that the peak memory, and the state
+    of the standalone GL context, belong to this benchmark alone
+    """
+    scene_class = {cls.__name__: cls for cls in BENCHMARK_SCENES}[scene_name]
+    PROFILER.enable()
+    try:
+        start = time.perf_counter()
+        scene = scene_class(**scene_config)
+        scene.run()
+        total_seconds = time.perf_counter() - start
+    except Exception:
+        return dict(name=scene_name, error=traceback.format_exc())
+
+    stage_ms = defaultdict(float)
+    for play in PROFILER.play_summaries:
+        for stage, microseconds in play["stage_times"].items():
+            stage_ms[stage] += microseconds / 1000
+    n_frames = scene.file_writer.num_frames_written
+    frame_seconds = stage_ms["frame"] / 1000
+    return dict(
+        name=scene_name,
+        frames=n_frames,
+        total_seconds=total_seconds,
+        frames_per_second=(n_frames / frame_seconds if frame_seconds > 0 else None),
+        ms_per_frame={
+            stage: ms / max(n_frames, 1)
+            for stage, ms in stage_ms.items()
+        },
+        peak_rss_bytes=get_peak_rss(),
+        max_vbo_bytes=scene.max_vbo_bytes,
+    )
+
+
+def render_transform_frames(interpolate_on_gpu: bool, n_frames: int = 8) -> list[np.ndarray]:
+    """
+    Frames of a lagged Transform between groups of shapes, changing their
+    positions, fill and stroke, drawn by a camera without a window
+    """
+    camera = Camera(**{**manim_config.camera, "resolution": (480, 270)})
+    source = VGroup(*(Circle(radius=0.3) for _ in range(7)))
+    source.arrange(RIGHT).set_fill("#58C4DD", 0.8).set_stroke("#FFFFFF", 3)
+    target = VGroup(*(Square(side_length=0.5) for _ in range(7)))
+    target.arrange(RIGHT, buff=0.5).shift(UP)
+    target.set_fill("#FC6255", 0.5).set_stroke("#FFFF00", 6)
+
+    animation = Transform(source, target, lag_ratio=0.3, interpolate_on_gpu=interpolate_on_gpu)
+    animation.begin()
+    frames = []
+    for alpha in np.linspace(0, 1, n_frames):
+        animation.interpolate(alpha)
+        camera.capture(source)
+        frames.append(camera.get_pixel_array().astype(int))
+    animation.finish()
+    camera.capture(source)
+    frames.append(camera.get_pixel_array().astype(int))
+    camera.release()
+    return frames
+
+
+def check_gpu_interpolation() -> dict:
+    """
+    Compares the frames of a Transform interpolated on the gpu with those of
+    the same Transform interpolated on the cpu.  Runs in its own process, like
+    run_benchmark.
+    """
+    try:
+        cpu_frames = render_transform_frames(interpolate_on_gpu=False)
+        gpu_frames = render_transform_frames(interpolate_on_gpu=True)
+    except Exception:
+        return dict(name="gpu_interpolation", error=traceback.format_exc())
+    max_error = max(
+        int(np.abs(cpu_frame - gpu_frame).max())
+        for cpu_frame, gpu_frame in zip(cpu_frames, gpu_frames)
+    )
+    return dict(
+        name="gpu_interpolation",
+        passed=max_error <= MAX_CHECK_PIXEL_ERROR,
+        max_pixel_error=max_error,
+    )
+
+
+def run_benchmarks(names: Iterable[str] = ()) -> dict:
+    """
+    Runs each of the named benchmark scenes, or all of them if no names
+    are given, and returns the results along with the render settings
+    """
+    all_names = [cls.__name__ for cls in BENCHMARK_SCENES]
+    names = list(names) or all_names
+    for name in names:
+        if name not in all_names:
+            raise ValueError(f"Unknown benchmark {name}, must be one of {', '.join(all_names)}")
+
+    results = []
+    # Spawn, rather than fork, so that each benchmark gets a clean GL state
+    context = mp.get_context("spawn")
+    with tempfile.TemporaryDirectory() as output_directory:
+        scene_config = get_benchmark_scene_config(output_directory)
+        for name in names:
+            log.info(f"Running benchmark {name}")
+            with context.Pool(1) as pool:
+                results.append(pool.apply(run_benchmark, (name, scene_config)))
+        log.info("Checking gpu interpolation against the cpu")
+        with context.Pool(1) as pool:
+            checks = [pool.apply(check_gpu_interpolation)]
+
+    camera_config = manim_config.camera
+    return dict(
+        platform=platform.platform(),
+        python=platform.python_version(),
+        resolution=list(camera_config.resolution),
+        fps=camera_config.fps,
+        encoder=manim_config.file_writer.encoder,
+        benchmarks=results,
+        checks=checks,
+    )
+
+
+def main(names: Iterable[str] = (), output_file: Optional[str] = None) -> None:
+    report = json.dumps(run_benchmarks(names), indent=2)
+    if output_file:
+        with open(output_file, "w") as fp:
+            fp.write(report)
+        log.info(f"Benchmark results written to {output_file}")
+    else:
+        print(report)
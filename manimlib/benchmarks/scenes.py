@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import numpy as np
+
+from manimlib.animation.creation import ShowCreation
+from manimlib.animation.rotation import Rotate
+from manimlib.animation.transform_matching_parts import TransformMatchingStrings
+from manimlib.constants import DEG
+from manimlib.constants import RIGHT
+from manimlib.constants import UP
+from manimlib.mobject.coordinate_systems import NumberPlane
+from manimlib.mobject.geometry import Dot
+from manimlib.mobject.svg.tex_mobject import Tex
+from manimlib.mobject.svg.text_mobject import Text
+from manimlib.mobject.three_dimensions import Sphere
+from manimlib.mobject.types.vectorized_mobject import VGroup
+from manimlib.mobject.vector_field import AnimatedStreamLines
+from manimlib.mobject.vector_field import StreamLines
+from manimlib.scene.scene import Scene
+from manimlib.scene.scene import ThreeDScene
+
+
+class BenchmarkMixin(object):
+    """
+    Keeps track of the largest number of bytes held in vertex
+    buffers by the mobjects on screen, across all frames
+    """
+    max_vbo_bytes: int = 0
+
+    def update_frame(self, dt: float = 0, force_draw: bool = False) -> None:
+        super().update_frame(dt, force_draw)
+        self.max_vbo_bytes = max(self.max_vbo_bytes, self.get_vbo_bytes())
+
+    def get_vbo_bytes(self) -> int:
+        return sum(
+            shader_wrapper.vbo.size
+            for group in self.render_groups
+            for shader_wrapper in getattr(group, "shader_wrappers", [])
+            if shader_wrapper.vbo is not None
+        )
+
+
+class ManyDots(BenchmarkMixin, Scene):
+    n_rows = 50
+    n_cols = 80
+
+    def construct(self):
+        dots = VGroup(*(Dot(radius=0.03) for _ in range(self.n_rows * self.n_cols)))
+        dots.arrange_in_grid(self.n_rows, self.n_cols, buff=0.1)
+        dots.set_color_by_gradient("#58C4DD", "#FC6255")
+        self.play(ShowCreation(dots, lag_ratio=0.01))
+        self.play(Rotate(dots, 90 * DEG))
+        self.play(dots.animate.shift(UP).set_opacity(0.5))
+
+
+class LargeTex(BenchmarkMixin, Scene):
+    def construct(self):
+        terms = " + ".join(
+            Rf"\frac{{x^{{{n}}}}}{{{n}!}}" for n in range(2, 30)
+        )
+        equation = Tex(Rf"e^x = 1 + x + {terms} + \cdots")
+        equation.set_width(13)
+        self.play(ShowCreation(equation))
+        self.play(equation.animate.scale(0.5).set_color("#FFFF00"))
+
+
+class ComplexFunctionPlane(BenchmarkMixin, Scene):
+    def construct(self):
+        plane = NumberPlane()
+        plane.prepare_for_nonlinear_transform()
+        self.add(plane)
+        self.play(plane.animate.apply_complex_function(np.exp), run_time=3)
+        self.play(plane.animate.apply_complex_function(lambda z: z**2 / 4), run_time=3)
+
+
+class StreamLinesField(BenchmarkMixin, Scene):
+    def construct(self):
+        plane = NumberPlane()
+
+        def func(points):
+            x, y = points[:, 0], points[:, 1]
+            return np.array([np.sin(y), np.cos(x), np.zeros_like(x)]).T
+
+        stream_lines = StreamLines(func, plane, density=2.0)
+        self.add(AnimatedStreamLines(stream_lines))
+        self.wait(5)
+
+
+class HighResSurface(BenchmarkMixin, ThreeDScene):
+    def construct(self):
+        sphere = Sphere(radius=3, resolution=(401, 201))
+        sphere.set_color("#58C4DD")
+        self.add(sphere)
+        self.play(
+            Rotate(sphere, 180 * DEG, axis=RIGHT),
+            self.frame.animate.reorient(30, 60),
+            run_time=4,
+        )
+
+
+class MatchingStrings(BenchmarkMixin, Scene):
+    def construct(self):
+        strings = [
+            "the quick brown fox jumps over the lazy dog",
+            "the lazy dog jumps over the quick brown fox",
+            "a quick brown dog jumps over a lazy fox",
+        ]
+        texts = [Text(string).set_width(12) for string in strings]
+        self.add(texts[0])
+        for text1, text2 in zip(texts, texts[1:]):
+            self.play(TransformMatchingStrings(text1, text2))
+
+
+BENCHMARK_SCENES: list[type[Scene]] = [
+    ManyDots,
+    LargeTex,
+    ComplexFunctionPlane,
+    StreamLinesField,
+    HighResSurface,
+    MatchingStrings,
+]
@@ -1,27 +1,55 @@
 from __future__ import annotations
 
+from collections import deque
+from functools import lru_cache
+import math
+import weakref
+
 import moderngl
 import numpy as np
 import OpenGL.GL as gl
 from PIL import Image
 
 from manimlib.camera.camera_frame import CameraFrame
+from manimlib.camera.picking import MobjectPicker
 from manimlib.constants import BLACK
 from manimlib.constants import DEFAULT_RESOLUTION
 from manimlib.constants import FRAME_HEIGHT
 from manimlib.constants import FRAME_WIDTH
 from manimlib.mobject.mobject import Mobject
 from manimlib.mobject.mobject import Point
+from manimlib.mobject.types.vectorized_mobject import MAX_LOD_LEVEL
+from manimlib.mobject.types.vectorized_mobject import MIN_CURVES_FOR_LOD
+from manimlib.mobject.types.vectorized_mobject import VMobject
 from manimlib.utils.color import color_to_rgba
+from manimlib.utils.profiler import PROFILER
 
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import Optional
+    from typing import Iterable, Optional
     from manimlib.typing import ManimColor, Vect3
     from manimlib.window import Window
 
 
+# As in quadratic_bezier/stroke/vert.glsl
+STROKE_WIDTH_CONVERSION = 0.01
+
+
+@lru_cache
+def get_standalone_context() -> moderngl.Context:
+    """
+    Cameras without a window share one standalone context, so that shader
+    programs, which get_shader_program caches per context, are compiled once
+    per process rather than once per scene.  Without a display to open, as
+    on a headless server, the context is made through EGL instead.
+    """
+    try:
+        return moderngl.create_standalone_context()
+    except Exception:
+        return moderngl.create_standalone_context(backend="egl")
+
+
 class Camera(object):
     def __init__(
         self,
@@ -44,6 +72,44 @@ class Camera(object):
         # without multisampling, for 3d scenes one might want
         # to set samples to be greater than 0.
         samples: int = 0,
+        # If true, frames written to file are read back through a ring
+        # of pixel buffer objects, so that the readback of one frame
+        # overlaps with rendering the next.  The bytes of each frame
+        # then arrive n_readback_buffers - 1 frames late.
+        async_readback: bool = False,
+        n_readback_buffers: int = 2,
+        # If true, and rendering without a window, frames for which no mobject
+        # data, shader uniform or camera uniform has changed are not redrawn,
+        # and the bytes last read back for writing are reused
+        reuse_static_frames: bool = True,
+        # Pixel format of the frames read back for writing to file.  With
+        # "yuv420p", a final pass converts each frame to planar Y, U and V
+        # textures, flipped to put the top row first, so that only 1.5 bytes
+        # per pixel are read back, rather than 4 with "rgba"
+        readback_format: str = "rgba",
+        # If true, scenes find the mobject under the mouse by rendering the
+        # candidates into a buffer of ids, see MobjectPicker, rather than by
+        # testing their bounding boxes.  That buffer has the resolution of the
+        # camera reduced by a factor of picking_downsample.
+        mouse_picking: bool = False,
+        picking_downsample: int = 4,
+        # If true, render groups whose bounding boxes, as projected by the
+        # camera, lie entirely outside the frame are skipped, neither drawn nor
+        # having their data read in.  With cull_family_members, the same goes
+        # for family members of partly visible groups.  Bounding boxes are
+        # padded by the widest stroke or dot radius in the family, and the
+        # margin around the frame, as a fraction of its half width and height,
+        # leaves room for anything else drawn beyond the points.
+        frustum_culling: bool = False,
+        cull_family_members: bool = False,
+        culling_margin: float = 0.1,
+        # If true, VMobjects with many curves are drawn with those runs of
+        # curves which, on screen, lie within lod_tolerance pixels of a straight
+        # line merged into that line, see VMobject.set_lod_level.  Each path is
+        # simplified on its own, so families of many short paths, such as the
+        # lines of a NumberPlane, are drawn in full.
+        vmobject_lod: bool = False,
+        lod_tolerance: float = 0.5,
     ):
         self.window = window
         self.background_image = background_image
@@ -55,15 +121,36 @@ class Camera(object):
         self.pixel_array_dtype = pixel_array_dtype
         self.light_source_position = light_source_position
         self.samples = samples
+        self.async_readback = async_readback
+        self.n_readback_buffers = max(n_readback_buffers, 2)
+        self.reuse_static_frames = reuse_static_frames
+        self.readback_format = readback_format
+        self.mouse_picking = mouse_picking
+        self.picking_downsample = picking_downsample
+        self.picker: MobjectPicker | None = None
+        self.frustum_culling = frustum_culling
+        self.cull_family_members = cull_family_members
+        self.culling_margin = culling_margin
+        # Ids of mobjects last rendered with only some of their family
+        self.partly_rendered_ids: set[int] = set()
+        # Widest stroke and dot radius of each family member culled, along
+        # with the data version they were found for
+        self.max_widths: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self.vmobject_lod = vmobject_lod
+        self.lod_tolerance = lod_tolerance
 
         self.rgb_max_val: float = np.iinfo(self.pixel_array_dtype).max
         self.background_rgba: list[float] = list(color_to_rgba(
             background_color, background_opacity
         ))
         self.uniforms = dict()
+        self.last_capture_signature: tuple | None = None
+        self.frame_bytes: bytes | None = None
         self.init_frame(**frame_config)
         self.init_context()
         self.init_fbo()
+        self.init_yuv_conversion()
+        self.init_readback_buffers()
         self.init_light_source()
 
     def init_frame(self, **config) -> None:
@@ -71,7 +158,7 @@ class Camera(object):
 
     def init_context(self) -> None:
         if self.window is None:
-            self.ctx: moderngl.Context = moderngl.create_standalone_context()
+            self.ctx: moderngl.Context = get_standalone_context()
         else:
             self.ctx: moderngl.Context = self.window.ctx
 
@@ -94,15 +181,131 @@ class Camera(object):
 
         self.fbo.use()
 
+    def init_yuv_conversion(self) -> None:
+        if self.readback_format == "rgba":
+            return
+        if self.readback_format != "yuv420p":
+            raise ValueError(f"Unsupported readback format {self.readback_format}")
+        width, height = self.draw_fbo.size
+        if width % 2 or height % 2:
+            raise ValueError("yuv420p readback requires an even pixel width and height")
+
+        self.y_fbo = self.ctx.framebuffer(
+            self.ctx.texture((width, height), components=1)
+        )
+        # Chroma is subsampled by 2 in each direction, with U and V
+        # written to separate attachments in a single pass
+        self.uv_fbo = self.ctx.framebuffer([
+            self.ctx.texture((width // 2, height // 2), components=1)
+            for _ in range(2)
+        ])
+
+        flip_vert = '''
+            #version 330
+
+            in vec2 texcoord;
+            out vec2 uv;
+
+            void main() {
+                gl_Position = vec4((2.0 * texcoord - 1.0), 0.0, 1.0);
+                // Flip, so that rows are read back from the top down
+                uv = vec2(texcoord.x, 1.0 - texcoord.y);
+            }
+        '''
+        # Conversions follow BT.601 with limited range, as ffmpeg
+        # uses by default when converting rgba to yuv420p
+        y_frag = '''
+            #version 330
+
+            uniform sampler2D Texture;
+
+            in vec2 uv;
+            out float y;
+
+            void main() {
+                vec3 rgb = texture(Texture, uv).rgb;
+                y = (16.0 + 219.0 * dot(rgb, vec3(0.299, 0.587, 0.114))) / 255.0;
+            }
+        '''
+        uv_frag = '''
+            #version 330
+
+            uniform sampler2D Texture;
+
+            in vec2 uv;
+            layout(location = 0) out float u;
+            layout(location = 1) out float v;
+
+            void main() {
+                // Each output pixel lands on the corner shared by a 2x2 block
+                // of the source, so linear filtering averages over that block
+                vec3 rgb = texture(Texture, uv).rgb;
+                u = (128.0 + 224.0 * dot(rgb, vec3(-0.168736, -0.331264, 0.5))) / 255.0;
+                v = (128.0 + 224.0 * dot(rgb, vec3(0.5, -0.418688, -0.081312))) / 255.0;
+            }
+        '''
+        verts = np.array([[0, 0], [0, 1], [1, 0], [1, 1]])
+        quad_vbo = self.ctx.buffer(verts.astype('f4').tobytes())
+        self.yuv_vaos = [
+            self.ctx.simple_vertex_array(
+                self.ctx.program(vertex_shader=flip_vert, fragment_shader=frag),
+                quad_vbo, 'texcoord',
+                mode=moderngl.TRIANGLE_STRIP
+            )
+            for frag in (y_frag, uv_frag)
+        ]
+        self.draw_fbo.color_attachments[0].filter = (moderngl.LINEAR, moderngl.LINEAR)
+
+    def init_readback_buffers(self) -> None:
+        self.readback_buffers: list[moderngl.Buffer] = []
+        self.pending_readbacks: deque[moderngl.Buffer] = deque()
+        self.readback_index: int = 0
+        if not self.async_readback:
+            return
+        self.readback_buffers = [
+            self.ctx.buffer(reserve=self.get_frame_byte_size())
+            for _ in range(self.n_readback_buffers)
+        ]
+
     def init_light_source(self) -> None:
         self.light_source = Point(self.light_source_position)
 
+    def release(self) -> None:
+        """
+        Releases the frame buffers, textures and buffers made by this camera,
+        which matters when its context outlives it, as a shared standalone
+        context does in a long running process
+        """
+        # Otherwise the context stays bound to a released frame buffer,
+        # which it then tries to restore when the next one is made
+        self.ctx.detect_framebuffer(0).use()
+        fbos = [self.fbo_for_files, self.draw_fbo]
+        if self.readback_format == "yuv420p":
+            fbos.extend([self.y_fbo, self.uv_fbo])
+            for vao in self.yuv_vaos:
+                vao.program.release()
+                vao.release()
+            self.yuv_vaos = []
+        for fbo in fbos:
+            for attachment in [*fbo.color_attachments, fbo.depth_attachment]:
+                if attachment is not None:
+                    attachment.release()
+            fbo.release()
+        for buffer in self.readback_buffers:
+            buffer.release()
+        self.readback_buffers = []
+        self.pending_readbacks.clear()
+        if self.picker is not None:
+            self.picker.release()
+            self.picker = None
+
     def use_window_fbo(self, use: bool = True):
         assert self.window is not None
         if use:
             self.fbo = self.window_fbo
         else:
             self.fbo = self.fbo_for_files
+        self.note_frame_drawn()
 
     # Methods associated with the frame buffer
     def get_fbo(
@@ -146,6 +349,90 @@ class Camera(object):
             dtype=dtype,
         )
 
+    def get_frame_byte_size(self) -> int:
+        width, height = self.draw_fbo.size
+        if self.readback_format == "yuv420p":
+            return (width * height * 3) // 2
+        return width * height * self.n_channels
+
+    def render_yuv_planes(self) -> None:
+        """
+        Converts the contents of draw_fbo into the planes held by
+        y_fbo and uv_fbo
+        """
+        self.draw_fbo.color_attachments[0].use(0)
+        self.ctx.disable(moderngl.BLEND)
+        for fbo, vao in zip([self.y_fbo, self.uv_fbo], self.yuv_vaos):
+            fbo.use()
+            vao.render()
+        self.ctx.enable(moderngl.BLEND)
+        self.fbo.use()
+
+    def get_yuv_planes(self) -> list[tuple[moderngl.Framebuffer, int]]:
+        # Pairs of frame buffer and attachment, in the order of
+        # the planes of a yuv420p frame
+        return [(self.y_fbo, 0), (self.uv_fbo, 0), (self.uv_fbo, 1)]
+
+    def read_frame(self) -> bytes:
+        if self.readback_format == "rgba":
+            return self.get_raw_fbo_data()
+        self.blit(self.fbo, self.draw_fbo)
+        self.render_yuv_planes()
+        return b"".join(
+            fbo.read(components=1, attachment=attachment, dtype='f1')
+            for fbo, attachment in self.get_yuv_planes()
+        )
+
+    def get_frame_bytes(self) -> bytes:
+        """
+        Raw bytes of the current frame, as written to a movie file, in
+        the pixel format given by readback_format.  If
+        nothing has been drawn since the last call, the same bytes are
+        returned again without another readback.
+        """
+        if self.frame_bytes is None:
+            with PROFILER.span("readback"):
+                self.frame_bytes = self.read_frame()
+        return self.frame_bytes
+
+    def queue_raw_fbo_data(self) -> bytes | None:
+        """
+        Start an asynchronous read of the current frame into the next
+        pixel buffer of the ring.  Once the ring is full, this returns
+        the bytes of the oldest pending frame, and otherwise None.
+        """
+        with PROFILER.span("readback"):
+            self.blit(self.fbo, self.draw_fbo)
+            buffer = self.readback_buffers[self.readback_index]
+            self.readback_index = (self.readback_index + 1) % len(self.readback_buffers)
+            if self.readback_format == "rgba":
+                self.draw_fbo.read_into(
+                    buffer,
+                    viewport=self.draw_fbo.viewport,
+                    components=self.n_channels,
+                    dtype='f1',
+                )
+            else:
+                self.render_yuv_planes()
+                offset = 0
+                for fbo, attachment in self.get_yuv_planes():
+                    fbo.read_into(buffer, components=1, attachment=attachment, dtype='f1', write_offset=offset)
+                    offset += fbo.width * fbo.height
+            self.pending_readbacks.append(buffer)
+            if len(self.pending_readbacks) < len(self.readback_buffers):
+                return None
+            return self.pending_readbacks.popleft().read()
+
+    def flush_readback_buffers(self) -> list[bytes]:
+        """
+        Returns the bytes of all frames whose readback is still pending,
+        in the order they were queued.
+        """
+        result = [buffer.read() for buffer in self.pending_readbacks]
+        self.pending_readbacks.clear()
+        self.readback_index = 0
+        return result
+
     def get_image(self) -> Image.Image:
         return Image.frombytes(
             'RGBA',
@@ -172,6 +459,20 @@ class Camera(object):
         )
         return texture
 
+    def pick_mobject(
+        self,
+        point: Vect3,
+        mobjects: Iterable[Mobject],
+        buff: float = 0
+    ) -> Mobject | None:
+        """
+        The last of the given mobjects drawn within buff of point, as
+        found by rendering them into a buffer of ids
+        """
+        if self.picker is None:
+            self.picker = MobjectPicker(self, self.picking_downsample)
+        return self.picker.pick(point, mobjects, buff)
+
     # Getting camera attributes
     def get_pixel_size(self) -> float:
         return self.frame.get_width() / self.get_pixel_shape()[0]
@@ -223,17 +524,225 @@ class Camera(object):
 
     # Rendering
     def capture(self, *mobjects: Mobject) -> None:
-        self.clear()
-        self.refresh_uniforms()
-        self.fbo.use()
-        for mobject in mobjects:
-            mobject.render(self.ctx, self.uniforms)
-
-        if self.window:
-            self.window.swap_buffers()
-            if self.fbo is not self.window_fbo:
-                self.blit(self.fbo, self.window_fbo)
+        with PROFILER.span("capture"):
+            self.refresh_uniforms()
+            if self.frustum_culling:
+                mobjects = self.cull(mobjects)
+            if self.vmobject_lod:
+                self.update_lod_levels(mobjects)
+            if self.reuse_static_frames and self.window is None:
+                signature = self.get_capture_signature(mobjects)
+                is_static = signature is not None and signature == self.last_capture_signature
+                self.last_capture_signature = signature
+                if is_static:
+                    return
+
+            self.note_frame_drawn()
+            self.clear()
+            self.fbo.use()
+            for mobject in mobjects:
+                self.render_mobject(mobject)
+
+            if self.window:
                 self.window.swap_buffers()
+                if self.fbo is not self.window_fbo:
+                    self.blit(self.fbo, self.window_fbo)
+                    self.window.swap_buffers()
+
+    def cull(self, mobjects: tuple[Mobject, ...]) -> tuple[Mobject, ...]:
+        """
+        Leaves out those mobjects which lie entirely outside the frame
+        """
+        result = tuple(
+            mob for mob in mobjects
+            if (visible := self.get_visible_mask([mob])) is None or visible[0]
+        )
+        PROFILER.count("culled_render_groups", len(mobjects) - len(result))
+        return result
+
+    def render_mobject(self, mobject: Mobject) -> None:
+        family = None
+        if self.frustum_culling and self.cull_family_members:
+            members = mobject.family_members_with_points()
+            visible = self.get_visible_mask(members)
+            if visible is not None and not visible.all():
+                family = [sm for sm, vis in zip(members, visible) if vis]
+                PROFILER.count("culled_family_members", len(members) - len(family))
+        if family is not None:
+            self.partly_rendered_ids.add(id(mobject))
+        elif id(mobject) in self.partly_rendered_ids:
+            # Only some of its family was last read in
+            self.partly_rendered_ids.discard(id(mobject))
+            mobject._data_has_changed = True
+        mobject.render(self.ctx, self.uniforms, family)
+
+    def update_lod_levels(self, mobjects: tuple[Mobject, ...]) -> None:
+        """
+        Sets the level of detail of each VMobject to be drawn such that its
+        curves are simplified to within lod_tolerance pixels, given the size
+        its bounding box appears on screen.  Those with too few curves to be
+        simplified are passed over before anything is projected.
+        """
+        vmobs = [
+            sm
+            for mob in mobjects
+            for sm in mob.family_members_with_points()
+            if isinstance(sm, VMobject) and sm.get_num_curves() >= MIN_CURVES_FOR_LOD
+        ]
+        if not vmobs:
+            return
+        projection = self.get_projected_bounding_boxes(vmobs)
+        if projection is None:
+            for vmob in vmobs:
+                vmob.set_lod_level(None)
+            return
+        ndc_x, ndc_y = projection
+        width, height = self.get_pixel_shape()
+        extents = np.hypot(
+            np.ptp(ndc_x, axis=1) * width / 2,
+            np.ptp(ndc_y, axis=1) * height / 2,
+        )
+        n_simplified = 0
+        for vmob, extent in zip(vmobs, extents):
+            level = None
+            if extent > 0:
+                level = max(math.ceil(math.log2(extent / self.lod_tolerance)), 0)
+                if level > MAX_LOD_LEVEL:
+                    level = None
+            vmob.set_lod_level(level)
+            n_simplified += vmob.lod_level is not None
+        PROFILER.count("simplified_vmobjects", n_simplified)
+
+    def get_projected_bounding_boxes(
+        self,
+        mobjects: list[Mobject],
+        pad_for_strokes: bool = False,
+    ) -> tuple[np.ndarray, np.ndarray] | None:
+        """
+        Normalized device coordinates x and y of the eight corners of each
+        mobject's bounding box, as projected in emit_gl_Position.glsl, with
+        each box first padded by get_stroke_padding if pad_for_strokes is
+        true.  Returns None if those can't be told, e.g. during an animation
+        which interpolates on the gpu, when bounding boxes may be out of date.
+        """
+        family = [sm for mob in mobjects for sm in mob.get_family()]
+        if any(sm.gpu_interpolation is not None for sm in family):
+            return None
+        fixed = [sm.uniforms.get("is_fixed_in_frame", 0.0) for sm in family if sm.has_points()]
+        if not fixed or any(f != fixed[0] or f not in (0, 1) for f in fixed):
+            return None
+
+        bbs = np.array([mob.get_bounding_box()[0::2] for mob in mobjects])  # (n, 2, 3)
+        if pad_for_strokes:
+            padding = np.array([self.get_stroke_padding(mob) for mob in mobjects])
+            bbs[:, 0] -= padding[:, np.newaxis]
+            bbs[:, 1] += padding[:, np.newaxis]
+        # All eight corners of each box
+        corners = np.array([
+            [bbs[:, i, 0], bbs[:, j, 1], bbs[:, k, 2]]
+            for i in range(2) for j in range(2) for k in range(2)
+        ]).transpose(2, 0, 1)  # (n, 8, 3)
+        if not fixed[0]:
+            view = self.frame.get_view_matrix()
+            corners = corners @ view[:3, :3].T + view[:3, 3]
+        scale_x, scale_y, scale_z = self.uniforms["frame_rescale_factors"]
+        w = 1.0 - corners[:, :, 2] * scale_z
+        if (w <= 0).any():
+            # Some corner is level with or behind the camera
+            return None
+        ndc_x = corners[:, :, 0] * scale_x / w
+        ndc_y = corners[:, :, 1] * scale_y / w
+        return ndc_x, ndc_y
+
+    def get_stroke_padding(self, mobject: Mobject) -> float:
+        """
+        How far, in frame units, what's drawn of a mobject's family may reach
+        beyond the bounding box of its points.  That's its widest stroke, as
+        sized in quadratic_bezier/stroke/vert.glsl, in full rather than half
+        to allow for miter joints, or its largest dot radius, plus anti-aliasing.
+        """
+        frame_scale = self.frame.get_scale()
+        pixel_size = self.get_pixel_size()
+        padding = 0.0
+        for sm in mobject.get_family():
+            max_stroke_width, max_radius = self.get_max_widths(sm)
+            if max_stroke_width > 0:
+                zoom = 1.0 if sm.uniforms.get("scale_stroke_with_zoom", 0) else frame_scale
+                max_radius = max(max_radius, STROKE_WIDTH_CONVERSION * max_stroke_width * zoom)
+            if max_radius > 0:
+                aaw = sm.uniforms.get("anti_alias_width", 0) * pixel_size
+                padding = max(padding, max_radius + aaw)
+        return padding
+
+    def get_max_widths(self, mobject: Mobject) -> tuple[float, float]:
+        version = (mobject._data_version, id(mobject.data))
+        cached = self.max_widths.get(mobject)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        data = mobject.data
+        names = data.dtype.names
+        result = (
+            float(data["stroke_width"].max()) if "stroke_width" in names and len(data) else 0.0,
+            float(data["radius"].max()) if "radius" in names and len(data) else 0.0,
+        )
+        self.max_widths[mobject] = (version, result)
+        return result
+
+    def get_visible_mask(self, mobjects: list[Mobject]) -> np.ndarray | None:
+        """
+        For each mobject, whether its bounding box, projected as in
+        emit_gl_Position.glsl, might overlap the frame, or None if that
+        can't be told, see get_projected_bounding_boxes.
+        """
+        if not mobjects:
+            return np.zeros(0, dtype=bool)
+        projection = self.get_projected_bounding_boxes(mobjects, pad_for_strokes=True)
+        if projection is None:
+            return None
+        ndc_x, ndc_y = projection
+        bound = 1.0 + self.culling_margin
+        outside = np.logical_or.reduce([
+            (ndc_x > bound).all(1),
+            (ndc_x < -bound).all(1),
+            (ndc_y > bound).all(1),
+            (ndc_y < -bound).all(1),
+        ])
+        return ~outside
+
+    def get_capture_signature(self, mobjects: tuple[Mobject, ...]) -> tuple | None:
+        """
+        Summarizes everything that determines the next captured frame, apart
+        from mobject data.  Returns None if any mobject has data which changed
+        since it was last rendered, in which case the frame must be redrawn.
+        """
+        if any(mob._data_has_changed for mob in mobjects):
+            return None
+        if not all(hasattr(mob, "shader_wrappers") for mob in mobjects):
+            return None
+        shader_uniforms = tuple(
+            tuple(
+                (key, tuple(value.flatten()) if isinstance(value, np.ndarray) else value)
+                for key, value in shader_wrapper.mobject_uniforms.items()
+            )
+            for mob in mobjects
+            for shader_wrapper in mob.shader_wrappers
+        )
+        lag_tables = tuple(
+            shader_wrapper.lag_table.tobytes()
+            for mob in mobjects
+            for shader_wrapper in mob.shader_wrappers
+            if shader_wrapper.lag_table is not None
+        )
+        return (
+            tuple(map(id, mobjects)),
+            tuple(self.uniforms.items()),
+            tuple(self.background_rgba),
+            shader_uniforms,
+            lag_tables,
+        )
+
+    def note_frame_drawn(self) -> None:
+        self.frame_bytes = None
 
     def refresh_uniforms(self) -> None:
         frame = self.frame
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import copy
+
+import moderngl
+import numpy as np
+
+from manimlib.constants import FRAME_HEIGHT
+from manimlib.constants import FRAME_WIDTH
+from manimlib.utils.iterables import batch_by_property
+from manimlib.utils.profiler import PROFILER
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Iterable, Optional
+    from manimlib.camera.camera import Camera
+    from manimlib.mobject.mobject import Mobject
+    from manimlib.shader_wrapper import ShaderWrapper
+    from manimlib.typing import Vect3
+
+
+# Pixels of a mobject rendered with at least this opacity count as part of it
+MIN_PICKING_OPACITY = 0.01
+# Number of sets of candidates whose id buffers are kept around
+MAX_ID_BUFFERS = 4
+
+
+class MobjectPicker(object):
+    """
+    Finds which of some mobjects is drawn at a given point, by rendering each
+    of them, in order, into a buffer holding at each pixel the id of the last
+    one covering it.  Unlike testing bounding boxes, this follows the shapes
+    as actually drawn, and the lookup is a read of the pixels near the point,
+    however many mobjects there are.
+
+    The buffer is drawn at a resolution reduced by downsample, and only redrawn
+    when the candidates, their data, or the camera have changed since, so that
+    the cost of drawing it is paid at most once per change, when the mouse
+    next moves.
+
+    Mobjects are drawn through copies of their shader wrappers, sharing programs
+    and textures, so that the vertex buffers used for the frame are left alone.
+    """
+    def __init__(self, camera: Camera, downsample: int = 4):
+        self.camera = camera
+        self.ctx = camera.ctx
+        width, height = camera.default_pixel_shape
+        self.size = (max(width // downsample, 1), max(height // downsample, 1))
+        # Each candidate is drawn into the canvas on its own, and the pixels
+        # it covered then have its id written into an id buffer
+        self.canvas = self.ctx.framebuffer(
+            color_attachments=self.ctx.texture(self.size, components=4),
+            depth_attachment=self.ctx.depth_renderbuffer(self.size),
+        )
+        self.id_buffers: dict[tuple[int, ...], tuple[tuple, moderngl.Framebuffer]] = dict()
+        self.pick_wrappers: dict[int, tuple[Mobject, list[ShaderWrapper]]] = dict()
+        self.init_id_program()
+
+    def init_id_program(self) -> None:
+        vert = '''
+            #version 330
+
+            in vec2 texcoord;
+            out vec2 uv;
+
+            void main() {
+                gl_Position = vec4((2.0 * texcoord - 1.0), 0.0, 1.0);
+                uv = texcoord;
+            }
+        '''
+        frag = '''
+            #version 330
+
+            uniform sampler2D Canvas;
+            uniform float mobject_id;
+            uniform float min_opacity;
+
+            in vec2 uv;
+            out float id;
+
+            void main() {
+                if(texture(Canvas, uv).a < min_opacity) discard;
+                id = mobject_id;
+            }
+        '''
+        program = self.ctx.program(vertex_shader=vert, fragment_shader=frag)
+        program["min_opacity"] = MIN_PICKING_OPACITY
+        verts = np.array([[0, 0], [0, 1], [1, 0], [1, 1]])
+        self.quad_vbo = self.ctx.buffer(verts.astype('f4').tobytes())
+        self.id_vao = self.ctx.simple_vertex_array(
+            program, self.quad_vbo, 'texcoord',
+            mode=moderngl.TRIANGLE_STRIP
+        )
+
+    def release(self) -> None:
+        for _, fbo in self.id_buffers.values():
+            self.release_fbo(fbo)
+        self.id_buffers = dict()
+        self.release_fbo(self.canvas)
+        for _, wrappers in self.pick_wrappers.values():
+            for wrapper in wrappers:
+                wrapper.release()
+        self.pick_wrappers = dict()
+        self.id_vao.program.release()
+        self.id_vao.release()
+        self.quad_vbo.release()
+
+    def release_fbo(self, fbo: moderngl.Framebuffer) -> None:
+        for attachment in [*fbo.color_attachments, fbo.depth_attachment]:
+            if attachment is not None:
+                attachment.release()
+        fbo.release()
+
+    def pick(
+        self,
+        point: Vect3,
+        candidates: Iterable[Mobject],
+        buff: float = 0
+    ) -> Optional[Mobject]:
+        """
+        The last of candidates drawn within buff of point, if any
+        """
+        candidates = list(dict.fromkeys(candidates))  # Without repeats
+        if not candidates:
+            return None
+        self.camera.refresh_uniforms()
+        id_buffer = self.get_id_buffer(candidates)
+
+        width, height = self.size
+        x, y = self.get_pixel_coords(point)
+        radius = int(buff * width / self.camera.get_frame_width())
+        x0, y0 = max(x - radius, 0), max(y - radius, 0)
+        x1, y1 = min(x + radius + 1, width), min(y + radius + 1, height)
+        if x0 >= x1 or y0 >= y1:
+            return None
+        with PROFILER.span("picking_readback"):
+            raw = id_buffer.read(viewport=(x0, y0, x1 - x0, y1 - y0), components=1, dtype='f4')
+        # Ids start at 1, and later mobjects have higher ids
+        top_id = int(np.frombuffer(raw, dtype='f4').max())
+        return candidates[top_id - 1] if top_id > 0 else None
+
+    def get_pixel_coords(self, point: Vect3) -> tuple[int, int]:
+        """
+        Pixel of the id buffer at which point is drawn, projected as in
+        emit_gl_Position.glsl
+        """
+        fx, fy, fz = self.camera.frame.to_fixed_frame_point(point)
+        w = 1.0 - fz * self.camera.uniforms["frame_rescale_factors"][2]
+        u = 0.5 + fx / (FRAME_WIDTH * w)
+        v = 0.5 + fy / (FRAME_HEIGHT * w)
+        width, height = self.size
+        return int(np.floor(u * width)), int(np.floor(v * height))
+
+    def get_signature(self, candidates: list[Mobject]) -> tuple:
+        # Versions of data are bumped for a mobject whenever that of
+        # any of its family changes
+        return (
+            tuple(mob._data_version for mob in candidates),
+            tuple(
+                (key, tuple(value.flatten()) if isinstance(value, np.ndarray) else value)
+                for mob in candidates
+                for key, value in mob.uniforms.items()
+            ),
+            tuple(self.camera.uniforms.items()),
+        )
+
+    def get_id_buffer(self, candidates: list[Mobject]) -> moderngl.Framebuffer:
+        key = tuple(map(id, candidates))
+        signature = self.get_signature(candidates)
+        if key in self.id_buffers:
+            last_signature, fbo = self.id_buffers.pop(key)
+        else:
+            last_signature, fbo = None, self.ctx.framebuffer(
+                self.ctx.texture(self.size, components=1, dtype='f4')
+            )
+        # Most recently used last
+        self.id_buffers[key] = (signature, fbo)
+        while len(self.id_buffers) > MAX_ID_BUFFERS:
+            oldest = next(iter(self.id_buffers))
+            self.release_fbo(self.id_buffers.pop(oldest)[1])
+        if signature != last_signature:
+            with PROFILER.span("picking"):
+                self.render_id_buffer(fbo, candidates)
+            self.release_unused_wrappers()
+        return fbo
+
+    def render_id_buffer(self, fbo: moderngl.Framebuffer, candidates: list[Mobject]) -> None:
+        ctx = self.ctx
+        camera_uniforms = self.camera.uniforms
+        fbo.clear(0.0)
+        program = self.id_vao.program
+        for mob_id, mob in enumerate(candidates, start=1):
+            self.canvas.clear(0.0, 0.0, 0.0, 0.0)
+            self.canvas.use()
+            for wrapper in self.get_pick_wrappers(mob):
+                wrapper.update_program_uniforms(camera_uniforms)
+                wrapper.pre_render()
+                wrapper.render()
+
+            fbo.use()
+            ctx.disable(moderngl.BLEND)
+            ctx.disable(moderngl.DEPTH_TEST)
+            self.canvas.color_attachments[0].use(0)
+            program["Canvas"] = 0
+            program["mobject_id"] = float(mob_id)
+            self.id_vao.render()
+            ctx.enable(moderngl.BLEND)
+        self.camera.fbo.use()
+
+    def get_pick_wrappers(self, mobject: Mobject) -> list[ShaderWrapper]:
+        """
+        Copies of the shader wrappers mobject renders with, holding the same
+        data but their own vertex buffers
+        """
+        ctx = self.ctx
+        family = mobject.family_members_with_points()
+        batches = batch_by_property(family, lambda sm: sm.get_shader_wrapper(ctx).get_id())
+        _, old_wrappers = self.pick_wrappers.get(id(mobject), (mobject, []))
+        old_by_id = {wrapper.get_id(): wrapper for wrapper in old_wrappers}
+        wrappers = []
+        for submobs, sid in batches:
+            wrapper = old_by_id.pop(sid, None)
+            if wrapper is None:
+                wrapper = copy.copy(submobs[0].shader_wrapper)
+                wrapper.init_vertex_objects()
+                # Not to be written into, as it may be the original's
+                wrapper.vert_data = wrapper.vert_data[:0]
+            mobject.read_shader_data(wrapper, submobs)
+            wrappers.append(wrapper)
+        for wrapper in old_by_id.values():
+            wrapper.release()
+        self.pick_wrappers[id(mobject)] = (mobject, wrappers)
+        return wrappers
+
+    def release_unused_wrappers(self) -> None:
+        in_use = {mob_id for key in self.id_buffers for mob_id in key}
+        for mob_id in list(self.pick_wrappers):
+            if mob_id not in in_use:
+                for wrapper in self.pick_wrappers.pop(mob_id)[1]:
+                    wrapper.release()
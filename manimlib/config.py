@@ -20,7 +20,7 @@ if TYPE_CHECKING:
     from typing import Optional
 
 
-def initialize_manim_config() -> Dict:
+def initialize_manim_config(args: Optional[Namespace] = None) -> Dict:
     """
     Return default configuration for various classes in manim, such as
     Scene, Window, Camera, and SceneFileWriter, as well as configuration
@@ -28,9 +28,11 @@ def initialize_manim_config() -> Dict:
 
     The result is initially on the contents of default_config.yml in the manimlib directory,
     which can be further updated by a custom configuration file custom_config.yml.
-    It is further updated based on command line argument.
+    It is further updated based on command line argument, as parsed by parse_cli
+    unless args are passed in.
     """
-    args = parse_cli()
+    if args is None:
+        args = parse_cli()
     global_defaults_file = os.path.join(get_manim_dir(), "manimlib", "default_config.yml")
     config = Dict(merge_dicts_recursively(
         load_yaml(global_defaults_file),
@@ -51,7 +53,7 @@ def initialize_manim_config() -> Dict:
     return config
 
 
-def parse_cli():
+def parse_cli(argv: Optional[list[str]] = None):
     try:
         parser = argparse.ArgumentParser()
         module_location = parser.add_mutually_exclusive_group()
@@ -120,6 +122,12 @@ def parse_cli():
             "--vcodec",
             help="Video codec to use with ffmpeg",
         )
+        parser.add_argument(
+            "--encoder",
+            choices=["ffmpeg", "pyav"],
+            help="Whether to encode by piping frames to an ffmpeg subprocess, " + \
+                 "or in-process with PyAV",
+        )
         parser.add_argument(
             "--pix_fmt",
             help="Pixel format to use for the output of ffmpeg, defaults to `yuv420p`",
@@ -176,6 +184,12 @@ def parse_cli():
             help="Frame rate, as an integer",
             type=int,
         )
+        parser.add_argument(
+            "--async_readback",
+            action="store_true",
+            help="Read frames back from the GPU asynchronously when writing to file, " + \
+                 "overlapping readback of one frame with rendering of the next",
+        )
         parser.add_argument(
             "-c", "--color",
             help="Background color",
@@ -192,9 +206,75 @@ def parse_cli():
         )
         parser.add_argument(
             "--prerun",
-            action="store_true",
+            nargs="?",
+            const="full",
+            choices=["full", "timeline"],
             help="Calculate total framecount, to display in a progress bar, by doing " + \
-                 "an initial run of the scene which skips animations."
+                 "an initial run of the scene which skips animations.  Frame counts " + \
+                 "from earlier renders are reused while neither the file nor the " + \
+                 "modules it imports have changed.  With \"--prerun timeline\", the " + \
+                 "initial run only adds up the run times of plays and waits, without " + \
+                 "running animations or updaters, unless a wait has a stop condition."
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of processes to split the plays of a scene between " + \
+                 "when writing it to file.  The resulting segments are concatenated.",
+        )
+        parser.add_argument(
+            "--profile",
+            nargs="?",
+            const=True,
+            metavar="TRACE_FILE",
+            help="Time each stage of rendering every frame, namely updaters, " + \
+                 "interpolation, vbo uploads, drawing, readback and encoding.  " + \
+                 "Prints a summary for each play, and writes Chrome trace events " + \
+                 "to TRACE_FILE, by default a json file in the video directory.",
+        )
+        parser.add_argument(
+            "--profile_startup",
+            action="store_true",
+            help="Run with python's import time profiling, and print how long " + \
+                 "was spent importing each package, and the slowest imports",
+        )
+        parser.add_argument(
+            "--watch",
+            action="store_true",
+            help="Keep running after writing to file, and whenever the scene " + \
+                 "file or the project modules it imports change, re-render " + \
+                 "the scenes whose code changed",
+        )
+        parser.add_argument(
+            "--serve",
+            action="store_true",
+            help="Start a render server, which keeps imports, the gl context, " + \
+                 "compiled shaders and caches warm between render jobs, " + \
+                 "submitted with --connect, over a unix domain socket",
+        )
+        parser.add_argument(
+            "--connect",
+            action="store_true",
+            help="Rather than rendering in this process, submit the render " + \
+                 "to a server started with --serve",
+        )
+        parser.add_argument(
+            "--socket",
+            help="Path of the socket used by --serve and --connect, by default " + \
+                 "in the temporary directory",
+        )
+        parser.add_argument(
+            "--benchmark",
+            nargs="*",
+            metavar="NAME",
+            help="Instead of rendering a file, run the named benchmark scenes from " + \
+                 "manimlib.benchmarks headlessly, or all of them if none are named, " + \
+                 "and report frame rates, time per stage and memory use as json",
+        )
+        parser.add_argument(
+            "--benchmark_output",
+            help="File to write benchmark results to, rather than printing them",
         )
         parser.add_argument(
             "--video_dir",
@@ -224,8 +304,8 @@ def parse_cli():
             help="Automatically reload Python modules to pick up code changes " +
                  "across different files",
         )
-        args = parser.parse_args()
-        args.write_file = any([args.write_file, args.open, args.finder])
+        args = parser.parse_args(argv)
+        args.write_file = any([args.write_file, args.open, args.finder, args.watch])
         return args
     except argparse.ArgumentError as err:
         log.error(str(err))
@@ -254,6 +334,8 @@ def update_camera_config(config: Dict, args: Namespace):
     camera_config.resolution = arg_resolution or literal_eval(camera_config.resolution)
     if args.fps:
         camera_config.fps = args.fps
+    if args.async_readback:
+        camera_config.async_readback = True
     if args.color:
         try:
             camera_config.background_color = colour.Color(args.color)
@@ -263,6 +345,8 @@ def update_camera_config(config: Dict, args: Namespace):
             sys.exit(2)
     if args.transparent:
         camera_config.background_opacity = 0.0
+        # Chroma subsampled frames have no alpha channel
+        camera_config.readback_format = "rgba"
 
 
 def update_file_writer_config(config: Dict, args: Namespace):
@@ -290,6 +374,8 @@ def update_file_writer_config(config: Dict, args: Namespace):
 
     if args.pix_fmt:
         file_writer_config.pixel_format = args.pix_fmt
+    if args.encoder:
+        file_writer_config.encoder = args.encoder
 
 
 def update_scene_config(config: Dict, args: Namespace):
@@ -318,6 +404,8 @@ def update_run_config(config: Dict, args: Namespace):
         embed_line=(int(args.embed) if args.embed is not None else None),
         is_reload=False,
         prerun=args.prerun,
+        workers=args.workers,
+        profile=get_profile_path(args, config),
         scene_names=args.scene_names,
         quiet=args.quiet or args.write_all,
         write_all=args.write_all,
@@ -395,5 +483,14 @@ def get_output_directory(args: Namespace, config: Dict) -> str:
     return out_dir
 
 
+def get_profile_path(args: Namespace, config: Dict) -> Optional[str]:
+    if args.profile is None:
+        return None
+    if args.profile is True:
+        stem = Path(args.file).stem if args.file else "manim"
+        return str(Path(get_output_directory(args, config), stem + "_trace.json"))
+    return args.profile
+
+
 # Create global configuration
 manim_config: Dict = initialize_manim_config()
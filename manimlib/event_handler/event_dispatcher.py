@@ -5,6 +5,14 @@ import numpy as np
 from manimlib.event_handler.event_listner import EventListener
 from manimlib.event_handler.event_type import EventType
 
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Callable, Iterable, Optional
+
+    from manimlib.mobject.mobject import Mobject
+    from manimlib.utils.spatial_index import SpatialIndex
+
 
 class EventDispatcher(object):
     def __init__(self):
@@ -18,14 +26,53 @@ class EventDispatcher(object):
         self.mouse_drag_point = np.array((0., 0., 0.))
         self.pressed_keys: set[int] = set()
         self.draggable_object_listners: list[EventListener] = []
+        # If set, e.g. to Camera.pick_mobject, this finds which of some
+        # mobjects is drawn at a point, in place of bounding box tests
+        self.picker: Optional[Callable[[np.ndarray, Iterable[Mobject]], Optional[Mobject]]] = None
+        # Spatial indices over the mobjects listened to for each type of
+        # event, made as needed, and dropped as listners come and go
+        self.listner_indices: dict[EventType, SpatialIndex] = dict()
+
+    def set_picker(self, picker: Optional[Callable[[np.ndarray, Iterable[Mobject]], Optional[Mobject]]]):
+        self.picker = picker
+        return self
+
+    def reset_listner_index(self, event_type: EventType) -> None:
+        index = self.listner_indices.pop(event_type, None)
+        if index is not None:
+            index.close()
+
+    def get_listner_index(self, event_type: EventType) -> SpatialIndex:
+        if event_type not in self.listner_indices:
+            # Imported here, since mobjects import this module
+            from manimlib.utils.spatial_index import SpatialIndex
+            mobjects = dict.fromkeys(listner.mobject for listner in self.event_listners[event_type])
+            self.listner_indices[event_type] = SpatialIndex(mobjects)
+        return self.listner_indices[event_type]
+
+    def get_listners_at_point(self, event_type: EventType, point: np.ndarray) -> list[EventListener]:
+        """
+        Listners for event_type whose mobjects' bounding boxes contain point.
+        With a picker, only those of the mobject drawn on top at that point.
+        """
+        listners = self.event_listners[event_type]
+        if not listners:
+            return []
+        if self.picker is None:
+            touching = set(map(id, self.get_listner_index(event_type).get_mobjects_at_point(point)))
+            return [listner for listner in listners if id(listner.mobject) in touching]
+        top = self.picker(point, [listner.mobject for listner in listners])
+        return [listner for listner in listners if listner.mobject is top]
 
     def add_listner(self, event_listner: EventListener):
         assert isinstance(event_listner, EventListener)
         self.event_listners[event_listner.event_type].append(event_listner)
+        self.reset_listner_index(event_listner.event_type)
         return self
 
     def remove_listner(self, event_listner: EventListener):
         assert isinstance(event_listner, EventListener)
+        self.reset_listner_index(event_listner.event_type)
         try:
             while event_listner in self.event_listners[event_listner.event_type]:
                 self.event_listners[event_listner.event_type].remove(event_listner)
@@ -44,11 +91,10 @@ class EventDispatcher(object):
         elif event_type == EventType.KeyReleaseEvent:
             self.pressed_keys.difference_update({event_data["symbol"]})  # Modifiers?
         elif event_type == EventType.MousePressEvent:
-            self.draggable_object_listners = [
-                listner
-                for listner in self.event_listners[EventType.MouseDragEvent]
-                if listner.mobject.is_point_touching(self.mouse_point)
-            ]
+            self.draggable_object_listners = self.get_listners_at_point(
+                EventType.MouseDragEvent,
+                self.mouse_point,
+            )
         elif event_type == EventType.MouseReleaseEvent:
             self.draggable_object_listners = []
 
@@ -62,12 +108,10 @@ class EventDispatcher(object):
                     return propagate_event
 
         elif event_type.value.startswith('mouse'):
-            for listner in self.event_listners[event_type]:
-                if listner.mobject.is_point_touching(self.mouse_point):
-                    propagate_event = listner.callback(
-                        listner.mobject, event_data)
-                    if propagate_event is not None and propagate_event is False:
-                        return propagate_event
+            for listner in self.get_listners_at_point(event_type, self.mouse_point):
+                propagate_event = listner.callback(listner.mobject, event_data)
+                if propagate_event is not None and propagate_event is False:
+                    return propagate_event
 
         elif event_type.value.startswith('key'):
             for listner in self.event_listners[event_type]:
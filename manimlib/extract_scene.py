@@ -8,8 +8,11 @@ from manimlib.module_loader import ModuleLoader
 
 from manimlib.config import manim_config
 from manimlib.logger import log
+from manimlib.parallel_render import ParallelSceneRenderer
 from manimlib.scene.interactive_scene import InteractiveScene
 from manimlib.scene.scene import Scene
+from manimlib.utils.cache import cache_frame_count
+from manimlib.utils.cache import get_cached_frame_count
 
 from typing import TYPE_CHECKING
 
@@ -60,28 +63,67 @@ def prompt_user_for_choice(scene_classes):
         sys.exit(1)
 
 
-def compute_total_frames(scene_class, scene_config):
+def prerun_scene(scene_class, scene_config, timeline_only: bool = False) -> Scene:
     """
-    When a scene is being written to file, a copy of the scene is run with
-    skip_animations set to true so as to count how many frames it will require.
-    This allows for a total progress bar on rendering, and also allows runtime
-    errors to be exposed preemptively for long running scenes.
+    Runs a copy of the scene with skip_animations set to true, without
+    writing anything to file, and returns it.
     """
     pre_config = copy.deepcopy(scene_config)
+    pre_config["timeline_only"] = timeline_only
     pre_config["file_writer_config"]["write_to_movie"] = False
     pre_config["file_writer_config"]["save_last_frame"] = False
     pre_config["file_writer_config"]["quiet"] = True
     pre_config["skip_animations"] = True
     pre_scene = scene_class(**pre_config)
     pre_scene.run()
+    return pre_scene
+
+
+def compute_total_frames(scene_class, scene_config, timeline_only: bool = False):
+    """
+    When a scene is being written to file, a copy of the scene is run with
+    skip_animations set to true so as to count how many frames it will require.
+    This allows for a total progress bar on rendering, and also allows runtime
+    errors to be exposed preemptively for long running scenes.
+
+    If a previous render of the same scene from unchanged files recorded
+    its frame count, that is used instead.  If timeline_only is true, the
+    pre-run only adds up the run times of plays and waits, without running
+    any animations or updaters, falling back to a full pre-run on failure,
+    e.g. when a wait has a stop_condition.
+    """
+    start = scene_config.start_at_animation_number
+    end = scene_config.end_at_animation_number
+    n_frames = get_cached_frame_count(scene_class, start, end)
+    if n_frames is not None:
+        return n_frames
+
+    pre_scene = None
+    if timeline_only:
+        try:
+            pre_scene = prerun_scene(scene_class, scene_config, timeline_only=True)
+        except Exception as err:
+            log.warning(f"Timeline-only pre-run failed ({err}), running full pre-run instead")
+    if pre_scene is None:
+        pre_scene = prerun_scene(scene_class, scene_config)
     total_time = pre_scene.time - pre_scene.skip_time
-    return int(total_time * manim_config.camera.fps)
+    n_frames = int(total_time * manim_config.camera.fps)
+    if not timeline_only:
+        cache_frame_count(scene_class, n_frames, start, end)
+    return n_frames
 
 
 def scene_from_class(scene_class, scene_config: Dict, run_config: Dict):
     fw_config = manim_config.file_writer
+    if fw_config.write_to_movie and run_config.workers > 1:
+        # Count the plays up front, so they can be split between workers
+        num_plays = prerun_scene(scene_class, scene_config).num_plays
+        return ParallelSceneRenderer(scene_class, scene_config, run_config, num_plays)
     if fw_config.write_to_movie and run_config.prerun:
-        scene_config.file_writer_config.total_frames = compute_total_frames(scene_class, scene_config)
+        scene_config.file_writer_config.total_frames = compute_total_frames(
+            scene_class, scene_config,
+            timeline_only=(run_config.prerun == "timeline"),
+        )
     return scene_class(**scene_config)
 
 
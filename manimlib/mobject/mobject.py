@@ -7,6 +7,7 @@ import os
 import pickle
 import random
 import sys
+import weakref
 
 import moderngl
 import numbers
@@ -75,6 +76,12 @@ class Mobject(object):
     ])
     aligned_data_keys = ['point']
     pointlike_data_keys = ['point']
+    # When not None, weak references to mobjects are appended as they are
+    # created or copied, see SceneSnapshotter
+    creation_log: Optional[list[weakref.ref]] = None
+    # Objects with a note_changed_bounding_box method, told whenever a
+    # mobject's bounding box may have changed, see SpatialIndex
+    bounding_box_observers: weakref.WeakSet = weakref.WeakSet()
 
     def __init__(
         self,
@@ -88,6 +95,8 @@ class Mobject(object):
         depth_test: bool = False,
         z_index: int = 0,
     ):
+        if Mobject.creation_log is not None:
+            Mobject.creation_log.append(weakref.ref(self))
         self.color = color
         self.opacity = opacity
         self.shading = shading
@@ -109,6 +118,16 @@ class Mobject(object):
         self._is_animating: bool = False
         self._needs_new_bounding_box: bool = True
         self._data_has_changed: bool = True
+        # Whether copies or saved states hold read-only views of this
+        # mobject's data, which it must then copy before writing to
+        self._data_is_shared: bool = False
+        # Incremented whenever this mobject's own data changes, so that shader
+        # wrappers know which parts of their vertex data must be rewritten
+        self._data_version: int = 0
+        # While a transform runs on the gpu, this holds the mobject being
+        # interpolated towards, this mobject's index into the table of alphas,
+        # and that table
+        self.gpu_interpolation: Optional[tuple[Mobject, int, np.ndarray]] = None
         self.shader_code_replacements: dict[str, str] = dict()
 
         self.init_data()
@@ -207,15 +226,55 @@ class Mobject(object):
 
     def note_changed_data(self, recurse_up: bool = True) -> Self:
         self._data_has_changed = True
+        self._data_version += 1
+        if Mobject.bounding_box_observers:
+            self.notify_bounding_box_observers()
         if recurse_up:
             for mob in self.parents:
                 mob.note_changed_data()
         return self
 
+    def notify_bounding_box_observers(self) -> None:
+        for observer in list(Mobject.bounding_box_observers):
+            observer.note_changed_bounding_box(self)
+
+    def share_data(self) -> np.ndarray:
+        """
+        A read-only view of this mobject's data, for a copy or saved state to
+        hold in place of a copy of it.  This mobject's own data stays writable,
+        but is replaced by a copy before it is next modified, see unshare_data,
+        so that the view never changes.  Until then, get_points returns read-only
+        views, and get_writable_points should be used to write points in place.
+        Writing into self.data directly bypasses this.
+        """
+        data = self.data
+        if not data.flags.writeable:
+            return data
+        if data.flags.owndata:
+            self._data_is_shared = True
+            data = data.view()
+        else:
+            # A view onto some other array, which may yet be written to
+            data = data.copy()
+        data.flags.writeable = False
+        return data
+
+    def unshare_data(self) -> Self:
+        """
+        Copies hold read-only views of the data of the mobject they were copied
+        from, see share_data, until one of them is about to be modified.  This
+        gives the mobject its own writable copy of its data.
+        """
+        if self._data_is_shared or not self.data.flags.writeable:
+            self.data = self.data.copy()
+            self._data_is_shared = False
+        return self
+
     @staticmethod
     def affects_data(func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
         def wrapper(self, *args, **kwargs):
+            self.unshare_data()
             result = func(self, *args, **kwargs)
             self.note_changed_data()
             return result
@@ -225,6 +284,8 @@ class Mobject(object):
     def affects_family_data(func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
         def wrapper(self, *args, **kwargs):
+            for mob in self.get_family():
+                mob.unshare_data()
             result = func(self, *args, **kwargs)
             for mob in self.family_members_with_points():
                 mob.note_changed_data()
@@ -317,6 +378,20 @@ class Mobject(object):
     # Others related to points
 
     def get_points(self) -> Vect3Array:
+        points = self.data["point"]
+        if self._data_is_shared:
+            # Copies hold this data too, so it must not be written to in place
+            points = points.view()
+            points.flags.writeable = False
+        return points
+
+    def get_writable_points(self) -> Vect3Array:
+        """
+        The points, for writing into in place, after which note_changed_data
+        should be called.  Unlike get_points, this first gives the mobject its
+        own copy of its data if it's shared with copies, see unshare_data.
+        """
+        self.unshare_data()
         return self.data["point"]
 
     def clear_points(self) -> Self:
@@ -359,6 +434,22 @@ class Mobject(object):
             mids = (mins + maxs) / 2
             return np.array([mins, mids, maxs])
 
+    def set_bounding_box(self, bounding_box: Vect3Array) -> Self:
+        """
+        Sets the bounding box directly, as when interpolating, rather than
+        computing it from the points, leaving those of ancestors to be
+        recomputed when next asked for
+        """
+        self.bounding_box[:] = bounding_box
+        parents = list(self.parents)
+        while parents:
+            parent = parents.pop()
+            # Ancestors of one already marked are marked too
+            if not parent._needs_new_bounding_box:
+                parent._needs_new_bounding_box = True
+                parents.extend(parent.parents)
+        return self
+
     def refresh_bounding_box(
         self,
         recurse_down: bool = False,
@@ -366,6 +457,8 @@ class Mobject(object):
     ) -> Self:
         for mob in self.get_family(recurse_down):
             mob._needs_new_bounding_box = True
+            if Mobject.bounding_box_observers:
+                mob.notify_bounding_box_observers()
         if recurse_up:
             for parent in self.parents:
                 parent.refresh_bounding_box()
@@ -649,12 +742,32 @@ class Mobject(object):
             return result
         return wrapper
 
-    @stash_mobject_pointers
     def serialize(self) -> bytes:
+        """
+        Binary representation of this mobject's family, see
+        manimlib.utils.serialization, falling back to pickle
+        for classes which can't be found by name on loading
+        """
+        from manimlib.utils.serialization import serialize_mobject
+        from manimlib.utils.serialization import UnsupportedMobjectFormat
+
+        try:
+            return serialize_mobject(self)
+        except UnsupportedMobjectFormat:
+            return self.serialize_with_pickle()
+
+    @stash_mobject_pointers
+    def serialize_with_pickle(self) -> bytes:
         return pickle.dumps(self)
 
     def deserialize(self, data: bytes) -> Self:
-        self.become(pickle.loads(data))
+        from manimlib.utils.serialization import deserialize_mobject
+        from manimlib.utils.serialization import is_binary_mobject
+
+        if is_binary_mobject(data):
+            self.become(deserialize_mobject(data))
+        else:
+            self.become(pickle.loads(data))
         return self
 
     @stash_mobject_pointers
@@ -665,7 +778,14 @@ class Mobject(object):
         if deep:
             return self.deepcopy()
 
-        result = copy.copy(self)
+        # Equivalent to copy.copy, without its dispatch
+        result = self.__class__.__new__(self.__class__)
+        result.__dict__.update(self.__dict__)
+        creation_log = Mobject.creation_log
+        if creation_log is not None:
+            # Copies of submobjects are not logged themselves
+            creation_log.append(weakref.ref(result))
+            Mobject.creation_log = None
 
         result.parents = []
         result.target = None
@@ -673,7 +793,10 @@ class Mobject(object):
 
         # copy.copy is only a shallow copy, so the internal
         # data which are numpy arrays or other mobjects still
-        # need to be further copied.
+        # need to be further copied.  The exception is the data
+        # array, which the copy shares until either mobject modifies it
+        result.data = self.share_data()
+        result._data_is_shared = False
         result.uniforms = {
             key: value.copy() if isinstance(value, np.ndarray) else value
             for key, value in self.uniforms.items()
@@ -683,6 +806,8 @@ class Mobject(object):
         # updater statues and bounding box, just directly modify the family-related
         # lists
         result.submobjects = [sm.copy() for sm in self.submobjects]
+        if creation_log is not None:
+            Mobject.creation_log = creation_log
         for sm in result.submobjects:
             sm.parents = [result]
         result.family = [result, *it.chain(*(sm.get_family() for sm in result.submobjects))]
@@ -692,14 +817,22 @@ class Mobject(object):
         result.updaters = list(self.updaters)
         result._data_has_changed = True
         result.shader_wrapper = None
+        result.gpu_interpolation = None
 
-        family = self.get_family()
+        family_index = None
         for attr, value in self.__dict__.items():
-            if isinstance(value, Mobject) and value is not self:
-                if value in family:
-                    setattr(result, attr, result.family[family.index(value)])
-            elif isinstance(value, np.ndarray):
-                setattr(result, attr, value.copy())
+            if not isinstance(value, (np.ndarray, Mobject)) or value is self:
+                continue
+            if isinstance(value, np.ndarray):
+                if attr != "data":
+                    setattr(result, attr, value.copy())
+                continue
+            # Point references within the family at the copy's members
+            if family_index is None:
+                family_index = {id(mob): n for n, mob in enumerate(self.get_family())}
+            index = family_index.get(id(value))
+            if index is not None:
+                setattr(result, attr, result.family[index])
         return result
 
     def generate_target(self, use_deepcopy: bool = False) -> Self:
@@ -735,6 +868,8 @@ class Mobject(object):
             sm1.depth_test = sm2.depth_test
             sm1.render_primitive = sm2.render_primitive
             sm1._needs_new_bounding_box = sm2._needs_new_bounding_box
+        for parent in self.parents:
+            parent.refresh_bounding_box()
         # Make sure named family members carry over
         for attr, value in list(mobject.__dict__.items()):
             if isinstance(value, Mobject) and value in family2:
@@ -1816,6 +1951,7 @@ class Mobject(object):
     ) -> Self:
         keys = [k for k in self.data.dtype.names if k not in self.locked_data_keys]
         if keys:
+            self.unshare_data()
             self.note_changed_data()
         for key in keys:
             md1 = mobject1.data[key]
@@ -1828,13 +1964,22 @@ class Mobject(object):
             else:
                 self.data[key] = (1 - alpha) * md1 + alpha * md2
 
+        self.interpolate_uniforms(mobject1, mobject2, alpha)
+        self.set_bounding_box(path_func(mobject1.bounding_box, mobject2.bounding_box, alpha))
+        return self
+
+    def interpolate_uniforms(
+        self,
+        mobject1: Mobject,
+        mobject2: Mobject,
+        alpha: float
+    ) -> Self:
         for key in self.uniforms:
             if key in self.locked_uniform_keys:
                 continue
             if key not in mobject1.uniforms or key not in mobject2.uniforms:
                 continue
             self.uniforms[key] = (1 - alpha) * mobject1.uniforms[key] + alpha * mobject2.uniforms[key]
-        self.bounding_box[:] = path_func(mobject1.bounding_box, mobject2.bounding_box, alpha)
         return self
 
     def pointwise_become_partial(self, mobject, a, b) -> Self:
@@ -2051,20 +2196,57 @@ class Mobject(object):
     def get_shader_wrapper(self, ctx: Context) -> ShaderWrapper:
         if self.shader_wrapper is None:
             self.init_shader_wrapper(ctx)
+        lag_table = None if self.gpu_interpolation is None else self.gpu_interpolation[2]
+        self.shader_wrapper.set_lag_table(lag_table)
         return self.shader_wrapper
 
-    def get_shader_wrapper_list(self, ctx: Context) -> list[ShaderWrapper]:
-        family = self.family_members_with_points()
+    def get_shader_wrapper_list(
+        self,
+        ctx: Context,
+        family: Optional[list[Mobject]] = None
+    ) -> list[ShaderWrapper]:
+        if family is None:
+            family = self.family_members_with_points()
         batches = batch_by_property(family, lambda sm: sm.get_shader_wrapper(ctx).get_id())
 
         result = []
         for submobs, sid in batches:
             shader_wrapper = submobs[0].shader_wrapper
-            data_list = [sm.get_shader_data() for sm in submobs]
-            shader_wrapper.read_in(data_list)
+            self.read_shader_data(shader_wrapper, submobs)
             result.append(shader_wrapper)
         return result
 
+    def read_shader_data(self, shader_wrapper: ShaderWrapper, submobs: list[Mobject]) -> None:
+        """
+        If shader_wrapper last read in data from the same submobjects, in
+        the same order, only the data of those which have changed since
+        is rewritten.  Otherwise, all of it is read in afresh, as it always is
+        while interpolating on the gpu, so that the targets are read in with it.
+        """
+        sources = shader_wrapper.slot_sources
+        same_sources = len(sources) == len(submobs) and all(s is sm for s, sm in zip(sources, submobs))
+        if same_sources and shader_wrapper.lag_table is None:
+            versions = shader_wrapper.slot_versions
+            changed = [i for i, sm in enumerate(submobs) if sm.get_shader_data_version() != versions[i]]
+            if shader_wrapper.write_slots({i: submobs[i].get_shader_data() for i in changed}):
+                for i in changed:
+                    versions[i] = submobs[i].get_shader_data_version()
+                return
+
+        if shader_wrapper.lag_table is not None:
+            shader_wrapper.read_in_targets(*zip(*(
+                sm.get_gpu_interpolation_target_data() for sm in submobs
+            )))
+        shader_wrapper.read_in([sm.get_shader_data() for sm in submobs])
+        shader_wrapper.slot_sources = list(submobs)
+        shader_wrapper.slot_versions = [sm.get_shader_data_version() for sm in submobs]
+
+    def get_shader_data_version(self) -> Any:
+        """
+        Changes whenever what get_shader_data would return does
+        """
+        return self._data_version
+
     def get_shader_data(self) -> np.ndarray:
         indices = self.get_shader_vert_indices()
         if indices is not None:
@@ -2072,14 +2254,35 @@ class Mobject(object):
         else:
             return self.data
 
+    def get_gpu_interpolation_target_data(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Shader data of the mobject this is being interpolated towards on the gpu,
+        along with the index into the table of alphas for each of its vertices
+        """
+        target, lag_index, lag_table = self.gpu_interpolation
+        target_data = target.get_shader_data()
+        return target_data, np.full(len(target_data), lag_index, dtype=np.float32)
+
     def get_uniforms(self):
         return self.uniforms
 
     def get_shader_vert_indices(self) -> Optional[np.ndarray]:
         return None
 
-    def render(self, ctx: Context, camera_uniforms: dict):
-        if self._data_has_changed:
+    def render(
+        self,
+        ctx: Context,
+        camera_uniforms: dict,
+        family: Optional[list[Mobject]] = None
+    ):
+        """
+        Draws the family members with points, or if given, only those of family,
+        e.g. those left after culling any outside the camera's view
+        """
+        if family is not None:
+            self.shader_wrappers = self.get_shader_wrapper_list(ctx, family)
+            self._data_has_changed = False
+        elif self._data_has_changed:
             self.shader_wrappers = self.get_shader_wrapper_list(ctx)
             self._data_has_changed = False
         for shader_wrapper in self.shader_wrappers:
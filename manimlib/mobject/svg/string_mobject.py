@@ -3,8 +3,6 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 import itertools as it
 import re
-from scipy.optimize import linear_sum_assignment
-from scipy.spatial.distance import cdist
 
 from manimlib.constants import DEFAULT_MOBJECT_COLOR
 from manimlib.logger import log
@@ -157,6 +155,9 @@ class StringMobject(SVGMobject, ABC):
 
         labelled_svg = VGroup(*labelled_submobs)
         labelled_svg.replace(VGroup(*unlabelled_submobs))
+        # Imported here since scipy.optimize is slow to import
+        from scipy.optimize import linear_sum_assignment
+        from scipy.spatial.distance import cdist
         distance_matrix = cdist(
             [submob.get_center() for submob in unlabelled_submobs],
             [submob.get_center() for submob in labelled_submobs]
@@ -66,13 +66,13 @@ class PMobject(Mobject):
         )
         return self
 
-    @Mobject.affects_data
+    @Mobject.affects_family_data
     def filter_out(self, condition: Callable[[np.ndarray], bool]) -> Self:
         for mob in self.family_members_with_points():
             mob.data = mob.data[~np.apply_along_axis(condition, 1, mob.get_points())]
         return self
 
-    @Mobject.affects_data
+    @Mobject.affects_family_data
     def sort_points(self, function: Callable[[Vect3], None] = lambda p: p[0]) -> Self:
         """
         function is any map from R^3 to R
@@ -2,8 +2,6 @@ from __future__ import annotations
 
 import moderngl
 import numpy as np
-import trimesh
-import pywavefront
 import logging
 from pathlib import Path
 
@@ -26,6 +24,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from typing import Callable, Iterable, Sequence, Tuple
+    import trimesh
 
     from manimlib.camera.camera import Camera
     from manimlib.typing import ManimColor, Vect3, Vect3Array, Self
@@ -442,6 +441,7 @@ class ThreeDModel(Group):
             default_texture = get_full_raster_image_path("White.png")
 
         texture_files = self.get_textures_from_mtl(obj_file)
+        import trimesh
         mesh = trimesh.load(obj_file)
 
         if isinstance(mesh, trimesh.Scene):
@@ -470,6 +470,7 @@ class ThreeDModel(Group):
             logging.getLogger('pywavefront').setLevel(logging.ERROR)
 
         # Load the OBJ file (automatically loads MTL)
+        import pywavefront
         obj_scene = pywavefront.Wavefront(obj_filepath, collect_faces=True)
 
         textures = {}
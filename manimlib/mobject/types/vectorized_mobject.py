@@ -35,6 +35,7 @@ from manimlib.utils.iterables import resize_preserving_order
 from manimlib.utils.space_ops import angle_between_vectors
 from manimlib.utils.space_ops import cross2d
 from manimlib.utils.space_ops import earclip_triangulation
+from manimlib.utils.space_ops import get_distances_to_segment
 from manimlib.utils.space_ops import get_norm
 from manimlib.utils.space_ops import get_unit_normal
 from manimlib.utils.space_ops import line_intersects_path
@@ -49,6 +50,12 @@ from typing import TYPE_CHECKING
 from typing import Generic, TypeVar, Iterable
 SubVmobjectType = TypeVar('SubVmobjectType', bound='VMobject')
 
+# Levels of detail run from 0 up to this, with level L simplifying curves
+# to within 2**-L times the size of the mobject, see VMobject.set_lod_level
+MAX_LOD_LEVEL = 10
+# Paths with fewer curves than this are always drawn in full
+MIN_CURVES_FOR_LOD = 8
+
 if TYPE_CHECKING:
     from typing import Callable, Tuple, Any, Optional
     from manimlib.typing import ManimColor, Vect3, Vect4, Vect3Array, Self
@@ -116,7 +123,14 @@ class VMobject(Mobject):
         self.needs_new_unit_normal = True
         self.subpath_end_indices = None
         self.outer_vert_indices = np.zeros(0, dtype=int)
-        
+
+        # Level of detail, and simplified shader data for each level, along with
+        # the data and its version from which those were computed
+        self.lod_level: Optional[int] = None
+        self.lod_cache: dict[int, np.ndarray] = dict()
+        self.lod_source: Optional[tuple[np.ndarray, int]] = None
+        self.lod_last_seen: Optional[tuple[np.ndarray, int]] = None
+
         self.shader_program_type = None
 
         super().__init__(**kwargs)
@@ -477,7 +491,7 @@ class VMobject(Mobject):
             self.clear_points()
             return self
         assert len(anchors) == len(handles) + 1
-        points = resize_array(self.get_points(), 2 * len(anchors) - 1)
+        points = resize_array(self.get_writable_points(), 2 * len(anchors) - 1)
         points[0::2] = anchors
         points[1::2] = handles
         self.set_points(points)
@@ -934,6 +948,7 @@ class VMobject(Mobject):
         else:
             p = self.get_points()
             normal = get_unit_normal(p[1] - p[0], p[2] - p[1])
+        self.unshare_data()
         self.data["base_normal"][1::2] = normal
         self.needs_new_unit_normal = False
         return normal
@@ -1050,6 +1065,7 @@ class VMobject(Mobject):
     def pointwise_become_partial(self, vmobject: VMobject, a: float, b: float) -> Self:
         assert isinstance(vmobject, VMobject)
         vm_points = vmobject.get_points()
+        self.unshare_data()
         self.data["joint_angle"] = vmobject.data["joint_angle"]
         if a <= 0 and b >= 1:
             self.set_points(vm_points, refresh=False)
@@ -1174,13 +1190,22 @@ class VMobject(Mobject):
 
         self.needs_new_joint_angles = False
         self._data_has_changed = True
+        self._data_version += 1
 
-        # Rotate points such that positive z direction is the normal
-        points = self.get_points() @ rotation_between_vectors(OUT, self.get_unit_normal())
-
-        if len(points) < 3:
+        if self.get_num_points() < 3:
             return self.data["joint_angle"][:, 0]
 
+        angle_diffs = self.get_joint_angles_from_points(
+            self.get_points(), self.get_subpath_end_indices()
+        )
+        self.unshare_data()
+        self.data["joint_angle"][:, 0] = angle_diffs
+        return self.data["joint_angle"][:, 0]
+
+    def get_joint_angles_from_points(self, points: Vect3Array, end_indices: np.ndarray) -> np.ndarray:
+        # Rotate points such that positive z direction is the normal
+        points = points @ rotation_between_vectors(OUT, self.get_unit_normal())
+
         # Find all the unit tangent vectors at each joint
         a0, h, a1 = points[0:-1:2], points[1::2], points[2::2]
         a0_to_h = h - a0
@@ -1197,7 +1222,7 @@ class VMobject(Mobject):
         v_out[1::2] = h_to_a1
 
         # Joint up closed loops, or mark unclosed paths as such
-        ends = self.get_subpath_end_indices()
+        ends = end_indices
         starts = [0, *(e + 2 for e in ends[:-1])]
         for start, end in zip(starts, ends):
             if start == end:
@@ -1215,8 +1240,7 @@ class VMobject(Mobject):
         angle_diffs = angles_out - angles_in
         angle_diffs[angle_diffs < -PI] += TAU
         angle_diffs[angle_diffs > PI] -= TAU
-        self.data["joint_angle"][:, 0] = angle_diffs
-        return self.data["joint_angle"][:, 0]
+        return angle_diffs
 
     def lock_matching_data(self, vmobject1: VMobject, vmobject2: VMobject) -> Self:
         for mob in [self, vmobject1, vmobject2]:
@@ -1252,6 +1276,7 @@ class VMobject(Mobject):
             if not mob.has_points():
                 continue
             inner_ends = mob.get_subpath_end_indices()[:-1]
+            mob.unshare_data()
             mob.data["point"][inner_ends + 1] = mob.data["point"][inner_ends + 2]
             mob.data["base_normal"][1::2] *= -1  # Invert normal vector
             self.subpath_end_indices = None
@@ -1328,12 +1353,131 @@ class VMobject(Mobject):
     def get_shader_data(self) -> np.ndarray:
         # Do we want this elsewhere? Say whenever points are refreshed or something?
         self.get_joint_angles()
-        self.data["base_normal"][0::2] = self.data["point"][0]
+        start_point = self.data["point"][0]
+        # Avoid writing, and so unsharing data, when nothing would change
+        if not (self.data["base_normal"][0::2] == start_point).all():
+            self.unshare_data()
+            self.data["base_normal"][0::2] = start_point
+        if self.lod_level is not None and self.lod_source_is_current():
+            return self.get_lod_shader_data(self.lod_level)
         return super().get_shader_data()
 
     def get_shader_vert_indices(self) -> Optional[np.ndarray]:
         return self.get_outer_vert_indices()
 
+    # Level of detail
+
+    def set_lod_level(self, level: Optional[int]) -> Self:
+        """
+        With a level of detail L, between 0 and MAX_LOD_LEVEL, the shader data
+        has runs of curves which lie within 2**-L times the mobject's size of a
+        straight line merged into that line, see get_lod_shader_data.  With None,
+        all curves are drawn.  The camera chooses a level for each VMobject it
+        draws based on how large it appears, so that those covering only a few
+        pixels send few vertices to the gpu.  Paths with fewer than
+        MIN_CURVES_FOR_LOD curves, e.g. single lines, are always drawn in full.
+
+        Simplified data is cached for each level until the data changes.  Since
+        it isn't worth simplifying data which changes every frame, as during an
+        animation, a level is only taken up once the data has stayed the same
+        between two calls.
+        """
+        if self.get_num_curves() < MIN_CURVES_FOR_LOD:
+            level = None
+        if level is not None and not self.lod_source_is_current():
+            current = (self.data, self._data_version)
+            last_seen = self.lod_last_seen
+            if last_seen is not None and last_seen[0] is current[0] and last_seen[1] == current[1]:
+                # Replaced rather than cleared, as copies may share the dict
+                self.lod_cache = dict()
+                self.lod_source = current
+            else:
+                self.lod_last_seen = current
+                level = None
+        if level != self.lod_level:
+            self.lod_level = level
+            # Have this, and whatever it's drawn as part of, read in again
+            for mob in [self, *self.get_ancestors()]:
+                mob._data_has_changed = True
+        return self
+
+    def lod_source_is_current(self) -> bool:
+        source = self.lod_source
+        return source is not None and source[0] is self.data and source[1] == self._data_version
+
+    def get_shader_data_version(self) -> Any:
+        return (self._data_version, self.lod_level)
+
+    def get_lod_shader_data(self, level: int) -> np.ndarray:
+        if level not in self.lod_cache:
+            self.lod_cache[level] = self.compute_lod_shader_data(level)
+        return self.lod_cache[level]
+
+    def compute_lod_shader_data(self, level: int) -> np.ndarray:
+        """
+        Shader data in which each run of curves within a subpath whose control
+        points all lie within a tolerance of the line between the run's ends, as
+        found by Douglas-Peucker simplification over the anchors, is replaced
+        by that line.  Ends of subpaths are kept, so closed paths stay closed
+        and fill as before.
+        """
+        points = self.get_points()
+        tolerance = get_norm(points.max(0) - points.min(0)) * 2.0**(-level)
+
+        # Each curve is a triple of rows of data, with None for the
+        # handle of a line between the first and last rows
+        triples = []
+        ends = self.get_subpath_end_indices()
+        starts = [0, *(ends[:-1] + 2)]
+        for n, (start, end) in enumerate(zip(starts, ends)):
+            if n > 0:
+                # Null curve joining the previous subpath to this one
+                triples.append((start - 2, start - 1, start))
+            stack = [(start, end)]
+            while stack:
+                i, j = stack.pop()
+                if j - i == 2:
+                    triples.append((i, i + 1, j))
+                    continue
+                a, b = points[i], points[j]
+                inner = points[i + 1:j]
+                dists = get_distances_to_segment(inner, a, b)
+                if dists.max() <= tolerance:
+                    triples.append((i, None, j))
+                    continue
+                # Split at the furthest anchor, or the middle one if only
+                # handles lie beyond the tolerance
+                anchor_dists = dists[1::2]
+                k = i + 2 + 2 * int(np.argmax(anchor_dists))
+                if anchor_dists.max() <= tolerance:
+                    k = i + 2 * ((j - i) // 4)
+                # Pushed in reverse, so that curves are added in order
+                stack.append((k, j))
+                stack.append((i, k))
+
+        n_curves = len(triples)
+        is_line = np.array([h is None for i, h, j in triples])
+        rows = np.array([
+            (i, i + 1 if h is None else h, j)
+            for i, h, j in triples
+        ])
+        result = self.data[rows.flatten()]
+        line_rows = rows[is_line]
+        result["point"][3 * np.flatnonzero(is_line) + 1] = 0.5 * (
+            points[line_rows[:, 0]] + points[line_rows[:, 2]]
+        )
+
+        # Joint angles change where lines meet what remains, so are found
+        # again from the points as laid out in a VMobject, with shared anchors
+        chain_rows = np.hstack([[0], (3 * np.arange(n_curves)[:, np.newaxis] + [1, 2]).flatten()])
+        chain = result["point"][chain_rows]
+        chain_angles = self.get_joint_angles_from_points(
+            chain, self.get_subpath_end_indices_from_points(chain)
+        )
+        # As in get_outer_vert_indices
+        result["joint_angle"][:, 0] = chain_angles[(np.arange(1, 3 * n_curves + 1) * 2) // 3]
+        return result
+
 
 class VGroup(Group, VMobject, Generic[SubVmobjectType]):
     def __init__(self, *vmobjects: SubVmobjectType | Iterable[SubVmobjectType], **kwargs):
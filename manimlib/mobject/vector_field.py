@@ -3,7 +3,6 @@ from __future__ import annotations
 import itertools as it
 
 import numpy as np
-from scipy.integrate import solve_ivp
 
 from manimlib.constants import FRAME_HEIGHT, FRAME_WIDTH
 from manimlib.constants import DEFAULT_MOBJECT_COLOR
@@ -65,6 +64,8 @@ def get_rgb_gradient_function(
 
 
 def ode_solution_points(function, state0, time, dt=0.01):
+    # Imported here since scipy.integrate is slow to import
+    from scipy.integrate import solve_ivp
     solution = solve_ivp(
         lambda t, state: function(state),
         t_span=(0, time),
@@ -248,6 +249,7 @@ class VectorField(VMobject):
 
     def set_stroke_width(self, width: float):
         if self.get_num_points() > 0:
+            self.unshare_data()
             self.get_stroke_widths()[:] = width * self.base_stroke_width_array
             self.stroke_width = width
         return self
@@ -281,7 +283,7 @@ class VectorField(VMobject):
         dist_to_head_base = np.clip(drawn_norms - tip_len, 0, np.inf)  # Mixing units!
 
         # Set all points
-        points = self.get_points()
+        points = self.get_writable_points()
         points[0::8] = self.sample_points
         points[2::8] = self.sample_points + dist_to_head_base * unit_outputs
         points[4::8] = points[2::8]
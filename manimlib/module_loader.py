@@ -9,6 +9,11 @@ import sysconfig
 from manimlib.config import manim_config
 from manimlib.logger import log
 
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Iterable
+
 Module = importlib.util.types.ModuleType
 
 
@@ -135,6 +140,39 @@ class ModuleLoader:
 
         return True
 
+    @staticmethod
+    def get_user_module_files(namespace: dict) -> set[str]:
+        """
+        Returns the paths of the user-defined modules, see `is_user_defined_module()`,
+        which are imported, directly or indirectly, into the given namespace, e.g.
+        the __dict__ of a module or the __globals__ of a function.  These are the
+        modules which would be reloaded along with it, so manimlib's own modules
+        are left out unless `ignore_manimlib_modules_on_reload` is off.
+        """
+        ignore_manimlib_modules = manim_config.ignore_manimlib_modules_on_reload
+        visited: set[str] = set()
+        files: set[str] = set()
+
+        def visit_namespace(values: Iterable):
+            for value in values:
+                if isinstance(value, Module):
+                    visit(value.__name__)
+                elif isinstance(getattr(value, "__module__", None), str):
+                    visit(value.__module__)
+
+        def visit(mod_name: str):
+            if mod_name in visited or not ModuleLoader._is_user_defined_module(mod_name):
+                return
+            visited.add(mod_name)
+            if ignore_manimlib_modules and mod_name.startswith("manimlib"):
+                return
+            mod = sys.modules[mod_name]
+            files.add(os.path.abspath(mod.__file__))
+            visit_namespace(list(mod.__dict__.values()))
+
+        visit_namespace(list(namespace.values()))
+        return files
+
     @staticmethod
     def _deep_reload(module: Module, reloaded_modules_tracker: set[str]):
         """
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import copy
+import multiprocessing as mp
+import shutil
+import subprocess as sp
+from pathlib import Path
+
+from addict import Dict
+
+from manimlib.config import manim_config
+from manimlib.logger import log
+from manimlib.module_loader import ModuleLoader
+from manimlib.utils.file_ops import guarantee_existence
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from manimlib.scene.scene import Scene
+
+
+def render_segment(
+    file_name: str,
+    scene_name: str,
+    scene_config: Dict,
+    start: int,
+    end: int | None,
+) -> str:
+    """
+    Runs in a worker process.  The scene's module is loaded afresh, and the
+    scene fast-forwards in skip mode through every play before `start`, then
+    writes plays start through end - 1 to their own movie file.  Each process
+    creates its own standalone moderngl context.
+    """
+    module = ModuleLoader.get_module(file_name)
+    scene_class = getattr(module, scene_name)
+    config = copy.deepcopy(scene_config)
+    config["start_at_animation_number"] = start
+    config["end_at_animation_number"] = end
+    scene = scene_class(**config)
+    scene.run()
+    return str(scene.file_writer.get_movie_file_path())
+
+
+class ParallelSceneRenderer(object):
+    """
+    Renders a single scene across several processes by splitting its
+    plays into contiguous ranges of animation numbers, then concatenates
+    the resulting segments losslessly with ffmpeg's concat demuxer.
+
+    Note, sounds are still added based on scene time within each segment,
+    in the same way as when rendering with -n.
+    """
+    def __init__(
+        self,
+        scene_class: type[Scene],
+        scene_config: Dict,
+        run_config: Dict,
+        num_plays: int,
+    ):
+        self.scene_class = scene_class
+        self.scene_config = scene_config
+        self.run_config = run_config
+        self.num_plays = num_plays
+        self.n_workers = run_config.workers
+
+        self.file_writer_config = Dict(manim_config.file_writer)
+        self.file_writer_config.update(scene_config.file_writer_config)
+
+    def __str__(self) -> str:
+        return self.scene_class.__name__
+
+    def get_play_ranges(self) -> list[tuple[int, int | None]]:
+        start = self.scene_config.start_at_animation_number or 0
+        end = self.scene_config.end_at_animation_number or self.num_plays
+        n_ranges = max(min(self.n_workers, end - start), 1)
+        bounds = [start + (k * (end - start)) // n_ranges for k in range(n_ranges + 1)]
+        ranges = list(zip(bounds[:-1], bounds[1:]))
+        # Let the final segment run to the end of the scene, unless the
+        # user explicitly asked for an end point
+        if self.scene_config.end_at_animation_number is None:
+            ranges[-1] = (ranges[-1][0], None)
+        return ranges
+
+    def get_output_file_path(self) -> Path:
+        name = self.file_writer_config.file_name
+        if not name:
+            name = str(self)
+            for number in (self.scene_config.start_at_animation_number, self.scene_config.end_at_animation_number):
+                if number is not None:
+                    name += f"_{number}"
+        root = Path(guarantee_existence(self.file_writer_config.output_directory), name)
+        return root.with_suffix(self.file_writer_config.movie_file_extension)
+
+    def get_segment_directory(self) -> Path:
+        output_path = self.get_output_file_path()
+        return guarantee_existence(Path(output_path.parent, output_path.stem + "_segments"))
+
+    def get_segment_config(self) -> Dict:
+        config = copy.deepcopy(self.scene_config)
+        # Each segment fast-forwards through construct in skip mode, exactly
+        # as with -n, rather than resuming from a snapshot, whose restored
+        # mobjects can disagree with construct's local variables
+        config.snapshot_interval = 0
+        config.file_writer_config.update(
+            output_directory=str(self.get_segment_directory()),
+            file_name=None,
+            subdivide_output=False,
+            total_frames=0,
+            quiet=True,
+            open_file_upon_completion=False,
+            show_file_location_upon_completion=False,
+        )
+        return config
+
+    def run(self) -> None:
+        ranges = self.get_play_ranges()
+        segment_config = self.get_segment_config()
+        log.info(f"Rendering {self} across {len(ranges)} processes")
+
+        # Spawn, rather than fork, so that each worker gets a clean GL state
+        context = mp.get_context("spawn")
+        with context.Pool(len(ranges)) as pool:
+            segment_paths = pool.starmap(render_segment, [
+                (self.run_config.file_name, str(self), segment_config, start, end)
+                for start, end in ranges
+            ])
+        self.concatenate_segments(segment_paths)
+
+    def concatenate_segments(self, segment_paths: list[str]) -> None:
+        """
+        Joins the segments into the output file, then removes the segment
+        directory.  If ffmpeg fails, the segments are left in place and
+        CalledProcessError is raised.
+        """
+        output_path = self.get_output_file_path()
+        segment_directory = self.get_segment_directory()
+        list_path = Path(segment_directory, "segments.txt")
+        with open(list_path, "w") as fp:
+            for path in segment_paths:
+                fp.write(f"file '{Path(path).absolute()}'\n")
+        sp.run([
+            self.file_writer_config.ffmpeg_bin,
+            '-y',  # overwrite output file if it exists
+            '-f', 'concat',
+            '-safe', '0',
+            '-i', str(list_path),
+            '-c', 'copy',
+            '-loglevel', 'error',
+            str(output_path),
+        ], check=True)
+        shutil.rmtree(segment_directory)
+        if not self.file_writer_config.quiet:
+            log.info(f"File ready at {output_path}")
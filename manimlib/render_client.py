@@ -0,0 +1,76 @@
+"""
+Client for the render server started with `manimgl --serve`.
+
+This only uses the standard library, so that submitting a job by running this
+file directly, e.g. `python path/to/manimlib/render_client.py scene.py MyScene -w`,
+imports neither manimlib nor any of its dependencies.  The socket can then be
+given by the MANIMGL_SOCKET environment variable.
+"""
+from __future__ import annotations
+
+import getpass
+import json
+import os
+import socket
+import sys
+import tempfile
+
+# Note, typing is not imported at runtime, since running this file directly
+# puts manimlib's own typing module first on the path
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from typing import Iterator
+
+
+def get_default_socket_path() -> str:
+    return os.path.join(tempfile.gettempdir(), f"manimgl-{getpass.getuser()}.sock")
+
+
+def submit_job(
+    argv: list[str],
+    socket_path: str | None = None,
+    cwd: str | None = None,
+) -> "Iterator[dict]":
+    """
+    Sends a job, given by the command line arguments manimgl would be run
+    with, and yields each message the server sends back.  These are either
+    output, with the text which the job wrote to stdout or stderr, or done,
+    with whether the job succeeded, the files it wrote, and any error.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path or get_default_socket_path())
+        stream = sock.makefile("rw", encoding="utf-8")
+        stream.write(json.dumps(dict(args=list(argv), cwd=cwd or os.getcwd())) + "\n")
+        stream.flush()
+        for line in stream:
+            yield json.loads(line)
+
+
+def run_job(argv: list[str], socket_path: str | None = None) -> int:
+    """
+    Submits a job, forwarding its output, and printing the paths of the
+    files it writes.  Returns an exit code.
+    """
+    try:
+        for message in submit_job(argv, socket_path):
+            if message["type"] == "output":
+                stream = sys.stdout if message["stream"] == "stdout" else sys.stderr
+                stream.write(message["text"])
+                stream.flush()
+            elif message["type"] == "done":
+                for path in message["files"]:
+                    print(path)
+                if not message["ok"]:
+                    sys.stderr.write(message["error"])
+                    return 1
+                return 0
+    except (FileNotFoundError, ConnectionRefusedError):
+        sys.stderr.write("No render server is running, start one with `manimgl --serve`\n")
+        return 1
+    sys.stderr.write("The render server closed the connection before the job finished\n")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_job(sys.argv[1:], os.environ.get("MANIMGL_SOCKET")))
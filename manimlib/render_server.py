@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import socket
+import traceback
+
+from addict import Dict
+
+from manimlib.config import initialize_manim_config
+from manimlib.config import manim_config
+from manimlib.config import parse_cli
+import manimlib.extract_scene
+from manimlib.logger import log
+from manimlib.parallel_render import ParallelSceneRenderer
+from manimlib.render_client import get_default_socket_path
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Callable, Optional
+    from manimlib.scene.scene import Scene
+
+
+class JobOutputStream(io.TextIOBase):
+    """
+    Stands in for stdout or stderr while a job runs, sending
+    whatever is written to the client which submitted the job
+    """
+    def __init__(self, send: Callable[..., None], name: str):
+        self.send = send
+        self.name = name
+
+    def write(self, text: str) -> int:
+        if text:
+            self.send(type="output", stream=self.name, text=text)
+        return len(text)
+
+    def isatty(self) -> bool:
+        return False
+
+
+class RenderServer(object):
+    """
+    Renders jobs submitted over a unix domain socket, one at a time, within
+    one long running process.  Python's startup, the imports of manimlib and
+    its dependencies, the standalone gl context, compiled shader programs,
+    and caches such as SVG_HASH_TO_MOB_MAP and PATH_TO_POINTS then carry over
+    from one job to the next.
+
+    Each job is given by the command line arguments manimgl would be run
+    with, and its working directory.  Jobs must write to file, since there is
+    no window.  The modules a scene file imports from its own project are
+    reloaded for each job, so edits to them are picked up, while manimlib's
+    own modules are not.
+    """
+    def __init__(self, socket_path: Optional[str] = None):
+        self.socket_path = socket_path or get_default_socket_path()
+
+    def serve_forever(self) -> None:
+        if os.path.exists(self.socket_path):
+            # Left over from a server which did not shut down cleanly
+            os.remove(self.socket_path)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+            server.bind(self.socket_path)
+            server.listen()
+            log.info(f"Listening for render jobs on {self.socket_path}")
+            try:
+                while True:
+                    connection, _ = server.accept()
+                    with connection:
+                        self.handle_connection(connection)
+            except KeyboardInterrupt:
+                pass
+            finally:
+                os.remove(self.socket_path)
+
+    def handle_connection(self, connection: socket.socket) -> None:
+        stream = connection.makefile("rw", encoding="utf-8")
+
+        def send(**message):
+            stream.write(json.dumps(message) + "\n")
+            stream.flush()
+
+        request = json.loads(stream.readline() or "null")
+        if request is None:
+            return
+        log.info(f"Job: manimgl {' '.join(request['args'])}")
+        files = []
+        cwd = os.getcwd()
+        try:
+            with contextlib.ExitStack() as stack:
+                stack.enter_context(contextlib.redirect_stdout(JobOutputStream(send, "stdout")))
+                stack.enter_context(contextlib.redirect_stderr(JobOutputStream(send, "stderr")))
+                # Nothing can be typed in, e.g. to choose between scenes
+                stack.enter_context(contextlib.redirect_stdin(io.StringIO()))
+                files = self.run_job(request["args"], request["cwd"])
+        except KeyboardInterrupt:
+            raise
+        except BrokenPipeError:
+            log.warning("Client disconnected before the job finished")
+            return
+        except BaseException:
+            # Including SystemExit, e.g. from bad arguments
+            send(type="done", ok=False, files=files, error=traceback.format_exc())
+            return
+        finally:
+            os.chdir(cwd)
+        send(type="done", ok=True, files=files, error=None)
+
+    def run_job(self, argv: list[str], cwd: str) -> list[str]:
+        os.chdir(cwd)
+        config = initialize_manim_config(parse_cli(argv))
+        if config.run.show_in_window:
+            raise ValueError("Render jobs have no window, so must write to file, e.g. with -w")
+        # Other modules hold references to the global configuration,
+        # so it is updated in place
+        manim_config.clear()
+        manim_config.update(config)
+        manim_config.run.is_reload = True
+
+        files = []
+        scenes = manimlib.extract_scene.main(Dict(manim_config.scene), manim_config.run)
+        for scene in scenes:
+            scene.run()
+            files.extend(get_output_files(scene))
+            if not isinstance(scene, ParallelSceneRenderer):
+                release_scene(scene)
+        return files
+
+
+def get_output_files(scene: Scene | ParallelSceneRenderer) -> list[str]:
+    if isinstance(scene, ParallelSceneRenderer):
+        return [str(scene.get_output_file_path())]
+    file_writer = scene.file_writer
+    files = []
+    if file_writer.write_to_movie:
+        files.append(str(file_writer.get_movie_file_path()))
+    if file_writer.save_last_frame:
+        files.append(str(file_writer.get_image_file_path()))
+    return files
+
+
+def release_scene(scene: Scene) -> None:
+    # The gl context outlives the scene, so the gpu objects of the camera
+    # and of the mobjects it ended with are released explicitly
+    for mob in scene.get_mobject_family_members():
+        if mob.shader_wrapper is not None:
+            mob.shader_wrapper.release()
+    scene.camera.release()
@@ -3,7 +3,6 @@ from __future__ import annotations
 import itertools as it
 import numpy as np
 import pyperclip
-from IPython.core.getipython import get_ipython
 from pyglet.window import key as PygletWindowKeys
 
 from manimlib.animation.fading import FadeIn
@@ -358,6 +357,7 @@ class InteractiveScene(Scene):
     # Functions for keyboard actions
 
     def copy_selection(self):
+        from IPython.core.getipython import get_ipython
         names = []
         shell = get_ipython()
         for mob in self.selection:
@@ -413,12 +413,14 @@ class InteractiveScene(Scene):
         self.is_selecting = False
         if self.selection_rectangle in self.mobjects:
             self.remove(self.selection_rectangle)
-            additions = []
-            for mob in reversed(self.get_selection_search_set()):
-                if self.selection_rectangle.is_touching(mob):
-                    additions.append(mob)
-                    if self.selection_rectangle.get_arc_length() < 1e-2:
-                        break
+            index = self.get_spatial_index(self.get_selection_search_set())
+            additions = index.get_mobjects_in_box(
+                self.selection_rectangle.get_bounding_box(),
+                buff=1e-2,  # As with Mobject.is_touching
+            )[::-1]
+            if self.selection_rectangle.get_arc_length() < 1e-2:
+                # Just a click, so only the top mobject
+                additions = additions[:1]
             self.toggle_from_selection(*additions)
 
     def prepare_grab(self):
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import subprocess as sp
+from fractions import Fraction
+
+import numpy as np
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Type
+
+
+class MovieEncoder(object):
+    """
+    Takes raw frames, as read from the camera, and encodes them to a movie
+    file.  Frames in the "rgba" input format have their bottom row first,
+    while "yuv420p" frames are planar and already flipped on the GPU.
+    """
+    def __init__(
+        self,
+        file_path: str,
+        width: int,
+        height: int,
+        fps: int,
+        video_codec: str = "libx264",
+        pixel_format: str = "yuv420p",
+        saturation: float = 1.0,
+        gamma: float = 1.0,
+        ffmpeg_bin: str = "ffmpeg",
+        input_pixel_format: str = "rgba",
+    ):
+        self.file_path = file_path
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.video_codec = video_codec
+        self.pixel_format = pixel_format
+        self.saturation = saturation
+        self.gamma = gamma
+        self.ffmpeg_bin = ffmpeg_bin
+        self.input_pixel_format = input_pixel_format
+
+    def get_filters(self) -> list[str]:
+        filters = []
+        if self.input_pixel_format == "rgba":
+            filters.append("vflip")
+        if self.saturation != 1.0 or self.gamma != 1.0:
+            filters.append(f"eq=saturation={self.saturation}:gamma={self.gamma}")
+        return filters
+
+    def write(self, raw_bytes: bytes) -> None:
+        raise NotImplementedError()
+
+    def close(self) -> None:
+        raise NotImplementedError()
+
+
+class FFmpegPipeEncoder(MovieEncoder):
+    """
+    Streams frames through a pipe to an ffmpeg subprocess
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        command = [
+            self.ffmpeg_bin,
+            '-y',  # overwrite output file if it exists
+            '-f', 'rawvideo',
+            '-s', f'{self.width}x{self.height}',  # size of one frame
+            '-pix_fmt', self.input_pixel_format,
+            '-r', str(self.fps),  # frames per second
+            '-i', '-',  # The input comes from a pipe
+            '-an',  # Tells ffmpeg not to expect any audio
+            '-loglevel', 'error',
+        ]
+        filters = self.get_filters()
+        if filters:
+            command += ['-vf', ",".join(filters)]
+        if self.video_codec:
+            command += ['-vcodec', self.video_codec]
+        if self.pixel_format:
+            command += ['-pix_fmt', self.pixel_format]
+        command += [self.file_path]
+        self.writing_process = sp.Popen(command, stdin=sp.PIPE)
+
+    def write(self, raw_bytes: bytes) -> None:
+        self.writing_process.stdin.write(raw_bytes)
+
+    def close(self) -> None:
+        self.writing_process.stdin.close()
+        self.writing_process.wait()
+        self.writing_process.terminate()
+
+
+class PyAVEncoder(MovieEncoder):
+    """
+    Encodes frames in-process with libav, via PyAV, so that frames need
+    not be copied through a pipe into another process.  The flip, color
+    adjustment and conversion to the output pixel format happen in a
+    libav filter graph.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        try:
+            import av
+        except ImportError:
+            raise ImportError("The pyav encoder requires PyAV, which can be installed with `pip install av`")
+        self.av = av
+        self.container = av.open(self.file_path, mode="w")
+        self.stream = self.container.add_stream(
+            self.video_codec or self.container.default_video_codec,
+            rate=self.fps,
+        )
+        self.stream.width = self.width
+        self.stream.height = self.height
+        if self.pixel_format:
+            self.stream.pix_fmt = self.pixel_format
+        self.init_filter_graph()
+        self.frame_index = 0
+
+    def init_filter_graph(self) -> None:
+        self.graph = self.av.filter.Graph()
+        nodes = [
+            self.graph.add_buffer(
+                width=self.width,
+                height=self.height,
+                format=self.input_pixel_format,
+                time_base=Fraction(1, self.fps),
+            ),
+            *(
+                self.graph.add(*part.split("=", 1))
+                for part in self.get_filters()
+            ),
+            self.graph.add("format", self.stream.pix_fmt),
+            self.graph.add("buffersink"),
+        ]
+        for node1, node2 in zip(nodes, nodes[1:]):
+            node1.link_to(node2)
+        self.graph.configure()
+
+    def write(self, raw_bytes: bytes) -> None:
+        array = np.frombuffer(raw_bytes, dtype=np.uint8)
+        if self.input_pixel_format == "yuv420p":
+            # Planes stacked vertically, as PyAV expects
+            array = array.reshape(3 * self.height // 2, self.width)
+        else:
+            array = array.reshape(self.height, self.width, 4)
+        frame = self.av.VideoFrame.from_ndarray(array, format=self.input_pixel_format)
+        frame.pts = self.frame_index
+        frame.time_base = Fraction(1, self.fps)
+        self.frame_index += 1
+        self.graph.push(frame)
+        self.mux(self.graph.pull())
+
+    def mux(self, frame) -> None:
+        for packet in self.stream.encode(frame):
+            self.container.mux(packet)
+
+    def close(self) -> None:
+        # Flush the encoder
+        self.mux(None)
+        self.container.close()
+
+
+ENCODERS: dict[str, Type[MovieEncoder]] = {
+    "ffmpeg": FFmpegPipeEncoder,
+    "pyav": PyAVEncoder,
+}
+
+
+def get_encoder_class(name: str) -> Type[MovieEncoder]:
+    if name not in ENCODERS:
+        raise ValueError(f"Unknown encoder {name}, must be one of {', '.join(ENCODERS)}")
+    return ENCODERS[name]
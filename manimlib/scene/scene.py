@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-from collections import OrderedDict
 import platform
 import random
 import time
 from functools import wraps
 from contextlib import contextmanager
 from contextlib import ExitStack
+from weakref import WeakValueDictionary
 
 import numpy as np
 from tqdm.auto import tqdm as ProgressDisplay
@@ -28,13 +28,18 @@ from manimlib.mobject.types.vectorized_mobject import VMobject
 from manimlib.scene.scene_embed import InteractiveSceneEmbed
 from manimlib.scene.scene_embed import CheckpointManager
 from manimlib.scene.scene_file_writer import SceneFileWriter
+from manimlib.scene.scene_snapshots import SceneSnapshotter
+from manimlib.scene.scene_snapshots import SnapshotMismatch
 from manimlib.utils.dict_ops import merge_dicts_recursively
 from manimlib.utils.family_ops import extract_mobject_family_members
 from manimlib.utils.family_ops import recursive_mobject_remove
+from manimlib.utils.hashing import hash_array
+from manimlib.utils.hashing import hash_objects
 from manimlib.utils.iterables import batch_by_property
+from manimlib.utils.profiler import PROFILER
 from manimlib.utils.sounds import play_sound
+from manimlib.utils.spatial_index import SpatialIndex
 from manimlib.utils.color import color_to_rgba
-from manimlib.window import Window
 
 from typing import TYPE_CHECKING
 
@@ -47,6 +52,7 @@ if TYPE_CHECKING:
     from PIL.Image import Image
 
     from manimlib.animation.animation import Animation
+    from manimlib.window import Window
 
 
 class Scene(object):
@@ -54,7 +60,6 @@ class Scene(object):
     pan_sensitivity: float = 0.5
     scroll_sensitivity: float = 20
     drag_to_pan: bool = True
-    max_num_saved_states: int = 50
     default_camera_config: dict = dict()
     default_file_writer_config: dict = dict()
     samples = 0
@@ -75,6 +80,19 @@ class Scene(object):
         preview_while_skipping: bool = True,
         presenter_mode: bool = False,
         default_wait_time: float = 1.0,
+        # If true, plays and waits only advance the clock by their run times,
+        # without beginning, interpolating or updating anything.  This is used
+        # for a cheap pre-run which counts the frames a scene will require.
+        timeline_only: bool = False,
+        # Every how many plays to save the scene's state to disk, so that
+        # later runs with start_at_animation_number can begin from there.
+        # Zero turns this off.
+        snapshot_interval: int = 0,
+        # Limits on the undo history, beyond which the oldest saved states
+        # are dropped.  Only data arrays which no mobject in the scene still
+        # shares count towards the number of bytes.
+        max_num_saved_states: int = 50,
+        max_saved_state_bytes: int = 256 * 1024 * 1024,
     ):
         self.skip_animations = skip_animations
         self.always_update_mobjects = always_update_mobjects
@@ -85,6 +103,9 @@ class Scene(object):
         self.preview_while_skipping = preview_while_skipping
         self.presenter_mode = presenter_mode
         self.default_wait_time = default_wait_time
+        self.timeline_only = timeline_only
+        self.max_num_saved_states = max_num_saved_states
+        self.max_saved_state_bytes = max_saved_state_bytes
 
         self.camera_config = merge_dicts_recursively(
             manim_config.camera,         # Global default
@@ -117,12 +138,19 @@ class Scene(object):
         self.mobjects: list[Mobject] = [self.camera.frame]
         self.render_groups: list[Mobject] = []
         self.id_to_mobject_map: dict[int, Mobject] = dict()
+        self.spatial_index: SpatialIndex | None = None
         self.num_plays: int = 0
         self.time: float = 0
         self.skip_time: float = 0
         self.original_skipping_status: bool = self.skip_animations
+        self.skipping_cached_play: bool = False
         self.undo_stack = []
         self.redo_stack = []
+        # Number of states in the undo stack holding each data array, by hash
+        self.undo_data_counts: dict[str, int] = dict()
+        # Data arrays held by saved states, by content hash, see SceneState
+        self.saved_arrays: WeakValueDictionary[str, np.ndarray] = WeakValueDictionary()
+        self.snapshots = SceneSnapshotter(self, snapshot_interval)
 
         if self.start_at_animation_number is not None:
             self.skip_animations = True
@@ -132,9 +160,16 @@ class Scene(object):
         # Items associated with interaction
         self.mouse_point = Point()
         self.mouse_drag_point = Point()
+        if self.window and self.camera.mouse_picking:
+            EVENT_DISPATCHER.set_picker(self.camera.pick_mobject)
+        else:
+            EVENT_DISPATCHER.set_picker(None)
         self.hold_on_wait = self.presenter_mode
         self.quit_interaction = False
 
+        self.seed_random_number_generators()
+
+    def seed_random_number_generators(self) -> None:
         # Much nicer to work with deterministic scenes
         if self.random_seed is not None:
             random.seed(self.random_seed)
@@ -150,10 +185,12 @@ class Scene(object):
         self.virtual_animation_start_time: float = 0
         self.real_animation_start_time: float = time.time()
         self.file_writer.begin()
+        self.initial_frame_state = self.frame.copy()
 
+        self.snapshots.begin()
         self.setup()
         try:
-            self.construct()
+            self.run_construct()
             self.interact()
         except EndScene:
             pass
@@ -163,6 +200,31 @@ class Scene(object):
             self.file_writer.ended_with_interrupt = True
         self.tear_down()
 
+    def run_construct(self) -> None:
+        try:
+            self.construct()
+        except SnapshotMismatch as err:
+            log.warning(f"Could not restore {self} from a snapshot ({err}), starting over")
+            self.start_over()
+            self.setup()
+            self.construct()
+        finally:
+            self.snapshots.end()
+
+    def start_over(self) -> None:
+        """
+        Resets the scene to how it was before setup, for when construct
+        was fast forwarding to a snapshot which did not match
+        """
+        self.snapshots.disable()
+        self.mobjects = [self.frame.become(self.initial_frame_state)]
+        self.assemble_render_groups()
+        self.time = 0
+        self.skip_time = 0
+        self.num_plays = 0
+        self.skip_animations = True
+        self.seed_random_number_generators()
+
     def setup(self) -> None:
         """
         This is meant to be implement by any scenes which
@@ -234,6 +296,9 @@ class Scene(object):
         self.get_image().show()
 
     def update_frame(self, dt: float = 0, force_draw: bool = False) -> None:
+        if self.window:
+            # Mouse events which arrived since the last frame, merged
+            self.window.flush_mouse_events()
         self.increment_time(dt)
         self.update_mobjects(dt)
         if self.skip_animations and not force_draw:
@@ -262,8 +327,9 @@ class Scene(object):
     # Related to updating
 
     def update_mobjects(self, dt: float) -> None:
-        for mobject in self.mobjects:
-            mobject.update(dt)
+        with PROFILER.span("update_mobjects"):
+            for mobject in self.mobjects:
+                mobject.update(dt)
 
     def should_update_mobjects(self) -> bool:
         return self.always_update_mobjects or any(
@@ -321,6 +387,7 @@ class Scene(object):
         def wrapper(self, *args, **kwargs):
             func(self, *args, **kwargs)
             self.assemble_render_groups()
+            self.reset_spatial_index()
             return self
         return wrapper
 
@@ -419,10 +486,30 @@ class Scene(object):
         """
         if search_set is None:
             search_set = self.mobjects
-        for mobject in reversed(search_set):
-            if mobject.is_point_touching(point, buff=buff):
-                return mobject
-        return None
+        if self.window and self.camera.mouse_picking:
+            return self.camera.pick_mobject(point, search_set, buff)
+        return self.get_spatial_index(search_set).get_top_mobject_at_point(point, buff)
+
+    def get_spatial_index(self, search_set: Iterable[Mobject] | None = None) -> SpatialIndex:
+        """
+        Index over the bounding boxes of the mobjects in search_set, by default
+        those of the scene, kept until a different search set is asked for or
+        the scene's list of mobjects changes.
+        """
+        if search_set is None:
+            search_set = self.mobjects
+        elif not isinstance(search_set, list):
+            search_set = list(search_set)
+        index = self.spatial_index
+        if index is None or index.source is not search_set or len(index.mobjects) != len(search_set):
+            self.reset_spatial_index()
+            index = self.spatial_index = SpatialIndex(search_set)
+        return index
+
+    def reset_spatial_index(self) -> None:
+        if self.spatial_index is not None:
+            self.spatial_index.close()
+            self.spatial_index = None
 
     def get_group(self, *mobjects):
         if all(isinstance(m, VMobject) for m in mobjects):
@@ -516,28 +603,74 @@ class Scene(object):
             kw["override_skip_animations"] = True
         return self.get_time_progression(duration, **kw)
 
-    def pre_play(self):
+    def get_partial_movie_key(self, *play_args) -> str | None:
+        """
+        Key identifying the frames a play will produce, based on the state
+        of the scene before it, the camera and file writer configuration,
+        and the arguments defining the play (e.g. its animations).  Returns
+        None when the result can't be safely reused, e.g. if anything
+        has updaters.
+        """
+        if not self.file_writer.is_caching_partial_movies():
+            return None
+        if self.presenter_mode or any(mob.has_updaters() for mob in self.mobjects):
+            return None
+        return hash_objects(
+            self.mobjects,
+            self.camera_config,
+            self.camera.background_rgba,
+            self.file_writer_config,
+            np.random.get_state(),
+            random.getstate(),
+            *play_args,
+        )
+
+    def pre_play(self, *play_args):
         if self.presenter_mode and self.num_plays == 0:
             self.hold_loop()
 
+        self.snapshots.on_play_boundary()
+        # Mobjects made during the play depend on whether it was skipped
+        self.snapshots.pause_logging()
         self.update_skipping_status()
+        if PROFILER.enabled:
+            # Labels can be costly to build, e.g. for animations of many mobjects
+            PROFILER.begin_play(self.num_plays, self.get_play_label(*play_args))
 
         if not self.skip_animations:
-            self.file_writer.begin_animation()
+            key = self.get_partial_movie_key(*play_args) if play_args else None
+            if self.file_writer.has_cached_partial_movie(key):
+                # Reuse the earlier render, and just run through this play in skip mode
+                self.file_writer.use_cached_partial_movie(key)
+                self.skip_animations = True
+                self.skipping_cached_play = True
+            else:
+                self.file_writer.begin_animation(key)
 
         if self.window:
             self.virtual_animation_start_time = self.time
             self.real_animation_start_time = time.time()
 
     def post_play(self):
-        if not self.skip_animations:
+        if self.skipping_cached_play:
+            self.skipping_cached_play = False
+            self.skip_animations = False
+        elif not self.skip_animations:
             self.file_writer.end_animation()
 
-        if self.preview_while_skipping and self.skip_animations and self.window is not None:
+        fast_forwarding = self.snapshots.is_fast_forwarding()
+        if self.preview_while_skipping and self.skip_animations and self.window is not None and not fast_forwarding:
             # Show some quick frames along the way
             self.update_frame(dt=0, force_draw=True)
 
+        PROFILER.end_play()
         self.num_plays += 1
+        self.snapshots.resume_logging()
+
+    def get_play_label(self, *play_args) -> str:
+        if not play_args or play_args[0] == "wait":
+            return "wait"
+        return ", ".join(map(str, play_args[0]))
 
     def begin_animations(self, animations: Iterable[Animation]) -> None:
         all_mobjects = set(self.get_mobject_family_members())
@@ -557,12 +690,14 @@ class Scene(object):
         for t in self.get_animation_time_progression(animations):
             dt = t - last_t
             last_t = t
-            for animation in animations:
-                animation.update_mobjects(dt)
-                alpha = t / animation.run_time
-                animation.interpolate(alpha)
-            self.update_frame(dt)
-            self.emit_frame()
+            with PROFILER.span("frame"):
+                with PROFILER.span("interpolate"):
+                    for animation in animations:
+                        animation.update_mobjects(dt)
+                        alpha = t / animation.run_time
+                        animation.interpolate(alpha)
+                self.update_frame(dt)
+                self.emit_frame()
 
     def finish_animations(self, animations: Iterable[Animation]) -> None:
         for animation in animations:
@@ -587,10 +722,13 @@ class Scene(object):
         animations = list(map(prepare_animation, proto_animations))
         for anim in animations:
             anim.update_rate_info(run_time, rate_func, lag_ratio)
-        self.pre_play()
-        self.begin_animations(animations)
-        self.progress_through_animations(animations)
-        self.finish_animations(animations)
+        self.pre_play(animations)
+        if self.timeline_only or self.snapshots.is_fast_forwarding():
+            self.increment_time(self.get_run_time(animations))
+        else:
+            self.begin_animations(animations)
+            self.progress_through_animations(animations)
+            self.finish_animations(animations)
         self.post_play()
 
     def wait(
@@ -602,7 +740,17 @@ class Scene(object):
     ):
         if duration is None:
             duration = self.default_wait_time
-        self.pre_play()
+        if self.timeline_only and stop_condition is not None:
+            # When this stops depends on the state of the scene, which isn't tracked
+            raise UnknownDuration("Can't time a wait with a stop_condition without running it")
+        if stop_condition is None:
+            self.pre_play("wait", duration)
+        else:
+            self.pre_play()
+        if self.timeline_only or self.snapshots.is_fast_forwarding():
+            self.increment_time(duration)
+            self.post_play()
+            return
         self.update_mobjects(dt=0)  # Any problems with this?
         if self.presenter_mode and not self.skip_animations and not ignore_presenter_mode:
             if note:
@@ -614,8 +762,9 @@ class Scene(object):
             for t in time_progression:
                 dt = t - last_t
                 last_t = t
-                self.update_frame(dt)
-                self.emit_frame()
+                with PROFILER.span("frame"):
+                    self.update_frame(dt)
+                    self.emit_frame()
                 if stop_condition is not None and stop_condition():
                     break
         self.post_play()
@@ -668,18 +817,64 @@ class Scene(object):
         if self.undo_stack and state.mobjects_match(self.undo_stack[-1]):
             return
         self.redo_stack = []
-        self.undo_stack.append(state)
+        self.push_undo_state(state)
         if len(self.undo_stack) > self.max_num_saved_states:
-            self.undo_stack.pop(0)
+            self.pop_undo_state(0)
+        held_bytes = self.get_history_only_arrays()
+        total = sum(held_bytes.values())
+        while len(self.undo_stack) > 1 and total > self.max_saved_state_bytes:
+            state = self.pop_undo_state(0)
+            total -= sum(
+                held_bytes.get(data_hash, 0)
+                for data_hash in state.data_hashes
+                if data_hash not in self.undo_data_counts
+            )
+
+    def push_undo_state(self, state: SceneState) -> None:
+        self.undo_stack.append(state)
+        for data_hash in state.data_hashes:
+            self.undo_data_counts[data_hash] = self.undo_data_counts.get(data_hash, 0) + 1
+
+    def pop_undo_state(self, index: int = -1) -> SceneState:
+        state = self.undo_stack.pop(index)
+        for data_hash in state.data_hashes:
+            self.undo_data_counts[data_hash] -= 1
+            if self.undo_data_counts[data_hash] == 0:
+                self.undo_data_counts.pop(data_hash)
+        return state
+
+    def get_history_only_arrays(self) -> dict[str, int]:
+        """
+        Number of bytes of each data array, by content hash, which is held by
+        states in the undo stack but no longer shared by any mobject in the
+        scene, i.e. what the undo history itself keeps in memory
+        """
+        live_ids = set()
+        for mob in self.get_mobject_family_members():
+            live_ids.add(id(mob.data))
+            if mob.data.base is not None:
+                live_ids.add(id(mob.data.base))
+        result = dict()
+        for data_hash in self.undo_data_counts:
+            array = self.saved_arrays.get(data_hash)
+            if array is None or id(array) in live_ids:
+                continue
+            if array.base is not None and id(array.base) in live_ids:
+                continue
+            result[data_hash] = array.nbytes
+        return result
+
+    def get_saved_state_bytes(self) -> int:
+        return sum(self.get_history_only_arrays().values())
 
     def undo(self):
         if self.undo_stack:
             self.redo_stack.append(self.get_state())
-            self.restore_state(self.undo_stack.pop())
+            self.restore_state(self.pop_undo_state())
 
     def redo(self):
         if self.redo_stack:
-            self.undo_stack.append(self.get_state())
+            self.push_undo_state(self.get_state())
             self.restore_state(self.redo_stack.pop())
 
     @contextmanager
@@ -880,53 +1075,174 @@ class Scene(object):
 
 
 class SceneState():
+    """
+    Saved state of the mobjects in a scene, e.g. for undo and redo.
+
+    Each family member gets a MobjectRecord.  Records of mobjects which have not
+    changed since the last saved state are reused, and data arrays are shared,
+    read-only, with the mobjects themselves, as they are between a mobject and
+    its copies, as well as between all saved states with the same content by
+    way of scene.saved_arrays.  Each state therefore only adds whatever changed
+    since the last one, and changes are found by comparing content hashes of
+    arrays rather than the arrays themselves.
+    """
     def __init__(self, scene: Scene, ignore: list[Mobject] | None = None):
         self.time = scene.time
         self.num_plays = scene.num_plays
-        self.mobjects_to_copies = OrderedDict.fromkeys(scene.mobjects)
-        if ignore:
-            for mob in ignore:
-                self.mobjects_to_copies.pop(mob, None)
-
-        last_m2c = scene.undo_stack[-1].mobjects_to_copies if scene.undo_stack else dict()
-        for mob in self.mobjects_to_copies:
-            # If it hasn't changed since the last state, just point to the
-            # same copy as before
-            if mob in last_m2c and last_m2c[mob].looks_identical(mob):
-                self.mobjects_to_copies[mob] = last_m2c[mob]
+        ignore = set(ignore or [])
+        self.mobjects = [mob for mob in scene.mobjects if mob not in ignore]
+
+        last_records = scene.undo_stack[-1].records if scene.undo_stack else dict()
+        self.records: dict[Mobject, MobjectRecord] = dict()
+        for mob in extract_mobject_family_members(self.mobjects):
+            if mob in self.records:
+                continue
+            last_record = last_records.get(mob)
+            if last_record is not None and last_record.holds_data_of(mob):
+                # Unchanged, since the mobject copies its data before modifying it
+                data, data_hash = last_record.data, last_record.data_hash
             else:
-                self.mobjects_to_copies[mob] = mob.copy()
+                data, data_hash = self.get_shared_data(mob, scene.saved_arrays)
+            if last_record is not None and last_record.matches(mob, data_hash):
+                self.records[mob] = last_record
+            else:
+                self.records[mob] = MobjectRecord(mob, data, data_hash)
+        self.data_hashes = {record.data_hash for record in self.records.values()}
+
+    @staticmethod
+    def get_shared_data(mobject: Mobject, saved_arrays: WeakValueDictionary) -> tuple[np.ndarray, str]:
+        data_hash = hash_array(mobject.data)
+        data = saved_arrays.get(data_hash)
+        if data is None:
+            # Shared until the mobject next modifies it, see Mobject.unshare_data
+            data = mobject.share_data()
+            saved_arrays[data_hash] = data
+        return data, data_hash
 
     def __eq__(self, state: SceneState):
         return all((
             self.time == state.time,
             self.num_plays == state.num_plays,
-            self.mobjects_to_copies == state.mobjects_to_copies
+            self.mobjects_match(state),
         ))
 
     def mobjects_match(self, state: SceneState):
-        return self.mobjects_to_copies == state.mobjects_to_copies
+        return self.mobjects == state.mobjects and self.records.keys() == state.records.keys() and all(
+            record is state.records[mob] or record.matches_record(state.records[mob])
+            for mob, record in self.records.items()
+        )
 
     def n_changes(self, state: SceneState):
-        m2c = state.mobjects_to_copies
-        return sum(
-            1 - int(mob in m2c and mob.looks_identical(m2c[mob]))
-            for mob in self.mobjects_to_copies
-        )
+        def has_changed(mob):
+            record = self.records[mob]
+            other = state.records.get(mob)
+            if other is None or not (record is other or record.matches_record(other)):
+                return True
+            return any(has_changed(sm) for sm in record.submobjects)
+
+        return sum(map(has_changed, self.mobjects))
 
     def restore_scene(self, scene: Scene):
         scene.time = self.time
         scene.num_plays = self.num_plays
-        scene.mobjects = [
-            mob.become(mob_copy, match_updaters=True)
-            for mob, mob_copy in self.mobjects_to_copies.items()
-        ]
+        recorded_parents = {mob: [] for mob in self.records}
+        for mob, record in self.records.items():
+            record.restore(mob)
+            for sm in record.submobjects:
+                recorded_parents[sm].append(mob)
+        for mob, parents in recorded_parents.items():
+            mob.parents = [p for p in mob.parents if p not in self.records] + parents
+        scene.mobjects = list(self.mobjects)
+
+
+class MobjectRecord():
+    """
+    State of a single mobject, with its submobjects by reference, see SceneState
+    """
+    def __init__(self, mobject: Mobject, data: np.ndarray, data_hash: str):
+        self.data = data
+        self.data_hash = data_hash
+        self.uniforms = {
+            key: value.copy() if isinstance(value, np.ndarray) else value
+            for key, value in mobject.uniforms.items()
+        }
+        self.submobjects = list(mobject.submobjects)
+        self.updaters = list(mobject.updaters)
+        self.bounding_box = mobject.bounding_box.copy()
+        self.needs_new_bounding_box = mobject._needs_new_bounding_box
+        self.settings = self.get_settings(mobject)
+
+    @staticmethod
+    def get_settings(mobject: Mobject) -> tuple:
+        return (
+            mobject.shader_folder,
+            mobject.texture_paths,
+            mobject.depth_test,
+            mobject.render_primitive,
+        )
+
+    def holds_data_of(self, mobject: Mobject) -> bool:
+        """
+        Whether this record's data is, or is a view onto, the data the mobject
+        still has, see Mobject.share_data
+        """
+        data = mobject.data
+        if not data.flags.writeable:
+            return data is self.data
+        return mobject._data_is_shared and data is self.data.base
+
+    def matches(self, mobject: Mobject, data_hash: str) -> bool:
+        return all((
+            self.data_hash == data_hash,
+            self.submobjects == mobject.submobjects,
+            self.updaters == mobject.updaters,
+            self.settings == self.get_settings(mobject),
+            uniforms_match(self.uniforms, mobject.uniforms),
+        ))
+
+    def matches_record(self, record: MobjectRecord) -> bool:
+        return all((
+            self.data_hash == record.data_hash,
+            self.submobjects == record.submobjects,
+            self.updaters == record.updaters,
+            self.settings == record.settings,
+            uniforms_match(self.uniforms, record.uniforms),
+        ))
+
+    def restore(self, mobject: Mobject) -> None:
+        mobject.data = self.data
+        mobject._data_is_shared = False
+        mobject.set_uniforms(self.uniforms)
+        mobject.submobjects = list(self.submobjects)
+        mobject.updaters = list(self.updaters)
+        mobject.bounding_box = self.bounding_box.copy()
+        mobject._needs_new_bounding_box = self.needs_new_bounding_box
+        (
+            mobject.shader_folder,
+            mobject.texture_paths,
+            mobject.depth_test,
+            mobject.render_primitive,
+        ) = self.settings
+        mobject.family = None
+        mobject._has_updaters_in_family = None
+        mobject.note_changed_data(recurse_up=False)
+
+
+def uniforms_match(uniforms1: dict, uniforms2: dict) -> bool:
+    return uniforms1.keys() == uniforms2.keys() and all(
+        np.array_equal(value, uniforms2[key])
+        for key, value in uniforms1.items()
+    )
 
 
 class EndScene(Exception):
     pass
 
 
+class UnknownDuration(Exception):
+    pass
+
+
 class ThreeDScene(Scene):
     samples = 4
     default_frame_orientation = (-30, 70)
@@ -5,9 +5,6 @@ import pyperclip
 import textwrap
 import traceback
 
-from IPython.terminal import pt_inputhooks
-from IPython.terminal.embed import InteractiveShellEmbed
-
 from manimlib.animation.fading import VFadeInThenOut
 from manimlib.config import manim_config
 from manimlib.constants import RED
@@ -18,6 +15,8 @@ from manimlib.module_loader import ModuleLoader
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
+    from IPython.terminal.embed import InteractiveShellEmbed
+
     from manimlib.scene.scene import Scene
 
 
@@ -41,6 +40,9 @@ class InteractiveSceneEmbed:
         Create embedded IPython terminal configured to have access to
         the local namespace of the caller
         """
+        # IPython is slow to import, so is only imported once a scene embeds
+        from IPython.terminal.embed import InteractiveShellEmbed
+
         # Triple back should take us to the context in a user's scene definition
         # which is calling "self.embed"
         caller_frame = inspect.currentframe().f_back.f_back.f_back
@@ -89,6 +91,7 @@ class InteractiveSceneEmbed:
             if self.scene.is_window_closing():
                 self.shell.ask_exit()
 
+        from IPython.terminal import pt_inputhooks
         pt_inputhooks.register("manim", inputhook)
         self.shell.enable_gui("manim")
 
@@ -2,26 +2,32 @@ from __future__ import annotations
 
 import os
 import platform
+import queue
 import shutil
 import subprocess as sp
 import sys
+import threading
 
 import numpy as np
-from pydub import AudioSegment
 from tqdm.auto import tqdm as ProgressDisplay
 from pathlib import Path
 
 from manimlib.logger import log
 from manimlib.mobject.mobject import Mobject
+from manimlib.scene.movie_encoders import get_encoder_class
+from manimlib.utils.cache import cache_frame_count
 from manimlib.utils.file_ops import guarantee_existence
+from manimlib.utils.profiler import PROFILER
 from manimlib.utils.sounds import get_full_sound_file_path
 
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from PIL.Image import Image
+    from pydub import AudioSegment
 
     from manimlib.camera.camera import Camera
+    from manimlib.scene.movie_encoders import MovieEncoder
     from manimlib.scene.scene import Scene
 
 
@@ -42,12 +48,24 @@ class SceneFileWriter(object):
         quiet: bool = False,
         total_frames: int = 0,
         progress_description_len: int = 40,
+        # Either "ffmpeg", to pipe frames to an ffmpeg subprocess,
+        # or "pyav", to encode them in-process with PyAV
+        encoder: str = "ffmpeg",
         # Name of the binary used for ffmpeg
         ffmpeg_bin: str = "ffmpeg",
         video_codec: str = "libx264",
         pixel_format: str = "yuv420p",
         saturation: float = 1.0,
         gamma: float = 1.0,
+        # If true, frames are handed to a dedicated thread which feeds
+        # them to ffmpeg, so the scene can keep rendering while ffmpeg
+        # consumes them.  At most frame_queue_size frames are buffered
+        # before write_frame blocks.
+        use_encoder_thread: bool = False,
+        frame_queue_size: int = 8,
+        # When subdividing output, reuse partial movies from earlier
+        # renders whose plays started from an identical state
+        cache_partial_movies: bool = False,
     ):
         self.scene: Scene = scene
         self.write_to_movie = write_to_movie
@@ -62,16 +80,26 @@ class SceneFileWriter(object):
         self.quiet = quiet
         self.total_frames = total_frames
         self.progress_description_len = progress_description_len
+        self.encoder_name = encoder
         self.ffmpeg_bin = ffmpeg_bin
         self.video_codec = video_codec
         self.pixel_format = pixel_format
         self.saturation = saturation
         self.gamma = gamma
+        self.use_encoder_thread = use_encoder_thread
+        self.frame_queue_size = frame_queue_size
+        self.cache_partial_movies = cache_partial_movies
 
         # State during file writing
-        self.writing_process: sp.Popen | None = None
+        self.encoder: MovieEncoder | None = None
+        self.encoder_thread: threading.Thread | None = None
+        self.frame_queue: queue.Queue | None = None
+        self.encoder_error: Exception | None = None
         self.progress_display: ProgressDisplay | None = None
         self.ended_with_interrupt: bool = False
+        self.num_frames_written: int = 0
+        self.partial_movie_key: str | None = None
+        self.partial_movie_start_frame: int = 0
 
         self.init_output_directories()
         self.init_audio()
@@ -125,11 +153,19 @@ class SceneFileWriter(object):
     def get_movie_file_path(self) -> str:
         return self.movie_file_path
 
+    def get_partial_movie_cache_path(self, key: str) -> Path:
+        cache_dir = guarantee_existence(Path(self.partial_movie_directory, "cache"))
+        return Path(cache_dir, key).with_suffix(self.movie_file_extension)
+
+    def get_partial_movie_frame_count_path(self, key: str) -> Path:
+        return self.get_partial_movie_cache_path(key).with_suffix(".frames")
+
     # Sound
     def init_audio(self) -> None:
         self.includes_sound: bool = False
 
     def create_audio_segment(self) -> None:
+        from pydub import AudioSegment
         self.audio_segment = AudioSegment.silent()
 
     def add_audio_segment(
@@ -138,6 +174,7 @@ class SceneFileWriter(object):
         time: float | None = None,
         gain_to_background: float | None = None
     ) -> None:
+        from pydub import AudioSegment
         if not self.includes_sound:
             self.includes_sound = True
             self.create_audio_segment()
@@ -168,6 +205,7 @@ class SceneFileWriter(object):
         gain: float | None = None,
         gain_to_background: float | None = None
     ) -> None:
+        from pydub import AudioSegment
         file_path = get_full_sound_file_path(sound_file)
         new_segment = AudioSegment.from_file(file_path)
         if gain:
@@ -179,13 +217,44 @@ class SceneFileWriter(object):
         if not self.subdivide_output and self.write_to_movie:
             self.open_movie_pipe(self.get_movie_file_path())
 
-    def begin_animation(self) -> None:
+    def is_caching_partial_movies(self) -> bool:
+        return self.cache_partial_movies and self.subdivide_output and self.write_to_movie
+
+    def has_cached_partial_movie(self, key: str | None) -> bool:
+        if key is None or not self.is_caching_partial_movies():
+            return False
+        return all(
+            path.exists()
+            for path in (
+                self.get_partial_movie_cache_path(key),
+                self.get_partial_movie_frame_count_path(key),
+            )
+        )
+
+    def use_cached_partial_movie(self, key: str) -> None:
+        shutil.copyfile(
+            self.get_partial_movie_cache_path(key),
+            self.get_next_partial_movie_path(),
+        )
+        # Count the cached frames as written, so the recorded total stays right
+        frame_count_path = self.get_partial_movie_frame_count_path(key)
+        self.num_frames_written += int(frame_count_path.read_text())
+
+    def begin_animation(self, cache_key: str | None = None) -> None:
         if self.subdivide_output and self.write_to_movie:
+            self.partial_movie_key = cache_key
+            self.partial_movie_start_frame = self.num_frames_written
             self.open_movie_pipe(self.get_next_partial_movie_path())
 
     def end_animation(self) -> None:
         if self.subdivide_output and self.write_to_movie:
             self.close_movie_pipe()
+            key = self.partial_movie_key
+            if self.is_caching_partial_movies() and key is not None and not self.ended_with_interrupt:
+                shutil.copyfile(self.final_file_path, self.get_partial_movie_cache_path(key))
+                n_frames = self.num_frames_written - self.partial_movie_start_frame
+                self.get_partial_movie_frame_count_path(key).write_text(str(n_frames))
+            self.partial_movie_key = None
 
     def finish(self) -> None:
         if not self.subdivide_output and self.write_to_movie:
@@ -193,6 +262,14 @@ class SceneFileWriter(object):
             if self.includes_sound:
                 self.add_sound_to_video()
             self.print_file_ready_message(self.get_movie_file_path())
+        if self.write_to_movie and not self.ended_with_interrupt:
+            # Record the frame count, so later renders can skip the pre-run
+            cache_frame_count(
+                type(self.scene),
+                self.num_frames_written,
+                self.scene.start_at_animation_number,
+                self.scene.end_at_animation_number,
+            )
         if self.save_last_frame:
             self.scene.update_frame(force_draw=True)
             self.save_final_image(self.scene.get_image())
@@ -204,30 +281,22 @@ class SceneFileWriter(object):
         self.final_file_path = file_path
         self.temp_file_path = stem + "_temp" + ext
 
-        fps = self.scene.camera.fps
         width, height = self.scene.camera.get_pixel_shape()
-
-        vf_arg = 'vflip'
-        vf_arg += f',eq=saturation={self.saturation}:gamma={self.gamma}'
-
-        command = [
-            self.ffmpeg_bin,
-            '-y',  # overwrite output file if it exists
-            '-f', 'rawvideo',
-            '-s', f'{width}x{height}',  # size of one frame
-            '-pix_fmt', 'rgba',
-            '-r', str(fps),  # frames per second
-            '-i', '-',  # The input comes from a pipe
-            '-vf', vf_arg,
-            '-an',  # Tells ffmpeg not to expect any audio
-            '-loglevel', 'error',
-        ]
-        if self.video_codec:
-            command += ['-vcodec', self.video_codec]
-        if self.pixel_format:
-            command += ['-pix_fmt', self.pixel_format]
-        command += [self.temp_file_path]
-        self.writing_process = sp.Popen(command, stdin=sp.PIPE)
+        encoder_class = get_encoder_class(self.encoder_name)
+        self.encoder = encoder_class(
+            self.temp_file_path,
+            width=width,
+            height=height,
+            fps=self.scene.camera.fps,
+            video_codec=self.video_codec,
+            pixel_format=self.pixel_format,
+            saturation=self.saturation,
+            gamma=self.gamma,
+            ffmpeg_bin=self.ffmpeg_bin,
+            input_pixel_format=self.scene.camera.readback_format,
+        )
+        if self.use_encoder_thread:
+            self.start_encoder_thread()
 
         if not self.quiet:
             self.progress_display = ProgressDisplay(
@@ -282,16 +351,74 @@ class SceneFileWriter(object):
         self.progress_display.set_description(full_desc)
 
     def write_frame(self, camera: Camera) -> None:
-        if self.write_to_movie:
-            raw_bytes = camera.get_raw_fbo_data()
-            self.writing_process.stdin.write(raw_bytes)
-            if self.progress_display is not None:
-                self.progress_display.update()
+        if not self.write_to_movie:
+            return
+        if camera.async_readback:
+            # Bytes come back a frame (or more) late, and the remainder
+            # are flushed in close_movie_pipe
+            raw_bytes = camera.queue_raw_fbo_data()
+            if raw_bytes is None:
+                return
+        else:
+            raw_bytes = camera.get_frame_bytes()
+        self.write_raw_frame(raw_bytes)
+
+    def write_raw_frame(self, raw_bytes: bytes) -> None:
+        if self.encoder_thread is not None:
+            self.raise_encoder_error()
+            # Blocks while the queue is full, which keeps the scene
+            # from running arbitrarily far ahead of ffmpeg
+            self.frame_queue.put(raw_bytes)
+        else:
+            with PROFILER.span("encode"):
+                self.encoder.write(raw_bytes)
+        self.num_frames_written += 1
+        if self.progress_display is not None:
+            self.progress_display.update()
+
+    # Background encoding
+    def start_encoder_thread(self) -> None:
+        self.frame_queue = queue.Queue(maxsize=max(self.frame_queue_size, 1))
+        self.encoder_error = None
+        self.encoder_thread = threading.Thread(
+            target=self.encoder_loop,
+            args=(self.encoder, self.frame_queue),
+            daemon=True,
+        )
+        self.encoder_thread.start()
+
+    def encoder_loop(self, encoder: MovieEncoder, frame_queue: queue.Queue) -> None:
+        while (raw_bytes := frame_queue.get()) is not None:
+            if self.encoder_error is not None:
+                # Keep draining so the main thread never blocks on a dead pipe
+                continue
+            try:
+                with PROFILER.span("encode"):
+                    encoder.write(raw_bytes)
+            except Exception as err:
+                self.encoder_error = err
+
+    def stop_encoder_thread(self) -> None:
+        if self.encoder_thread is None:
+            return
+        self.frame_queue.put(None)
+        self.encoder_thread.join()
+        self.encoder_thread = None
+        self.frame_queue = None
+        self.raise_encoder_error()
+
+    def raise_encoder_error(self) -> None:
+        if self.encoder_error is not None:
+            error = self.encoder_error
+            self.encoder_error = None
+            raise error
 
     def close_movie_pipe(self) -> None:
-        self.writing_process.stdin.close()
-        self.writing_process.wait()
-        self.writing_process.terminate()
+        for raw_bytes in self.scene.camera.flush_readback_buffers():
+            self.write_raw_frame(raw_bytes)
+        self.stop_encoder_thread()
+        self.encoder.close()
+        self.encoder = None
         if self.progress_display is not None:
             self.progress_display.close()
 
@@ -304,6 +431,7 @@ class SceneFileWriter(object):
         movie_file_path = self.get_movie_file_path()
         stem, ext = os.path.splitext(movie_file_path)
         sound_file_path = stem + ".wav"
+        from pydub import AudioSegment
         # Makes sure sound file length will match video file
         self.add_audio_segment(AudioSegment.silent(0))
         self.audio_segment.export(
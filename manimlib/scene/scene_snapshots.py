@@ -0,0 +1,430 @@
+from __future__ import annotations
+
+import ast
+import inspect
+import io
+import linecache
+import pickle
+import random
+import sys
+import textwrap
+import weakref
+
+import numpy as np
+
+from manimlib.logger import log
+from manimlib.mobject.mobject import Mobject
+from manimlib.module_loader import ModuleLoader
+from manimlib.shader_wrapper import ShaderWrapper
+from manimlib.utils.cache import get_scene_snapshot_index
+from manimlib.utils.cache import load_scene_snapshot
+from manimlib.utils.cache import save_scene_snapshot
+from manimlib.utils.simple_functions import hash_string
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Optional
+    from manimlib.scene.scene import Scene
+
+
+# Attributes which are not saved, but kept from the live mobject, since they
+# hold functions the construct method re-adds on every run, or gpu objects
+LIVE_MOBJECT_ATTRS = ("updaters", "event_listners", "shader_wrapper")
+
+
+class SnapshotMismatch(Exception):
+    pass
+
+
+class SceneSnapshotter(object):
+    """
+    Saves the state of a scene to disk at play boundaries, so that a later
+    run starting at animation number n, i.e. with -n, can restore the latest
+    snapshot before that play rather than running every earlier animation.
+
+    The construct method itself still runs from the top, since local variables
+    hold on to mobjects, but plays and waits before the snapshot only advance
+    the clock.  At the snapshot's play, the saved state of each mobject is
+    written back into the live mobject which construct created at the same
+    point, so that those local variables stay valid.  To make that matching
+    possible, every mobject made while construct is between plays (rather
+    than by animations or updaters) is logged in the order of creation.
+
+    A snapshot is only used if the source of the scene file, up to the end of
+    the statement in construct which made the play, along with any project
+    modules it imports, is unchanged.  If the mobjects made during the fast
+    forward still don't line up with those saved, SnapshotMismatch is raised,
+    and the scene starts over without snapshots.
+
+    Since skipped plays leave mobjects as they were, any value which code in
+    the scene file reads off of them during the fast forward, e.g. a point
+    from get_center, would be stale.  So calls from the scene file to getters
+    of mobjects which have sat through a skipped play are watched for, and
+    if there are any, the snapshot is not used.  Reads made through code in
+    other files, e.g. next_to called on a mobject made after the snapshot,
+    are not caught.
+    """
+    def __init__(self, scene: Scene, interval: int):
+        self.scene = scene
+        self.interval = interval
+        self.creation_log: list[weakref.ref] = []
+        self.fast_forward_to: Optional[int] = None
+        self.source_lines: list[str] = []
+        self.statement_spans: list[tuple[int, int]] = []
+        self.construct_span: tuple[int, int] = (0, 0)
+        self.dependency_hash: str = ""
+        # Ids of mobjects which sat through a skipped play, and the
+        # first getter called on one of them from the scene file
+        self.stale_ids: set[int] = set()
+        self.num_stale_logged: int = 0
+        self.stale_read: Optional[str] = None
+        self.enabled = interval > 0 and self.init_source_info()
+
+    def init_source_info(self) -> bool:
+        construct = type(self.scene).construct
+        if construct.__module__.startswith("manimlib."):
+            # E.g. the blank scene, or the base Scene.construct
+            return False
+        try:
+            self.file_name = construct.__code__.co_filename
+            linecache.checkcache(self.file_name)
+            self.source_lines = linecache.getlines(self.file_name)
+            construct_lines, start = inspect.getsourcelines(construct)
+            func_node = ast.parse(textwrap.dedent("".join(construct_lines))).body[0]
+        except (OSError, TypeError, SyntaxError, IndexError):
+            return False
+        self.construct_code = construct.__code__
+        self.construct_span = (start, start + len(construct_lines) - 1)
+        # Line spans of the top-level statements in construct
+        self.statement_spans = [
+            (start + node.lineno - 1, start + node.end_lineno - 1)
+            for node in func_node.body
+        ]
+        self.dependency_hash = hash_string("".join(
+            path + get_file_content(path)
+            for path in sorted(ModuleLoader.get_user_module_files(construct.__globals__))
+        ))
+        return bool(self.source_lines)
+
+    # Logging mobject creation
+
+    def begin(self) -> None:
+        """
+        Called before the scene's setup and construct
+        """
+        if not self.enabled:
+            return
+        self.creation_log = []
+        Mobject.creation_log = self.creation_log
+        start = self.scene.start_at_animation_number
+        if start is not None and self.fast_forward_to is None:
+            self.fast_forward_to = self.find_snapshot(start)
+
+    def end(self) -> None:
+        if Mobject.creation_log is self.creation_log:
+            Mobject.creation_log = None
+        self.stop_watching_reads()
+
+    def pause_logging(self) -> None:
+        if Mobject.creation_log is self.creation_log:
+            Mobject.creation_log = None
+
+    def resume_logging(self) -> None:
+        if self.enabled:
+            Mobject.creation_log = self.creation_log
+
+    def disable(self) -> None:
+        self.end()
+        self.enabled = False
+        self.fast_forward_to = None
+
+    # Keys
+
+    def get_construct_line(self) -> Optional[int]:
+        """
+        Line of construct currently being run, if construct is on the stack
+        """
+        frame = sys._getframe()
+        while frame is not None:
+            if frame.f_code is self.construct_code and frame.f_locals.get("self") is self.scene:
+                return frame.f_lineno
+            frame = frame.f_back
+        return None
+
+    def get_key(self, play_index: int, line_number: int) -> str:
+        # Everything in construct past the statement containing this line is
+        # left out, as it can't yet have run.  Note, this covers loops too.
+        end = line_number
+        for start, stop in self.statement_spans:
+            if start <= line_number <= stop:
+                end = stop
+        construct_end = self.construct_span[1]
+        source = "".join(self.source_lines[:end] + self.source_lines[construct_end:])
+        scene = self.scene
+        return hash_string("".join(map(str, (
+            type(scene).__qualname__,
+            play_index,
+            scene.random_seed,
+            scene.camera_config,
+            source,
+            self.dependency_hash,
+            getattr(sys.modules.get("manimlib"), "__version__", ""),
+        ))))
+
+    def find_snapshot(self, start: int) -> Optional[int]:
+        index = get_scene_snapshot_index(self.file_name, str(self.scene))
+        for play_index in sorted(index, reverse=True):
+            if 0 < play_index <= start:
+                line_number, key = index[play_index]
+                if self.get_key(play_index, line_number) == key:
+                    return play_index
+        return None
+
+    # Play boundaries
+
+    def is_fast_forwarding(self) -> bool:
+        return self.fast_forward_to is not None and self.scene.num_plays < self.fast_forward_to
+
+    def on_play_boundary(self) -> None:
+        """
+        Called at the start of each play or wait, before anything in it runs
+        """
+        if not self.enabled or self.scene.timeline_only:
+            return
+        num_plays = self.scene.num_plays
+        if self.is_fast_forwarding():
+            self.watch_reads()
+        elif num_plays == self.fast_forward_to:
+            self.fast_forward_to = None
+            self.stop_watching_reads()
+            if self.stale_read is not None:
+                raise SnapshotMismatch(f"construct read {self.stale_read} while fast forwarding")
+            self.restore(num_plays)
+        elif num_plays > 0 and num_plays % self.interval == 0 and not self.is_fast_forwarding():
+            self.save(num_plays)
+
+    # Watching for stale reads
+
+    def watch_reads(self) -> None:
+        """
+        Called before each skipped play, marks every mobject so far as stale
+        """
+        scene = self.scene
+        for ref in self.creation_log[self.num_stale_logged:]:
+            mob = ref()
+            if mob is not None:
+                self.stale_ids.add(id(mob))
+        self.num_stale_logged = len(self.creation_log)
+        self.stale_ids.add(id(scene.camera.frame))
+        self.stale_ids.update(map(id, scene.get_mobject_family_members()))
+        profile_func = sys.getprofile()
+        if profile_func is None:
+            sys.setprofile(self.note_call)
+        elif profile_func != self.note_call:
+            raise SnapshotMismatch("reads can't be watched while another profiler is running")
+
+    def stop_watching_reads(self) -> None:
+        if sys.getprofile() == self.note_call:
+            sys.setprofile(None)
+
+    def note_call(self, frame, event: str, arg) -> None:
+        if event != "call" or self.stale_read is not None:
+            return
+        code = frame.f_code
+        if not code.co_name.startswith("get_"):
+            return
+        caller = frame.f_back
+        if caller is None or caller.f_code.co_filename != self.file_name:
+            return
+        mob = frame.f_locals.get("self")
+        if isinstance(mob, Mobject) and id(mob) in self.stale_ids:
+            self.stale_read = f"{type(mob).__name__}.{code.co_name} on line {caller.f_lineno}"
+
+    def save(self, play_index: int) -> None:
+        line_number = self.get_construct_line()
+        if line_number is None:
+            return
+        key = self.get_key(play_index, line_number)
+        index = get_scene_snapshot_index(self.file_name, str(self.scene))
+        if index.get(play_index) == (line_number, key):
+            return
+        try:
+            snapshot = self.get_snapshot()
+        except (pickle.PicklingError, TypeError, AttributeError) as err:
+            log.debug(f"Not saving a snapshot of {self.scene} at play {play_index}: {err}")
+            return
+        save_scene_snapshot(self.file_name, str(self.scene), play_index, line_number, key, snapshot)
+
+    def restore(self, play_index: int) -> None:
+        index = get_scene_snapshot_index(self.file_name, str(self.scene))
+        line_number, key = index.get(play_index, (None, None))
+        if line_number != self.get_construct_line():
+            raise SnapshotMismatch(f"construct reached play {play_index} on a different line")
+        snapshot = load_scene_snapshot(key)
+        if snapshot is None:
+            raise SnapshotMismatch(f"snapshot for play {play_index} is no longer cached")
+        self.load_snapshot(snapshot)
+        log.info(f"Restored {self.scene} from its snapshot at play {play_index}")
+
+    # Serialization
+
+    def get_live_mobjects(self) -> dict[tuple, Mobject]:
+        """
+        Gives an id to each logged mobject which is still alive, and to members
+        of their families which were not logged themselves, e.g. submobjects
+        of copies, by their position in the family.  The same goes for anything
+        else in the scene, e.g. mobjects made by animations, by position among
+        the scene's family members.  The camera frame, made before logging
+        starts, gets an id of its own.
+        """
+        id_to_mob = {("frame",): self.scene.camera.frame}
+        seen = {id(self.scene.camera.frame)}
+        logged = [ref() for ref in self.creation_log]
+        seen.update(id(mob) for mob in logged if mob is not None)
+        for index, mob in enumerate(logged):
+            if mob is not None:
+                id_to_mob[("mob", index)] = mob
+        for index, mob in enumerate(logged):
+            if mob is None:
+                continue
+            for position, sm in enumerate(mob.get_family()):
+                if id(sm) not in seen:
+                    seen.add(id(sm))
+                    id_to_mob[("sub", index, position)] = sm
+        for position, mob in enumerate(self.scene.get_mobject_family_members()):
+            if id(mob) not in seen:
+                seen.add(id(mob))
+                id_to_mob[("scene", position)] = mob
+        return id_to_mob
+
+    def get_snapshot(self) -> bytes:
+        scene = self.scene
+        id_to_mob = self.get_live_mobjects()
+        mob_to_id = {id(mob): mob_id for mob_id, mob in id_to_mob.items()}
+
+        def dumps(obj) -> bytes:
+            buffer = io.BytesIO()
+            pickler = pickle.Pickler(buffer, protocol=pickle.HIGHEST_PROTOCOL)
+
+            def persistent_id(value):
+                if isinstance(value, ShaderWrapper):
+                    return ("none",)
+                return mob_to_id.get(id(value)) if isinstance(value, Mobject) else None
+
+            pickler.persistent_id = persistent_id
+            pickler.dump(obj)
+            return buffer.getvalue()
+
+        states = dict()
+        for mob_id, mob in id_to_mob.items():
+            attrs = {k: v for k, v in mob.__dict__.items() if k not in LIVE_MOBJECT_ATTRS}
+            try:
+                state = dumps(attrs)
+            except Exception:
+                # Pickle what can be, e.g. leaving out attributes holding
+                # lambdas, which are then kept from the live mobject
+                state = dumps({
+                    k: v for k, v in attrs.items()
+                    if is_picklable(dumps, v)
+                })
+            states[mob_id] = (type(mob).__module__, type(mob).__qualname__, state)
+
+        return pickle.dumps(dict(
+            num_logged=len(self.creation_log),
+            class_names=[
+                None if mob is None else type(mob).__qualname__
+                for mob in (ref() for ref in self.creation_log)
+            ],
+            states=states,
+            mobjects=dumps(scene.mobjects),
+            time=scene.time,
+            num_plays=scene.num_plays,
+            random_state=random.getstate(),
+            np_random_state=np.random.get_state(),
+        ), protocol=pickle.HIGHEST_PROTOCOL)
+
+    def load_snapshot(self, snapshot: bytes) -> None:
+        scene = self.scene
+        data = pickle.loads(snapshot)
+        live = self.get_live_mobjects()
+
+        # The mobjects made during the fast forward must match those made
+        # the run this was saved from, apart from ones collected since
+        if data["num_logged"] != len(self.creation_log):
+            raise SnapshotMismatch("a different number of mobjects were created")
+        for index, name in enumerate(data["class_names"]):
+            mob = live.get(("mob", index))
+            if name is not None and mob is not None and type(mob).__qualname__ != name:
+                raise SnapshotMismatch(f"mobject {index} is a {type(mob).__name__} rather than a {name}")
+
+        # Live mobjects are written into in place, and any which are
+        # missing, e.g. from differently aligned families, are made anew
+        targets = dict()
+        for mob_id, (module_name, qualname, state) in data["states"].items():
+            mob = live.get(mob_id)
+            if mob is None or type(mob).__qualname__ != qualname:
+                cls = self.find_class(module_name, qualname)
+                mob = cls.__new__(cls)
+            targets[mob_id] = mob
+
+        def loads(state: bytes):
+            unpickler = pickle.Unpickler(io.BytesIO(state))
+            unpickler.persistent_load = lambda pid: None if pid == ("none",) else targets[pid]
+            return unpickler.load()
+
+        new_states = {mob_id: loads(state) for mob_id, (_, _, state) in data["states"].items()}
+        for mob_id, attrs in new_states.items():
+            mob = targets[mob_id]
+            if mob.__dict__.get("shader_wrapper") is not None:
+                mob.shader_wrapper.release()
+            kept = {
+                key: value for key, value in mob.__dict__.items()
+                if key not in attrs and key != "shader_wrapper"
+            }
+            mob.__dict__.clear()
+            mob.__dict__.update(attrs)
+            mob.__dict__.update(kept)
+            mob.shader_wrapper = None
+            if not hasattr(mob, "updaters"):
+                mob.init_updaters()
+            if not hasattr(mob, "event_listners"):
+                mob.init_event_listners()
+            mob._data_has_changed = True
+            mob._has_updaters_in_family = None
+
+        scene.mobjects = loads(data["mobjects"])
+        scene.time = data["time"]
+        scene.num_plays = data["num_plays"]
+        random.setstate(data["random_state"])
+        np.random.set_state(data["np_random_state"])
+        scene.assemble_render_groups()
+
+    def find_class(self, module_name: str, qualname: str) -> type:
+        if module_name in sys.modules:
+            namespace = sys.modules[module_name].__dict__
+        else:
+            # Classes defined in the scene file itself
+            namespace = type(self.scene).construct.__globals__
+        obj = namespace
+        for name in qualname.split("."):
+            obj = obj.get(name) if isinstance(obj, dict) else getattr(obj, name, None)
+        if not isinstance(obj, type):
+            raise SnapshotMismatch(f"class {qualname} could not be found")
+        return obj
+
+
+def is_picklable(dumps, value) -> bool:
+    try:
+        dumps(value)
+        return True
+    except Exception:
+        return False
+
+
+def get_file_content(path: str) -> str:
+    try:
+        with open(path, "r") as fp:
+            return fp.read()
+    except OSError:
+        return ""
@@ -11,9 +11,11 @@ from functools import lru_cache
 
 from manimlib.config import parse_cli
 from manimlib.config import manim_config
+from manimlib.utils.shaders import get_interpolating_vertex_shader
 from manimlib.utils.shaders import get_shader_code_from_file
 from manimlib.utils.shaders import get_shader_program
 from manimlib.utils.shaders import image_path_to_texture
+from manimlib.utils.profiler import PROFILER
 from manimlib.utils.shaders import set_program_uniform
 
 from typing import TYPE_CHECKING
@@ -45,11 +47,14 @@ class ShaderWrapper(object):
     ):
         self.ctx = ctx
         self.vert_data = vert_data
+        # Initially, this is the data of a mobject, which mustn't be written to
+        self.owns_vert_data = False
         self.vert_attributes = vert_data.dtype.names
         self.shader_folder = shader_folder
         self.depth_test = depth_test
         self.render_primitive = render_primitive
         self.texture_paths = texture_paths or dict()
+        self.lag_table: Optional[np.ndarray] = None
 
         self.program_uniform_mirror: UniformDict = dict()
         self.bind_to_mobject_uniforms(mobject_uniforms or dict())
@@ -80,14 +85,33 @@ class ShaderWrapper(object):
             "fragment_shader": get_code("frag"),
         }
 
+    def get_program_code(self) -> dict[str, str | None]:
+        """
+        The program code, with vertex shaders rewritten to interpolate
+        between start and target data if a lag table is set
+        """
+        if self.lag_table is None:
+            return self.program_code
+        return {
+            name: get_interpolating_vertex_shader(code) if code and name.endswith(("vert", "vertex_shader")) else code
+            for name, code in self.program_code.items()
+        }
+
+    def get_attribute_names(self, attributes: Iterable[str], prefix: str = "start_") -> list[str]:
+        if self.lag_table is None:
+            return list(attributes)
+        return [prefix + attr for attr in attributes]
+
     def init_program(self):
         if not self.shader_folder:
             self.program = None
             self.vert_format = None
             self.programs = []
             return
-        self.program = get_shader_program(self.ctx, **self.program_code)
-        self.vert_format = moderngl.detect_format(self.program, self.vert_attributes)
+        self.program = get_shader_program(self.ctx, **self.get_program_code())
+        self.vert_format = moderngl.detect_format(
+            self.program, self.get_attribute_names(self.vert_attributes)
+        )
         self.programs = [self.program]
 
     def init_textures(self):
@@ -98,7 +122,18 @@ class ShaderWrapper(object):
 
     def init_vertex_objects(self):
         self.vbo = None
+        self.target_vbo = None
+        self.lag_index_vbo = None
         self.vaos = []
+        self.init_slots()
+
+    def init_slots(self):
+        # The vertex data is a concatenation of arrays, one per slot, where
+        # slot_offsets gives the range of each.  Whoever reads in data can
+        # track what each slot came from with slot_sources and slot_versions
+        self.slot_offsets = np.zeros(1, dtype=int)
+        self.slot_sources: list = []
+        self.slot_versions: list[int] = []
 
     def add_texture(self, name: str, texture: moderngl.Texture):
         max_units = self.ctx.info['GL_MAX_TEXTURE_IMAGE_UNITS']
@@ -108,6 +143,13 @@ class ShaderWrapper(object):
         self.texture_names_to_ids[name] = len(self.textures)
         self.textures.append(texture)
 
+    def remove_texture(self, name: str):
+        index = self.texture_names_to_ids.pop(name)
+        self.textures.pop(index).release()
+        for key, value in self.texture_names_to_ids.items():
+            if value > index:
+                self.texture_names_to_ids[key] = value - 1
+
     def bind_to_mobject_uniforms(self, mobject_uniforms: UniformDict):
         self.mobject_uniforms = mobject_uniforms
 
@@ -121,8 +163,31 @@ class ShaderWrapper(object):
             self.depth_test,
             self.render_primitive,
             self.texture_paths,
+            None if self.lag_table is None else id(self.lag_table),
         ])))
 
+    def set_lag_table(self, lag_table: Optional[np.ndarray]) -> None:
+        """
+        With a lag table, i.e. a float32 array of shape (rows, LAG_TABLE_WIDTH),
+        each vertex is drawn interpolated between its data, as read in with
+        read_in, and its target data, as read in with read_in_targets, by the
+        alpha in the table at that vertex's lag index.  The table is uploaded
+        to the gpu on each render.  Passing None returns to ordinary rendering.
+        """
+        if lag_table is self.lag_table:
+            return
+        self.release()
+        if self.lag_table is not None:
+            self.remove_texture("LagTable")
+        self.lag_table = lag_table
+        if lag_table is not None:
+            rows, width = lag_table.shape
+            self.add_texture("LagTable", self.ctx.texture(
+                size=(width, rows), components=1, dtype='f4'
+            ))
+        self.init_program()
+        self.refresh_id()
+
     def replace_code(self, old: str, new: str) -> None:
         code_map = self.program_code
         for name in code_map:
@@ -163,34 +228,104 @@ class ShaderWrapper(object):
     # Adding data
 
     def read_in(self, data_list: Iterable[np.ndarray]):
-        total_len = sum(map(len, data_list))
-        if total_len == 0:
+        with PROFILER.span("read_in"):
+            slot_offsets = np.cumsum([0, *map(len, data_list)])
+            total_len = slot_offsets[-1]
+            if total_len == 0:
+                if self.vbo is not None:
+                    self.vbo.clear()
+                self.slot_offsets = slot_offsets
+                return
+
+            # If possible, read concatenated data into existing list
+            if len(self.vert_data) != total_len or not self.owns_vert_data:
+                self.vert_data = np.concatenate(data_list)
+                self.owns_vert_data = True
+            else:
+                np.concatenate(data_list, out=self.vert_data)
+
+            # Either create new vbo, or read data into it
+            total_size = self.vert_data.itemsize * total_len
+            if self.vbo is not None and self.vbo.size != total_size:
+                self.release()  # This sets vbo to be None
+            if self.vbo is None:
+                self.vbo = self.ctx.buffer(self.vert_data)
+                self.generate_vaos()
+            else:
+                self.vbo.write(self.vert_data)
+            self.slot_offsets = slot_offsets
+
+    def write_slots(self, slot_data: dict[int, np.ndarray]) -> bool:
+        """
+        Replaces the data of individual slots, i.e. the arrays at those indices
+        of the list last passed into read_in, uploading only the corresponding
+        ranges of the vbo.  If any new array has a different length from the one
+        it replaces, nothing is written, and this returns False.
+        """
+        offsets = self.slot_offsets
+        for index, data in slot_data.items():
+            if len(data) != offsets[index + 1] - offsets[index]:
+                return False
+        if not slot_data:
+            return True
+        if self.vbo is None or not self.owns_vert_data:
+            return False
+
+        with PROFILER.span("read_in"):
+            for index, data in slot_data.items():
+                self.vert_data[offsets[index]:offsets[index + 1]] = data
+            # Write each run of adjacent slots at once
+            indices = sorted(slot_data)
+            run_start = indices[0]
+            for index, next_index in zip(indices, [*indices[1:], None]):
+                if next_index == index + 1:
+                    continue
+                start, end = offsets[run_start], offsets[index + 1]
+                if end > start:
+                    self.vbo.write(
+                        self.vert_data[start:end],
+                        offset=int(start * self.vert_data.itemsize),
+                    )
+                run_start = next_index
+        return True
+
+    def read_in_targets(self, target_list: Iterable[np.ndarray], lag_index_list: Iterable[np.ndarray]):
+        """
+        When a lag table is set, this reads in the data each vertex is
+        interpolated towards, which should match the data passed into read_in
+        in length and dtype, along with the index into the lag table of each
+        vertex.  This should be called before read_in.
+        """
+        with PROFILER.span("read_in"):
+            target_data = np.concatenate(target_list)
+            lag_indices = np.concatenate(lag_index_list).astype(np.float32)
+            if len(target_data) == 0:
+                return
+            if self.target_vbo is not None and self.target_vbo.size == target_data.nbytes:
+                self.target_vbo.write(target_data)
+                self.lag_index_vbo.write(lag_indices)
+                return
+            for obj in (self.target_vbo, self.lag_index_vbo, *self.vaos):
+                if obj is not None:
+                    obj.release()
+            self.target_vbo = self.ctx.buffer(target_data)
+            self.lag_index_vbo = self.ctx.buffer(lag_indices)
             if self.vbo is not None:
-                self.vbo.clear()
-            return
+                self.generate_vaos()
 
-        # If possible, read concatenated data into existing list
-        if len(self.vert_data) != total_len:
-            self.vert_data = np.concatenate(data_list)
-        else:
-            np.concatenate(data_list, out=self.vert_data)
-
-        # Either create new vbo, or read data into it
-        total_size = self.vert_data.itemsize * total_len
-        if self.vbo is not None and self.vbo.size != total_size:
-            self.release()  # This sets vbo to be None
-        if self.vbo is None:
-            self.vbo = self.ctx.buffer(self.vert_data)
-            self.generate_vaos()
-        else:
-            self.vbo.write(self.vert_data)
+    def get_vao_content(self, vert_format: str, attributes: Iterable[str]) -> list[tuple]:
+        content = [(self.vbo, vert_format, *self.get_attribute_names(attributes))]
+        if self.lag_table is not None:
+            content.append((self.target_vbo, vert_format, *self.get_attribute_names(attributes, "target_")))
+            content.append((self.lag_index_vbo, "1f", "lag_index"))
+        return content
 
     def generate_vaos(self):
         # Vertex array object
         self.vaos = [
             self.ctx.vertex_array(
                 program=program,
-                content=[(self.vbo, self.vert_format, *self.vert_attributes)],
+                content=self.get_vao_content(self.vert_format, self.vert_attributes),
                 mode=self.render_primitive,
             )
             for program in self.programs
@@ -200,6 +335,8 @@ class ShaderWrapper(object):
     def pre_render(self):
         self.set_ctx_depth_test(self.depth_test)
         self.set_ctx_clip_plane(self.num_clip_planes())
+        if self.lag_table is not None:
+            self.textures[self.texture_names_to_ids["LagTable"]].write(self.lag_table)
         for tid, texture in enumerate(self.textures):
             texture.use(tid)
 
@@ -216,7 +353,7 @@ class ShaderWrapper(object):
                     set_program_uniform(program, name, value)
 
     def release(self):
-        for obj in (self.vbo, *self.vaos):
+        for obj in (self.vbo, self.target_vbo, self.lag_index_vbo, *self.vaos):
             if obj is not None:
                 obj.release()
         self.init_vertex_objects()
@@ -253,7 +390,7 @@ class VShaderWrapper(ShaderWrapper):
             depth_test=depth_test,
             render_primitive=render_primitive
         )
-        self.fill_canvas = VShaderWrapper.get_fill_canvas(self.ctx)
+        self.fill_canvas = VShaderWrapper.get_fill_canvas(self.ctx, tuple(manim_config.camera.resolution))
         self.add_texture('Texture', self.fill_canvas[0].color_attachments[0])
         self.add_texture('DepthTexture', self.fill_canvas[2].color_attachments[0])
         for old, new in code_replacements.items():
@@ -269,32 +406,33 @@ class VShaderWrapper(ShaderWrapper):
         }
 
     def init_program(self):
+        code = self.get_program_code()
         self.stroke_program = get_shader_program(
             self.ctx,
-            vertex_shader=self.program_code["stroke_vert"],
-            geometry_shader=self.program_code["stroke_geom"],
-            fragment_shader=self.program_code["stroke_frag"],
+            vertex_shader=code["stroke_vert"],
+            geometry_shader=code["stroke_geom"],
+            fragment_shader=code["stroke_frag"],
         )
         self.fill_program = get_shader_program(
             self.ctx,
-            vertex_shader=self.program_code["fill_vert"],
-            geometry_shader=self.program_code["fill_geom"],
-            fragment_shader=self.program_code["fill_frag"],
+            vertex_shader=code["fill_vert"],
+            geometry_shader=code["fill_geom"],
+            fragment_shader=code["fill_frag"],
         )
         self.fill_border_program = get_shader_program(
             self.ctx,
-            vertex_shader=self.program_code["stroke_vert"],
-            geometry_shader=self.program_code["stroke_geom"],
-            fragment_shader=self.program_code["stroke_frag"].replace(
+            vertex_shader=code["stroke_vert"],
+            geometry_shader=code["stroke_geom"],
+            fragment_shader=code["stroke_frag"].replace(
                 "// MODIFY FRAG COLOR",
                 "frag_color.a *= 0.95; frag_color.rgb *= frag_color.a;",
             )
         )
         self.fill_depth_program = get_shader_program(
             self.ctx,
-            vertex_shader=self.program_code["depth_vert"],
-            geometry_shader=self.program_code["depth_geom"],
-            fragment_shader=self.program_code["depth_frag"],
+            vertex_shader=code["depth_vert"],
+            geometry_shader=code["depth_geom"],
+            fragment_shader=code["depth_frag"],
         )
         self.programs = [self.stroke_program, self.fill_program, self.fill_border_program, self.fill_depth_program]
 
@@ -320,30 +458,33 @@ class VShaderWrapper(ShaderWrapper):
 
     def init_vertex_objects(self):
         self.vbo = None
+        self.target_vbo = None
+        self.lag_index_vbo = None
         self.stroke_vao = None
         self.fill_vao = None
         self.fill_border_vao = None
         self.vaos = []
+        self.init_slots()
 
     def generate_vaos(self):
         self.stroke_vao = self.ctx.vertex_array(
             program=self.stroke_program,
-            content=[(self.vbo, self.stroke_vert_format, *self.stroke_vert_attributes)],
+            content=self.get_vao_content(self.stroke_vert_format, self.stroke_vert_attributes),
             mode=self.render_primitive,
         )
         self.fill_vao = self.ctx.vertex_array(
             program=self.fill_program,
-            content=[(self.vbo, self.fill_vert_format, *self.fill_vert_attributes)],
+            content=self.get_vao_content(self.fill_vert_format, self.fill_vert_attributes),
             mode=self.render_primitive,
         )
         self.fill_border_vao = self.ctx.vertex_array(
             program=self.fill_border_program,
-            content=[(self.vbo, self.fill_border_vert_format, *self.fill_border_vert_attributes)],
+            content=self.get_vao_content(self.fill_border_vert_format, self.fill_border_vert_attributes),
             mode=self.render_primitive,
         )
         self.fill_depth_vao = self.ctx.vertex_array(
             program=self.fill_depth_program,
-            content=[(self.vbo, self.fill_depth_vert_format, *self.fill_depth_vert_attributes)],
+            content=self.get_vao_content(self.fill_depth_vert_format, self.fill_depth_vert_attributes),
             mode=self.render_primitive,
         )
         self.vaos = [self.stroke_vao, self.fill_vao, self.fill_border_vao, self.fill_depth_vao]
@@ -433,7 +574,7 @@ class VShaderWrapper(ShaderWrapper):
     # Static method returning one shared value across all VShaderWrappers
     @lru_cache
     @staticmethod
-    def get_fill_canvas(ctx: moderngl.Context) -> Tuple[Framebuffer, VertexArray, Framebuffer]:
+    def get_fill_canvas(ctx: moderngl.Context, size: Tuple[int, int]) -> Tuple[Framebuffer, VertexArray, Framebuffer]:
         """
         Because VMobjects with fill are rendered in a funny way, using
         alpha blending to effectively compute the winding number around
@@ -443,8 +584,10 @@ class VShaderWrapper(ShaderWrapper):
         This returns a texture, loaded into a frame buffer, and a vao
         which can display that texture as a simple quad onto a screen,
         along with the rgb value which is meant to be discarded.
+
+        One is made for each context and resolution, since a context may
+        outlive one scene and be used by another with a different resolution.
         """
-        size = manim_config.camera.resolution
         double_size = (2 * size[0], 2 * size[1])
 
         # Important to make sure dtype is floating point (not fixed point)
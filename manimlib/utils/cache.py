@@ -5,12 +5,15 @@ from diskcache import Cache
 from contextlib import contextmanager
 from functools import wraps
 
+from manimlib.config import manim_config
+from manimlib.module_loader import ModuleLoader
 from manimlib.utils.directories import get_cache_dir
 from manimlib.utils.simple_functions import hash_string
 
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from typing import Optional
     T = TypeVar('T')
 
 
@@ -32,3 +35,76 @@ def cache_on_disk(func: Callable[..., T]) -> Callable[..., T]:
 
 def clear_cache():
     _cache.clear()
+
+
+def get_frame_count_key(
+    scene_class: type,
+    start: int | None = None,
+    end: int | None = None,
+) -> Optional[str]:
+    """
+    Frame counts are keyed by the scene name and animation range, together
+    with a hash of the source file being run and of every user module it
+    imports, directly or indirectly, so that any edit to them invalidates
+    the count.
+    """
+    file_name = manim_config.run.file_name
+    if not file_name or not os.path.exists(file_name):
+        return None
+    file_names = {os.path.abspath(file_name)}
+    file_names.update(ModuleLoader.get_user_module_files(scene_class.construct.__globals__))
+    sources = []
+    for name in sorted(file_names):
+        with open(name, "r") as fp:
+            sources.append(fp.read())
+    source_hash = hash_string("".join(sources))
+    fps = manim_config.camera.fps
+    return hash_string(f"frame_count{scene_class.__name__}{source_hash}{start}{end}{fps}")
+
+
+def get_cached_frame_count(scene_class: type, start: int | None = None, end: int | None = None) -> Optional[int]:
+    key = get_frame_count_key(scene_class, start, end)
+    if key is None:
+        return None
+    return _cache.get(key)
+
+
+def cache_frame_count(
+    scene_class: type,
+    n_frames: int,
+    start: int | None = None,
+    end: int | None = None,
+) -> None:
+    key = get_frame_count_key(scene_class, start, end)
+    if key is not None:
+        _cache.set(key, n_frames)
+
+
+def get_snapshot_index_key(file_name: str, scene_name: str) -> str:
+    return hash_string(f"scene_snapshot_index{os.path.abspath(file_name)}{scene_name}")
+
+
+def get_scene_snapshot_index(file_name: str, scene_name: str) -> dict[int, tuple[int, str]]:
+    """
+    Maps the play index at which each saved snapshot of a scene was
+    taken to the line of construct it was taken at, and its key
+    """
+    return _cache.get(get_snapshot_index_key(file_name, scene_name), dict())
+
+
+def save_scene_snapshot(
+    file_name: str,
+    scene_name: str,
+    play_index: int,
+    line_number: int,
+    key: str,
+    snapshot: bytes,
+) -> None:
+    _cache.set(hash_string(f"scene_snapshot{key}"), snapshot)
+    index = get_scene_snapshot_index(file_name, scene_name)
+    index[play_index] = (line_number, key)
+    _cache.set(get_snapshot_index_key(file_name, scene_name), index)
+
+
+def load_scene_snapshot(key: str) -> Optional[bytes]:
+    return _cache.get(hash_string(f"scene_snapshot{key}"))
@@ -8,7 +8,6 @@ import numpy as np
 import validators
 import urllib.request
 
-import manimlib.utils.directories
 from manimlib.utils.simple_functions import hash_string
 
 from typing import TYPE_CHECKING
@@ -31,9 +30,11 @@ def find_file(
     # Check if this is a file online first, and if so, download
     # it to the configured downloads directory
     if validators.url(file_name):
+        # Imported here, as directories imports this module
+        from manimlib.utils.directories import get_downloads_dir
         suffix = Path(file_name).suffix
         file_hash = hash_string(file_name)
-        folder = manimlib.utils.directories.get_downloads_dir()
+        folder = get_downloads_dir()
         path = Path(folder, file_hash).with_suffix(suffix)
 
         # ensure that the target folder exists before downloading
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import os
+import sys
+import sysconfig
+import types
+from enum import Enum
+
+import numpy as np
+
+from manimlib.mobject.mobject import Mobject
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Optional
+
+
+MAX_HASH_DEPTH = 32
+LIBRARY_DIRECTORIES = tuple(
+    os.path.realpath(sysconfig.get_paths()[key])
+    for key in ("stdlib", "platstdlib", "purelib", "platlib")
+)
+
+
+class UnhashableObject(Exception):
+    pass
+
+
+def hash_mobject_family(mobject: Mobject) -> str:
+    """
+    Hash of everything about a mobject's family which affects how it
+    is rendered, namely the data, uniforms, shader settings, and the
+    shape of the family tree.
+    """
+    hasher = hashlib.sha256()
+    update_hasher_with_mobject(hasher, mobject)
+    return hasher.hexdigest()
+
+
+def hash_objects(*objects: Any) -> Optional[str]:
+    """
+    Content hash of an arbitrary collection of objects, such as animations,
+    mobjects, config dicts and the functions they reference.  Returns None
+    if something was encountered which can't be reliably hashed.
+    """
+    hasher = hashlib.sha256()
+    try:
+        for obj in objects:
+            update_hasher(hasher, obj, set(), 0)
+    except UnhashableObject:
+        return None
+    return hasher.hexdigest()
+
+
+def hash_array(array: np.ndarray) -> str:
+    """
+    Cheap content hash of an array, for telling whether it
+    has changed, without comparing it to an earlier copy
+    """
+    array = np.ascontiguousarray(array)
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(f"{array.dtype.descr}{array.shape}".encode())
+    hasher.update(array.reshape(-1).view(np.uint8))
+    return hasher.hexdigest()
+
+
+def update_hasher_with_array(hasher, array: np.ndarray) -> None:
+    hasher.update(f"{array.dtype.str}{array.shape}".encode())
+    hasher.update(np.ascontiguousarray(array).tobytes())
+
+
+def update_hasher_with_mobject(hasher, mobject: Mobject) -> None:
+    for mob in mobject.get_family():
+        hasher.update(mob.__class__.__qualname__.encode())
+        hasher.update(len(mob.submobjects).to_bytes(8, "little"))
+        update_hasher_with_array(hasher, mob.data)
+        for key, value in mob.uniforms.items():
+            hasher.update(key.encode())
+            update_hasher_with_array(hasher, np.asarray(value))
+        hasher.update(repr((
+            mob.shader_folder,
+            mob.depth_test,
+            mob.z_index,
+            mob.texture_paths,
+            sorted(mob.shader_code_replacements.items()),
+        )).encode())
+
+
+def is_library_object(obj: Any) -> bool:
+    """
+    Whether a function or class comes from manimlib, the standard library or
+    an installed package, as opposed to user code such as a scene file.  Only
+    the names of library objects are hashed, since their code changes rarely
+    and following their globals would pull in much of the library.
+    """
+    module = sys.modules.get(getattr(obj, "__module__", None) or "")
+    if module is None:
+        return True
+    if module.__name__.split(".")[0] == "manimlib":
+        return True
+    file_name = getattr(module, "__file__", None)
+    if file_name is None:
+        return True
+    file_name = os.path.realpath(file_name)
+    return any(file_name.startswith(directory) for directory in LIBRARY_DIRECTORIES)
+
+
+def get_referenced_names(code: types.CodeType) -> set[str]:
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names.update(get_referenced_names(const))
+    return names
+
+
+def update_hasher_with_globals(hasher, func: types.FunctionType, memo: set[int], depth: int) -> None:
+    """
+    Hash the values of the module level names a user function refers
+    to, so that editing a helper or constant changes the hash
+    """
+    for name in sorted(get_referenced_names(func.__code__)):
+        if name not in func.__globals__:
+            # Attribute names and builtins
+            continue
+        value = func.__globals__[name]
+        if isinstance(value, types.ModuleType):
+            hasher.update(f"module:{value.__name__};".encode())
+            continue
+        hasher.update(name.encode())
+        update_hasher(hasher, value, memo, depth + 1)
+
+
+def update_hasher_with_class(hasher, cls: type, memo: set[int], depth: int) -> None:
+    """
+    Hash the code of each user-defined class in the mro
+    """
+    for base in cls.__mro__:
+        hasher.update(f"{base.__module__}.{base.__qualname__}".encode())
+        if is_library_object(base):
+            continue
+        for key, value in vars(base).items():
+            if isinstance(value, (staticmethod, classmethod)):
+                value = value.__func__
+            elif isinstance(value, property):
+                value = (value.fget, value.fset)
+            elif not isinstance(value, (types.FunctionType, int, float, str, tuple)):
+                continue
+            hasher.update(key.encode())
+            update_hasher(hasher, value, memo, depth + 1)
+
+
+def update_hasher(hasher, obj: Any, memo: set[int], depth: int) -> None:
+    if depth > MAX_HASH_DEPTH:
+        raise UnhashableObject()
+
+    if obj is None or isinstance(obj, (bool, int, float, complex, str, bytes, Enum, np.generic)):
+        hasher.update(f"{type(obj).__name__}:{obj!r};".encode())
+        return
+    if isinstance(obj, np.ndarray):
+        update_hasher_with_array(hasher, obj)
+        return
+
+    # Guard against cycles
+    if id(obj) in memo:
+        hasher.update(b"<cycle>")
+        return
+    memo.add(id(obj))
+
+    if isinstance(obj, Mobject):
+        update_hasher_with_mobject(hasher, obj)
+    elif isinstance(obj, (list, tuple)):
+        hasher.update(f"{type(obj).__name__}{len(obj)}".encode())
+        for item in obj:
+            update_hasher(hasher, item, memo, depth + 1)
+    elif isinstance(obj, dict):
+        hasher.update(f"dict{len(obj)}".encode())
+        for key, value in obj.items():
+            update_hasher(hasher, key, memo, depth + 1)
+            update_hasher(hasher, value, memo, depth + 1)
+    elif isinstance(obj, types.FunctionType):
+        hasher.update(obj.__qualname__.encode())
+        update_hasher(hasher, obj.__code__, memo, depth + 1)
+        update_hasher(hasher, obj.__defaults__, memo, depth + 1)
+        try:
+            cells = tuple(cell.cell_contents for cell in obj.__closure__ or ())
+        except ValueError:
+            # Empty closure cell
+            raise UnhashableObject()
+        update_hasher(hasher, cells, memo, depth + 1)
+        if not is_library_object(obj):
+            update_hasher_with_globals(hasher, obj, memo, depth)
+    elif isinstance(obj, types.CodeType):
+        hasher.update(obj.co_code)
+        update_hasher(hasher, obj.co_consts, memo, depth + 1)
+        update_hasher(hasher, obj.co_names, memo, depth + 1)
+    elif isinstance(obj, types.MethodType):
+        update_hasher(hasher, obj.__func__, memo, depth + 1)
+        update_hasher(hasher, obj.__self__, memo, depth + 1)
+    elif isinstance(obj, functools.partial):
+        update_hasher(hasher, (obj.func, obj.args, obj.keywords), memo, depth + 1)
+    elif isinstance(obj, type) and not is_library_object(obj):
+        update_hasher_with_class(hasher, obj, memo, depth)
+    elif isinstance(obj, (types.BuiltinFunctionType, np.ufunc, type)):
+        name = getattr(obj, "__qualname__", obj.__name__)
+        hasher.update(f"{getattr(obj, '__module__', '')}.{name}".encode())
+    elif hasattr(obj, "__dict__"):
+        update_hasher(hasher, type(obj), memo, depth + 1)
+        update_hasher(hasher, vars(obj), memo, depth + 1)
+    else:
+        raise UnhashableObject()
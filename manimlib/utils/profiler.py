@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import re
+import subprocess as sp
+import sys
+import threading
+import time
+from collections import defaultdict
+
+from manimlib.logger import log
+from manimlib.utils.file_ops import guarantee_existence
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Iterator
+
+
+class Profiler(object):
+    """
+    Records timed spans for the stages of rendering each frame, such as
+    updating mobjects, interpolating animations, reading data into vbos,
+    drawing, reading back frames and encoding them.  Spans are grouped by
+    the play (or wait) during which they happen, and can be exported as
+    Chrome trace events, which can be viewed at chrome://tracing or
+    https://ui.perfetto.dev.
+
+    When disabled, as it is by default, spans cost only a function call.
+    """
+    def __init__(self):
+        self.enabled: bool = False
+        self.events: list[dict] = []
+        self.play_summaries: list[dict] = []
+        self.current_play: dict | None = None
+        self.start_time: float = time.perf_counter()
+        self.null_context = contextlib.nullcontext()
+
+    def enable(self) -> None:
+        self.enabled = True
+        self.reset()
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        self.events = []
+        self.play_summaries = []
+        self.current_play = None
+        self.start_time = time.perf_counter()
+
+    def get_timestamp(self) -> float:
+        # Microseconds, as used by the trace event format
+        return 1e6 * (time.perf_counter() - self.start_time)
+
+    def span(self, name: str, **args):
+        if not self.enabled:
+            return self.null_context
+        return self.record_span(name, args)
+
+    def count(self, name: str, value: int = 1) -> None:
+        """
+        Adds value to a counter, e.g. of mobjects culled, totalled for each
+        play and recorded as a counter event in the trace
+        """
+        if not self.enabled:
+            return
+        self.events.append(dict(
+            name=name,
+            cat="manim",
+            ph="C",
+            ts=self.get_timestamp(),
+            pid=os.getpid(),
+            args={name: value},
+        ))
+        play = self.current_play
+        if play is not None:
+            play["counters"][name] += value
+
+    @contextlib.contextmanager
+    def record_span(self, name: str, args: dict) -> Iterator[None]:
+        start = self.get_timestamp()
+        try:
+            yield
+        finally:
+            duration = self.get_timestamp() - start
+            self.add_event(name, start, duration, args)
+            play = self.current_play
+            if play is not None:
+                play["stage_times"][name] += duration
+                play["stage_counts"][name] += 1
+
+    def add_event(self, name: str, start: float, duration: float, args: dict) -> None:
+        self.events.append(dict(
+            name=name,
+            cat="manim",
+            ph="X",
+            ts=start,
+            dur=duration,
+            pid=os.getpid(),
+            tid=threading.get_ident(),
+            args=args,
+        ))
+
+    def begin_play(self, index: int, label: str) -> None:
+        if not self.enabled:
+            return
+        self.current_play = dict(
+            index=index,
+            label=label,
+            start=self.get_timestamp(),
+            stage_times=defaultdict(float),
+            stage_counts=defaultdict(int),
+            counters=defaultdict(int),
+        )
+
+    def end_play(self) -> None:
+        play = self.current_play
+        if not self.enabled or play is None:
+            return
+        play["duration"] = self.get_timestamp() - play["start"]
+        self.add_event(f"play {play['index']}", play["start"], play["duration"], dict(label=play["label"]))
+        self.play_summaries.append(play)
+        self.current_play = None
+
+    def report(self, trace_file_path: str) -> None:
+        if self.play_summaries:
+            print(self.get_summary_table())
+        self.export_chrome_trace(trace_file_path)
+
+    def export_chrome_trace(self, file_path: str) -> None:
+        guarantee_existence(os.path.dirname(os.path.abspath(file_path)))
+        with open(file_path, "w") as fp:
+            json.dump(dict(traceEvents=self.events, displayTimeUnit="ms"), fp)
+        log.info(f"Profile trace written to {file_path}")
+
+    def get_summary_table(self) -> str:
+        """
+        Table with a row for each play, giving the number of frames,
+        the total time, and the total milliseconds spent in each stage.
+        Nested stages, e.g. read_in within capture, are included in
+        the times of both.  Totals of any counters follow.
+        """
+        stages = []
+        counters = []
+        for play in self.play_summaries:
+            stages.extend(s for s in play["stage_times"] if s not in stages)
+            counters.extend(c for c in play["counters"] if c not in counters)
+        header = ["play", "label", "frames", "total_ms", *(f"{s}_ms" for s in stages), *counters]
+        rows = [
+            [
+                str(play["index"]),
+                play["label"][:40],
+                str(play["stage_counts"]["frame"]),
+                f"{play['duration'] / 1000:.1f}",
+                *(f"{play['stage_times'][s] / 1000:.1f}" for s in stages),
+                *(str(play["counters"][c]) for c in counters),
+            ]
+            for play in self.play_summaries
+        ]
+        return format_table(header, rows)
+
+
+PROFILER = Profiler()
+
+
+def format_table(header: list[str], rows: list[list[str]]) -> str:
+    widths = [
+        max(len(row[i]) for row in [header, *rows])
+        for i in range(len(header))
+    ]
+    return "\n".join(
+        "  ".join(entry.rjust(width) for entry, width in zip(row, widths))
+        for row in [header, *rows]
+    )
+
+
+IMPORT_TIME_PATTERN = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)")
+
+
+def profile_startup(argv: list[str], num_modules: int = 25) -> int:
+    """
+    Runs manimgl with the given command line arguments in a subprocess, with
+    python's -X importtime, and then prints the total time spent importing,
+    that time broken down by top-level package, and the slowest imports.
+    Returns the exit code of the subprocess.
+    """
+    command = [sys.executable, "-X", "importtime", "-m", "manimlib", *argv]
+    process = sp.Popen(command, stderr=sp.PIPE, text=True)
+    package_times = defaultdict(int)
+    module_times = []
+    # Imports are listed after those they trigger, indented by nesting level
+    pending_by_level = defaultdict(list)
+    for line in process.stderr:
+        match = IMPORT_TIME_PATTERN.match(line)
+        if match is None:
+            if not line.startswith("import time:"):
+                sys.stderr.write(line)
+            continue
+        self_us, cumulative_us, indent, module_name = match.groups()
+        level = len(indent) // 2
+        package_times[module_name.split(".")[0]] += int(self_us)
+        entry = [module_name, int(self_us), int(cumulative_us), None]
+        for child in pending_by_level.pop(level + 1, []):
+            child[3] = module_name
+        pending_by_level[level].append(entry)
+        module_times.append(entry)
+    process.wait()
+
+    # Only list imports made at the top level, or directly by manimlib,
+    # rather than those nested within other packages
+    module_times = [
+        entry for entry in module_times
+        if entry[3] is None or entry[3].startswith("manimlib")
+    ]
+
+    total_ms = sum(package_times.values()) / 1000
+    packages = sorted(package_times.items(), key=lambda item: -item[1])
+    modules = sorted(module_times, key=lambda item: -item[2])[:num_modules]
+    print(f"Total import time: {total_ms:.1f} ms\n")
+    print(format_table(
+        ["package", "self_ms", "percent"],
+        [
+            [name, f"{us / 1000:.1f}", f"{100 * us / 1000 / total_ms:.1f}"]
+            for name, us in packages[:num_modules]
+        ]
+    ))
+    print()
+    print(format_table(
+        ["module", "self_ms", "cumulative_ms"],
+        [
+            [name, f"{self_us / 1000:.1f}", f"{cumulative_us / 1000:.1f}"]
+            for name, self_us, cumulative_us, parent in modules
+        ]
+    ))
+    return process.returncode
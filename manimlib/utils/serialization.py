@@ -0,0 +1,310 @@
+from __future__ import annotations
+
+import importlib
+import io
+import mmap
+import pickle
+import struct
+
+import numpy as np
+
+from manimlib.mobject.mobject import Mobject
+from manimlib.shader_wrapper import ShaderWrapper
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any
+
+
+MOBJECT_FORMAT_MAGIC = b"MANIMOB\0"
+MOBJECT_FORMAT_VERSION = 2
+# Magic, version, header length
+PREAMBLE = struct.Struct("<8sIQ")
+# Offsets of the data buffers are multiples of this
+ARRAY_ALIGNMENT = 64
+# Attributes whose content is written out explicitly, or not at all, since
+# they point outside the family or hold gpu objects
+STRUCTURAL_ATTRS = (
+    "data", "submobjects", "family", "parents",
+    "target", "saved_state", "shader_wrapper", "gpu_interpolation",
+)
+# Attribute values which match those of the first member of the same class
+# are left out of the file.  Scalars are compared directly, and containers
+# element-wise, with those among COPIED_TYPES copied for each member on loading,
+# all of which have a copy method.
+SCALAR_TYPES = frozenset([type(None), bool, int, float, complex, str, bytes])
+COPIED_TYPES = (list, dict, set, np.ndarray)
+
+
+class UnsupportedMobjectFormat(Exception):
+    pass
+
+
+def is_binary_mobject(data: bytes | memoryview) -> bool:
+    return bytes(data[:len(MOBJECT_FORMAT_MAGIC)]) == MOBJECT_FORMAT_MAGIC
+
+
+def serialize_mobject(mobject: Mobject) -> bytes:
+    """
+    Writes a mobject's family into a compact binary format, laid out as
+
+    - A preamble, with the format's magic bytes, its version, and the length
+      of the header which follows it
+    - A header with one flat table for the whole family: the classes used,
+      each member's class id, submobject index ranges, and which data buffer
+      and rows hold its data, along with, pickled in one go, the attributes
+      of the first member of each class and, for the others, only those
+      attributes which differ from it
+    - One contiguous buffer of data per data dtype, aligned to ARRAY_ALIGNMENT
+
+    so that loading amounts to little more than pointing numpy at those
+    buffers.  Raises an UnsupportedMobjectFormat if some class in the family
+    can't be found by its name, in which case pickle can be used instead.
+    """
+    family = mobject.get_family()
+    family_index = {id(mob): index for index, mob in enumerate(family)}
+
+    classes: list[type] = []
+    class_ids = dict()
+    dtypes: list[np.dtype] = []
+    dtype_ids = dict()
+    # Holds on to the dtypes keyed by id
+    dtype_refs = []
+    data_by_dtype: list[list[np.ndarray]] = []
+    row_counts: list[int] = []
+    # Per member: class id, first child, end of children, dtype id, first row, end row
+    table = np.zeros((len(family), 6), dtype=np.int64)
+    children = []
+    references = dict()
+    attr_deltas = []
+
+    for index, mob in enumerate(family):
+        cls = type(mob)
+        if cls not in class_ids:
+            if find_class(cls.__module__, cls.__qualname__) is not cls:
+                raise UnsupportedMobjectFormat(f"{cls.__qualname__} can't be found by name")
+            class_ids[cls] = len(classes)
+            classes.append(cls)
+        # Structured dtypes are slow to compare, so look them up by id first
+        dtype = mob.data.dtype
+        dtype_id = dtype_ids.get(id(dtype))
+        if dtype_id is None:
+            dtype_id = next((i for i, dt in enumerate(dtypes) if dt == dtype), len(dtypes))
+            if dtype_id == len(dtypes):
+                dtypes.append(dtype)
+                data_by_dtype.append([])
+                row_counts.append(0)
+            dtype_ids[id(dtype)] = dtype_id
+            dtype_refs.append(dtype)
+        n_rows = len(mob.data)
+        table[index] = (
+            class_ids[cls],
+            len(children),
+            len(children) + len(mob.submobjects),
+            dtype_id,
+            row_counts[dtype_id],
+            row_counts[dtype_id] + n_rows,
+        )
+        children.extend(family_index[id(sm)] for sm in mob.submobjects)
+        data_by_dtype[dtype_id].append(mob.data)
+        row_counts[dtype_id] += n_rows
+
+        attrs = dict(mob.__dict__)
+        for key in STRUCTURAL_ATTRS:
+            attrs.pop(key, None)
+        reference = references.get(cls)
+        if reference is None:
+            references[cls] = attrs
+            attr_deltas.append(None)
+        else:
+            attr_deltas.append(get_attr_delta(attrs, reference))
+
+    buffers = []
+    buffer_offsets = []
+    offset = 0
+    for arrays in data_by_dtype:
+        # Joining raw bytes skips the dtype promotion concatenate does per array
+        buffer = b"".join(np.ascontiguousarray(array).data for array in arrays)
+        buffer_offsets.append(offset)
+        buffers.append(buffer)
+        padding = -len(buffer) % ARRAY_ALIGNMENT
+        buffers.append(b"\0" * padding)
+        offset += len(buffer) + padding
+
+    attrs_pickle = io.BytesIO()
+    pickler = pickle.Pickler(attrs_pickle, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def persistent_id(value: Any):
+        if isinstance(value, Mobject):
+            # References outside the family are left out, as with pickle
+            index = family_index.get(id(value))
+            return ("family", index) if index is not None else ("none",)
+        if isinstance(value, ShaderWrapper):
+            return ("none",)
+        return None
+
+    pickler.persistent_id = persistent_id
+    pickler.dump(([references[cls] for cls in classes], attr_deltas))
+
+    header = pickle.dumps(dict(
+        classes=[(cls.__module__, cls.__qualname__) for cls in classes],
+        table=table,
+        children=np.array(children, dtype=np.int64),
+        dtypes=[dtype.descr if dtype.names else dtype.str for dtype in dtypes],
+        buffer_offsets=buffer_offsets,
+        row_counts=row_counts,
+        attrs=attrs_pickle.getvalue(),
+    ), protocol=pickle.HIGHEST_PROTOCOL)
+    preamble = PREAMBLE.pack(MOBJECT_FORMAT_MAGIC, MOBJECT_FORMAT_VERSION, len(header))
+    padding = b"\0" * (-(len(preamble) + len(header)) % ARRAY_ALIGNMENT)
+    return b"".join([preamble, header, padding, *buffers])
+
+
+def deserialize_mobject(data: bytes | memoryview | mmap.mmap) -> Mobject:
+    """
+    Inverse of serialize_mobject.  Data arrays are views onto the given
+    buffer rather than copies, and read-only, so that, like those of copies
+    of mobjects, they only get copied once something modifies them.
+    """
+    view = memoryview(data).cast("B")
+    magic, version, header_length = PREAMBLE.unpack_from(view)
+    if magic != MOBJECT_FORMAT_MAGIC:
+        raise UnsupportedMobjectFormat("Not a serialized mobject")
+    if version != MOBJECT_FORMAT_VERSION:
+        raise UnsupportedMobjectFormat(
+            f"Mobject was serialized with format version {version}, while "
+            f"this version of manim reads version {MOBJECT_FORMAT_VERSION}"
+        )
+    header_start = PREAMBLE.size
+    header_end = header_start + header_length
+    header = pickle.loads(view[header_start:header_end])
+    buffer = view[header_end + (-header_end % ARRAY_ALIGNMENT):].toreadonly()
+
+    classes = []
+    for module_name, qualname in header["classes"]:
+        cls = find_class(module_name, qualname)
+        if cls is None:
+            raise UnsupportedMobjectFormat(f"Class {module_name}.{qualname} not found")
+        classes.append(cls)
+    data_buffers = []
+    for dtype, offset, count in zip(header["dtypes"], header["buffer_offsets"], header["row_counts"]):
+        dtype = np.dtype(dtype)
+        if count == 0:
+            data_buffers.append(np.zeros(0, dtype=dtype))
+        else:
+            data_buffers.append(np.frombuffer(buffer, dtype=dtype, count=count, offset=offset))
+
+    # Make every family member first, so that attributes can refer to them
+    table = header["table"].tolist()
+    family = [cls.__new__(cls) for cls in (classes[row[0]] for row in table)]
+
+    unpickler = pickle.Unpickler(io.BytesIO(header["attrs"]))
+    unpickler.persistent_load = lambda pid: family[pid[1]] if pid[0] == "family" else None
+    references, attr_deltas = unpickler.load()
+    copied_keys = [
+        [key for key, value in reference.items() if isinstance(value, COPIED_TYPES)]
+        for reference in references
+    ]
+    children = header["children"].tolist()
+
+    for mob, row, delta in zip(family, table, attr_deltas):
+        class_id, child_start, child_end, dtype_id, row_start, row_end = row
+        attrs = mob.__dict__
+        if delta is None:
+            # The reference member itself
+            attrs.update(references[class_id])
+        else:
+            attrs.update(references[class_id])
+            for key in copied_keys[class_id]:
+                if key not in delta:
+                    attrs[key] = attrs[key].copy()
+            attrs.update(delta)
+        mob.uniforms = {
+            key: value.copy() if type(value) is np.ndarray else value
+            for key, value in mob.uniforms.items()
+        }
+        mob.data = data_buffers[dtype_id][row_start:row_end]
+        mob.submobjects = [family[index] for index in children[child_start:child_end]]
+        mob.parents = []
+        mob.family = None
+        mob.target = None
+        mob.saved_state = None
+        mob.shader_wrapper = None
+        mob.gpu_interpolation = None
+        mob._data_has_changed = True
+        mob._data_is_shared = False
+    for mob in family:
+        for sm in mob.submobjects:
+            sm.parents.append(mob)
+    return family[0]
+
+
+def get_attr_delta(attrs: dict, reference: dict) -> dict:
+    """
+    Attributes of a mobject which differ from those of the reference member of
+    its class.  Uniforms are compared key by key, and the whole of them kept
+    if any differ.  Attributes the reference lacks, or which are missing, make
+    the whole dict be kept, so that applying the delta is always an update.
+    """
+    if attrs.keys() != reference.keys():
+        return attrs
+    return {
+        key: value for key, value in attrs.items()
+        if value is not reference[key] and not values_match(value, reference[key])
+    }
+
+
+def values_match(value: Any, reference: Any) -> bool:
+    if value is reference:
+        return True
+    value_type = type(value)
+    if value_type is not type(reference):
+        return False
+    if value_type in SCALAR_TYPES:
+        return value == reference
+    if value_type is np.ndarray:
+        return (
+            value.dtype == reference.dtype
+            and value.shape == reference.shape
+            and not value.dtype.hasobject
+            and value.tobytes() == reference.tobytes()
+        )
+    if isinstance(value, dict):
+        return value.keys() == reference.keys() and all(
+            values_match(value[key], reference[key]) for key in value
+        )
+    if isinstance(value, (list, set, tuple)):
+        try:
+            return bool(value == reference)
+        except Exception:
+            # E.g. tuples of arrays
+            return False
+    return False
+
+
+def save_mobject(mobject: Mobject, file_path: str) -> None:
+    with open(file_path, "wb") as fp:
+        fp.write(serialize_mobject(mobject))
+
+
+def load_mobject(file_path: str, use_mmap: bool = True) -> Mobject:
+    """
+    Loads a mobject saved with save_mobject.  By default the file is memory
+    mapped, so that data is only read from disk as it's used.
+    """
+    with open(file_path, "rb") as fp:
+        if not use_mmap:
+            return deserialize_mobject(fp.read())
+        # The mapping stays open for as long as arrays refer to it
+        return deserialize_mobject(mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+def find_class(module_name: str, qualname: str) -> type | None:
+    try:
+        obj = importlib.import_module(module_name)
+    except ImportError:
+        return None
+    for name in qualname.split("."):
+        obj = getattr(obj, name, None)
+    return obj if isinstance(obj, type) else None
@@ -112,3 +112,47 @@ def get_colormap_code(rgb_list: Sequence[float]) -> str:
         for rgb in rgb_list
     )
     return f"vec3[{len(rgb_list)}]({data})"
+
+
+# Width of the textures holding per-submobject interpolation alphas
+LAG_TABLE_WIDTH = 4096
+
+
+def get_interpolating_vertex_shader(code: str) -> str:
+    """
+    Rewrites a vertex shader so that each vertex attribute, say point, is
+    read in as start_point and target_point, and mixed between them by an
+    alpha looked up from the LagTable texture at the index given by the
+    lag_index attribute.  This lets a transform run on the gpu, with only
+    the table of alphas changing from one frame to the next.
+    """
+    pattern = re.compile(r"^in\s+(\w+)\s+(\w+)\s*;", flags=re.MULTILINE)
+    names = [name for gl_type, name in pattern.findall(code)]
+    code = pattern.sub(r"in \1 start_\2;\nin \1 target_\2;\n\1 \2;", code)
+    code = re.sub(
+        r"^#version.*$",
+        lambda match: "\n".join([
+            match.group(0),
+            "uniform sampler2D LagTable;",
+            "in float lag_index;",
+        ]),
+        code,
+        count=1,
+        flags=re.MULTILINE,
+    )
+    assignments = "\n".join([
+        "",
+        "    int lag_int = int(lag_index);",
+        f"    ivec2 lag_coords = ivec2(lag_int % {LAG_TABLE_WIDTH}, lag_int / {LAG_TABLE_WIDTH});",
+        "    float interpolation_alpha = texelFetch(LagTable, lag_coords, 0).r;",
+        *(
+            f"    {name} = mix(start_{name}, target_{name}, interpolation_alpha);"
+            for name in names
+        ),
+    ])
+    return re.sub(
+        r"void\s+main\s*\(\s*\)\s*\{",
+        lambda match: match.group(0) + assignments,
+        code,
+        count=1,
+    )
@@ -368,6 +368,18 @@ def get_closest_point_on_line(a: VectN, b: VectN, p: VectN) -> VectN:
     return ((t * a) + ((1 - t) * b))
 
 
+def get_distances_to_segment(points: Vect3Array, a: Vect3, b: Vect3) -> np.ndarray:
+    """
+    Distance from each of points to the nearest point of the segment ab
+    """
+    ab = b - a
+    length_sq = np.dot(ab, ab)
+    if length_sq == 0:
+        return np.linalg.norm(points - a, axis=1)
+    t = np.clip(np.dot(points - a, ab) / length_sq, 0, 1)
+    return np.linalg.norm(points - (a + np.outer(t, ab)), axis=1)
+
+
 def get_winding_number(points: Sequence[Vect2 | Vect3]) -> float:
     total_angle = 0
     for p1, p2 in adjacent_pairs(points):
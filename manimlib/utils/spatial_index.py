@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+from collections import defaultdict
+import heapq
+import math
+
+import numpy as np
+
+from manimlib.mobject.mobject import Mobject
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Iterable, Optional
+    from manimlib.typing import Vect3, Vect3Array
+
+
+# Mobjects spanning more cells than this are kept in a list
+# checked on every query, rather than put in each cell
+MAX_CELLS_PER_MOBJECT = 64
+
+
+class SpatialIndex(object):
+    """
+    Uniform grid over the xy bounding boxes of a list of mobjects, for finding
+    those touching a point, those touching a box, or those nearest a point,
+    without testing every one of them.
+
+    Mobjects keep the order they were given in, with later ones treated as on
+    top, as in Scene.point_to_mobject.  The index observes changes to bounding
+    boxes, by way of Mobject.refresh_bounding_box and Mobject.note_changed_data,
+    and moves only the mobjects which changed before the next query.
+    Mobjects being added or removed calls for a new index.
+    """
+    def __init__(
+        self,
+        mobjects: Iterable[Mobject],
+        cell_size: Optional[float] = None,
+    ):
+        # What the index was built from, for telling whether it still applies
+        self.source = mobjects
+        self.mobjects = list(mobjects)
+        self.index_of = {id(mob): index for index, mob in enumerate(self.mobjects)}
+        n = len(self.mobjects)
+        self.mins = np.zeros((n, 3))
+        self.maxs = np.zeros((n, 3))
+        for index, mob in enumerate(self.mobjects):
+            bb = mob.get_bounding_box()
+            self.mins[index] = bb[0]
+            self.maxs[index] = bb[2]
+        self.cell_size = cell_size or self.get_default_cell_size()
+        self.cells: dict[tuple[int, int], set[int]] = defaultdict(set)
+        self.cell_ranges: list[Optional[tuple[int, int, int, int]]] = [None] * n
+        self.oversized: set[int] = set()
+        for index in range(n):
+            self.insert(index)
+        self.dirty: set[int] = set()
+        Mobject.bounding_box_observers.add(self)
+
+    def close(self) -> None:
+        """
+        Stop observing changes to bounding boxes
+        """
+        Mobject.bounding_box_observers.discard(self)
+
+    def get_default_cell_size(self) -> float:
+        # Around the size of a typical mobject
+        if len(self.mobjects) == 0:
+            return 1.0
+        sizes = (self.maxs - self.mins)[:, :2].max(1)
+        sizes = sizes[sizes > 0]
+        return float(np.median(sizes)) if len(sizes) > 0 else 1.0
+
+    def get_cell_range(self, mins: Vect3, maxs: Vect3) -> tuple[int, int, int, int]:
+        size = self.cell_size
+        return (
+            math.floor(mins[0] / size), math.floor(mins[1] / size),
+            math.floor(maxs[0] / size), math.floor(maxs[1] / size),
+        )
+
+    def insert(self, index: int) -> None:
+        cell_range = self.get_cell_range(self.mins[index], self.maxs[index])
+        x0, y0, x1, y1 = cell_range
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > MAX_CELLS_PER_MOBJECT:
+            self.oversized.add(index)
+            cell_range = None
+        else:
+            for i in range(x0, x1 + 1):
+                for j in range(y0, y1 + 1):
+                    self.cells[(i, j)].add(index)
+        self.cell_ranges[index] = cell_range
+
+    def discard(self, index: int) -> None:
+        cell_range = self.cell_ranges[index]
+        if cell_range is None:
+            self.oversized.discard(index)
+            return
+        x0, y0, x1, y1 = cell_range
+        for i in range(x0, x1 + 1):
+            for j in range(y0, y1 + 1):
+                self.cells[(i, j)].discard(index)
+
+    # Keeping up to date
+
+    def note_changed_bounding_box(self, mobject: Mobject) -> None:
+        index = self.index_of.get(id(mobject))
+        if index is not None:
+            self.dirty.add(index)
+
+    def update(self) -> None:
+        for index in self.dirty:
+            self.discard(index)
+            bb = self.mobjects[index].get_bounding_box()
+            self.mins[index] = bb[0]
+            self.maxs[index] = bb[2]
+            self.insert(index)
+        self.dirty.clear()
+
+    # Queries
+
+    def get_candidates(self, mins: Vect3, maxs: Vect3) -> np.ndarray:
+        x0, y0, x1, y1 = self.get_cell_range(mins, maxs)
+        candidates = set(self.oversized)
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > len(self.cells):
+            for (i, j), indices in self.cells.items():
+                if x0 <= i <= x1 and y0 <= j <= y1:
+                    candidates.update(indices)
+        else:
+            for i in range(x0, x1 + 1):
+                for j in range(y0, y1 + 1):
+                    if (i, j) in self.cells:
+                        candidates.update(self.cells[(i, j)])
+        return np.array(sorted(candidates), dtype=int)
+
+    def get_indices_in_box(self, mins: Vect3, maxs: Vect3, buff: float = 0) -> np.ndarray:
+        self.update()
+        mins = np.asarray(mins, dtype=float) - buff
+        maxs = np.asarray(maxs, dtype=float) + buff
+        candidates = self.get_candidates(mins, maxs)
+        if len(candidates) == 0:
+            return candidates
+        overlapping = np.logical_and(
+            (self.maxs[candidates] >= mins).all(1),
+            (self.mins[candidates] <= maxs).all(1),
+        )
+        return candidates[overlapping]
+
+    def get_mobjects_at_point(self, point: Vect3, buff: float = 0) -> list[Mobject]:
+        """
+        Mobjects whose bounding boxes, grown by buff, contain point,
+        in the order they were given, matching Mobject.is_point_touching
+        """
+        return [self.mobjects[i] for i in self.get_indices_in_box(point, point, buff)]
+
+    def get_top_mobject_at_point(self, point: Vect3, buff: float = 0) -> Optional[Mobject]:
+        indices = self.get_indices_in_box(point, point, buff)
+        return self.mobjects[indices[-1]] if len(indices) > 0 else None
+
+    def get_mobjects_in_box(self, bounding_box: Vect3Array, buff: float = 0) -> list[Mobject]:
+        """
+        Mobjects whose bounding boxes overlap the given bounding box, given as
+        with Mobject.get_bounding_box, grown by buff, matching Mobject.is_touching
+        """
+        bounding_box = np.asarray(bounding_box)
+        return [
+            self.mobjects[i]
+            for i in self.get_indices_in_box(bounding_box[0], bounding_box[-1], buff)
+        ]
+
+    def get_nearest_mobjects(self, point: Vect3, k: int = 1) -> list[Mobject]:
+        """
+        The k mobjects whose bounding boxes are nearest to point, nearest
+        first, searching outwards from point through rings of cells
+        """
+        self.update()
+        point = np.asarray(point, dtype=float)
+        k = min(k, len(self.mobjects))
+        if k == 0:
+            return []
+
+        def distances(indices: np.ndarray) -> np.ndarray:
+            nearest = np.clip(point, self.mins[indices], self.maxs[indices])
+            return np.linalg.norm(nearest - point, axis=1)
+
+        heap = []  # Best so far, as a max heap by negated distance
+        seen = set()
+
+        def consider(indices: Iterable[int]) -> None:
+            new = np.array([i for i in indices if i not in seen], dtype=int)
+            if len(new) == 0:
+                return
+            seen.update(new.tolist())
+            for index, dist in zip(new, distances(new)):
+                item = (-dist, -index)
+                if len(heap) < k:
+                    heapq.heappush(heap, item)
+                elif item > heap[0]:
+                    heapq.heapreplace(heap, item)
+
+        consider(self.oversized)
+        cx, cy = (math.floor(point[i] / self.cell_size) for i in range(2))
+        if self.cells:
+            keys = np.array(list(self.cells.keys()))
+            max_radius = int(np.abs(keys - (cx, cy)).max())
+        else:
+            max_radius = 0
+        for radius in range(max_radius + 1):
+            # Anything in cells further out is at least this far away
+            if len(heap) == k and -heap[0][0] <= (radius - 1) * self.cell_size:
+                break
+            for i in range(cx - radius, cx + radius + 1):
+                for j in range(cy - radius, cy + radius + 1):
+                    if max(abs(i - cx), abs(j - cy)) == radius and (i, j) in self.cells:
+                        consider(self.cells[(i, j)])
+        result = sorted((-neg_dist, -neg_index) for neg_dist, neg_index in heap)
+        return [self.mobjects[index] for dist, index in result]
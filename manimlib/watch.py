@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import ast
+import os
+import time
+import traceback
+
+from addict import Dict
+
+from manimlib.config import manim_config
+import manimlib.extract_scene
+from manimlib.extract_scene import get_scene_classes
+from manimlib.extract_scene import is_child_scene
+from manimlib.extract_scene import prompt_user_for_choice
+from manimlib.extract_scene import scene_from_class
+from manimlib.logger import log
+from manimlib.module_loader import ModuleLoader
+from manimlib.parallel_render import ParallelSceneRenderer
+from manimlib.render_server import get_output_files
+from manimlib.render_server import release_scene
+from manimlib.utils.simple_functions import hash_string
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Iterable, Optional
+    from manimlib.module_loader import Module
+
+
+class SceneWatcher(object):
+    """
+    Keeps running after rendering, watching the scene file and the modules of
+    its own project which it imports, and re-renders each time they change.
+
+    Only scenes whose code changed are rendered again.  Each scene is hashed
+    by the source of its class, together with those of its base classes in
+    the same file, the rest of that file outside of scene classes, and the
+    contents of the imported project modules.  An edit to one scene's construct
+    then only re-renders that scene, while an edit to a shared helper re-renders
+    all of them.
+
+    Since the process stays alive, the gl context, compiled shaders, and caches
+    such as SVG_HASH_TO_MOB_MAP and PATH_TO_POINTS carry over from one render
+    to the next.
+    """
+    def __init__(self, poll_interval: float = 0.25, debounce: float = 0.1):
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.run_config = manim_config.run
+        if self.run_config.file_name is None:
+            raise ValueError("A scene file is needed to watch")
+        self.file_name = os.path.abspath(self.run_config.file_name)
+        self.scene_names: list[str] = list(self.run_config.scene_names)
+        self.rendered_hashes: dict[str, str] = dict()
+        self.watched_files: set[str] = {self.file_name}
+
+    def watch_forever(self) -> None:
+        try:
+            while True:
+                self.render_changed_scenes()
+                log.info(f"Watching {len(self.watched_files)} file(s) for changes")
+                changed_files = wait_for_changes(self.watched_files, self.poll_interval, self.debounce)
+                log.info("Changed: " + ", ".join(map(os.path.relpath, sorted(changed_files))))
+                # Project modules imported by the scene file are reloaded along with it
+                self.run_config.is_reload = True
+        except KeyboardInterrupt:
+            pass
+
+    def render_changed_scenes(self) -> None:
+        try:
+            module = manimlib.extract_scene.get_module(self.run_config)
+        except Exception:
+            log.error("Failed to load the scene file\n" + traceback.format_exc())
+            return
+        self.watched_files = {self.file_name, *ModuleLoader.get_user_module_files(module.__dict__)}
+
+        scene_classes = self.get_watched_scene_classes(module)
+        hashes = get_scene_hashes(module, scene_classes, self.file_name, self.watched_files)
+        changed = [
+            scene_class for scene_class in scene_classes
+            if hashes[scene_class.__name__] != self.rendered_hashes.get(scene_class.__name__)
+        ]
+        if not changed:
+            log.info("No scenes changed")
+            return
+        for scene_class in changed:
+            name = scene_class.__name__
+            try:
+                self.render(scene_class)
+            except Exception:
+                log.error(f"Failed to render {name}\n" + traceback.format_exc())
+                continue
+            self.rendered_hashes[name] = hashes[name]
+
+    def get_watched_scene_classes(self, module: Module) -> list[type]:
+        scene_classes = get_scene_classes(module)
+        if self.run_config.write_all or len(scene_classes) == 1:
+            return scene_classes
+        if not self.scene_names:
+            # Asked for only once, and the choice kept for later renders
+            self.scene_names = [sc.__name__ for sc in prompt_user_for_choice(scene_classes)]
+        name_to_class = {sc.__name__: sc for sc in scene_classes}
+        manimlib.extract_scene.note_missing_scenes(self.scene_names, name_to_class.keys())
+        return [name_to_class[name] for name in self.scene_names if name in name_to_class]
+
+    def render(self, scene_class: type) -> None:
+        scene = scene_from_class(scene_class, Dict(manim_config.scene), self.run_config)
+        scene.run()
+        for path in get_output_files(scene):
+            log.info(f"Rendered {scene_class.__name__} to {path}")
+        if not isinstance(scene, ParallelSceneRenderer):
+            release_scene(scene)
+
+
+def get_scene_hashes(
+    module: Module,
+    scene_classes: list[type],
+    file_name: str,
+    dependency_files: Iterable[str],
+) -> dict[str, str]:
+    """
+    Maps the name of each scene class to a hash of the code it depends on,
+    see SceneWatcher.
+    """
+    with open(file_name, "r") as fp:
+        source = fp.read()
+    lines = source.splitlines(keepends=True)
+
+    # Source of each top-level scene class in the file, including decorators
+    class_sources = dict()
+    for node in ast.parse(source).body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        cls = getattr(module, node.name, None)
+        if not is_child_scene(cls, module):
+            continue
+        start = min([node.lineno, *(d.lineno for d in node.decorator_list)])
+        class_sources[node.name] = (start, node.end_lineno)
+
+    # Everything else in the file, such as imports, helper functions and constants
+    shared_lines = list(lines)
+    for start, end in class_sources.values():
+        shared_lines[start - 1:end] = [""] * (end - start + 1)
+    shared_hash = hash_string("".join(shared_lines))
+    for path in sorted(set(dependency_files) - {file_name}):
+        shared_hash = hash_string(shared_hash + get_file_content(path))
+
+    hashes = dict()
+    for scene_class in scene_classes:
+        parts = [shared_hash]
+        for cls in scene_class.__mro__:
+            if cls.__name__ in class_sources and getattr(module, cls.__name__, None) is cls:
+                start, end = class_sources[cls.__name__]
+                parts.append("".join(lines[start - 1:end]))
+        hashes[scene_class.__name__] = hash_string("\n".join(parts))
+    return hashes
+
+
+def get_file_content(path: str) -> str:
+    try:
+        with open(path, "r") as fp:
+            return fp.read()
+    except OSError:
+        return ""
+
+
+def wait_for_changes(paths: Iterable[str], poll_interval: float, debounce: float) -> set[str]:
+    """
+    Blocks until at least one of the given files is written, created or
+    removed, and returns those which changed.  Uses inotify where available,
+    through the optional inotify_simple package, and otherwise polls the
+    modification times of the files.
+    """
+    paths = set(map(os.path.abspath, paths))
+    try:
+        from inotify_simple import INotify
+    except ImportError:
+        return poll_for_changes(paths, poll_interval, debounce)
+    try:
+        return wait_for_inotify_changes(INotify, paths, debounce)
+    except OSError as err:
+        # E.g. when the limit on inotify watches is reached
+        log.debug(f"inotify unavailable ({err}), polling instead")
+        return poll_for_changes(paths, poll_interval, debounce)
+
+
+def get_mtimes(paths: Iterable[str]) -> dict[str, Optional[int]]:
+    result = dict()
+    for path in paths:
+        try:
+            result[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            result[path] = None
+    return result
+
+
+def poll_for_changes(paths: set[str], poll_interval: float, debounce: float) -> set[str]:
+    original = get_mtimes(paths)
+    while True:
+        time.sleep(poll_interval)
+        current = get_mtimes(paths)
+        if current != original:
+            break
+    # Let an editor finish writing, possibly across several files
+    time.sleep(debounce)
+    current = get_mtimes(paths)
+    return {path for path in paths if current[path] != original[path]}
+
+
+def wait_for_inotify_changes(INotify: type, paths: set[str], debounce: float) -> set[str]:
+    from inotify_simple import flags
+
+    # Directories are watched rather than the files themselves, since
+    # many editors save by writing a new file and renaming it over the old
+    mask = flags.CLOSE_WRITE | flags.MOVED_TO | flags.CREATE | flags.DELETE
+    changed = set()
+    with INotify() as inotify:
+        wd_to_dir = {
+            inotify.add_watch(directory, mask): directory
+            for directory in {os.path.dirname(path) for path in paths}
+        }
+        while not changed:
+            # Once something changed, keep collecting events until
+            # none arrive within the debounce interval
+            timeout = None
+            while events := inotify.read(timeout=timeout, read_delay=int(1000 * debounce)):
+                for event in events:
+                    path = os.path.join(wd_to_dir[event.wd], event.name)
+                    if path in paths:
+                        changed.add(path)
+                if not changed:
+                    break
+                timeout = int(1000 * debounce)
+    return changed
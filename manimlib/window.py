@@ -10,6 +10,7 @@ import screeninfo
 
 from manimlib.constants import ASPECT_RATIO
 from manimlib.constants import FRAME_SHAPE
+from manimlib.event_handler.event_type import EventType
 
 from typing import TYPE_CHECKING
 
@@ -35,9 +36,15 @@ class Window(PygletWindow):
         full_screen: bool = False,
         size: Optional[tuple[int, int]] = None,
         position: Optional[tuple[int, int]] = None,
-        samples: int = 0
+        samples: int = 0,
+        # If true, mouse motion, drag and scroll events are held until the
+        # next frame, with consecutive ones of the same kind merged into one
+        coalesce_mouse_events: bool = True,
     ):
         self.scene = scene
+        self.coalesce_mouse_events = coalesce_mouse_events
+        # Each entry is [event_type, x, y, dx, dy, *extra], in pixels
+        self.pending_mouse_events: list[list] = []
         self.monitor = self.get_monitor(monitor_index)
         self.default_size = size or self.get_default_size(full_screen)
         self.default_position = position or self.position_from_string(position_string)
@@ -57,6 +64,7 @@ class Window(PygletWindow):
         `scene.reload()` was requested, which will create new scene instances.
         """
         self.pressed_keys.clear()
+        self.pending_mouse_events.clear()
         self._has_undrawn_event = True
 
         self.scene = scene
@@ -151,29 +159,59 @@ class Window(PygletWindow):
             self._has_undrawn_event = True
         return wrapper
 
+    # Mouse motion, drag and scroll events can arrive many times per frame,
+    # so they're queued, merging each into the last one queued if it's of the
+    # same kind, keeping the latest position and summing the offsets.  The
+    # queue is flushed once per frame, see Scene.update_frame, or before any
+    # other event, so that the order of events is kept.
+    def queue_mouse_event(self, event_type: EventType, x: int, y: int, dx: float, dy: float, *extra) -> None:
+        if not self.coalesce_mouse_events:
+            self.deliver_mouse_event(event_type, x, y, dx, dy, *extra)
+            return
+        if self.pending_mouse_events:
+            last = self.pending_mouse_events[-1]
+            if last[0] == event_type and tuple(last[5:]) == extra:
+                last[1:5] = [x, y, last[3] + dx, last[4] + dy]
+                return
+        self.pending_mouse_events.append([event_type, x, y, dx, dy, *extra])
+
+    def flush_mouse_events(self) -> None:
+        events, self.pending_mouse_events = self.pending_mouse_events, []
+        for event in events:
+            self.deliver_mouse_event(*event)
+
+    def deliver_mouse_event(self, event_type: EventType, x: int, y: int, dx: float, dy: float, *extra) -> None:
+        if not self.scene:
+            return
+        point = self.pixel_coords_to_space_coords(x, y)
+        d_point = self.pixel_coords_to_space_coords(dx, dy, relative=True)
+        if event_type == EventType.MouseMotionEvent:
+            self.scene.on_mouse_motion(point, d_point)
+        elif event_type == EventType.MouseDragEvent:
+            self.scene.on_mouse_drag(point, d_point, *extra)
+        elif event_type == EventType.MouseScrollEvent:
+            self.scene.on_mouse_scroll(point, d_point, dx, dy)
+
     @note_undrawn_event
     def on_mouse_motion(self, x: int, y: int, dx: int, dy: int) -> None:
         super().on_mouse_motion(x, y, dx, dy)
         if not self.scene:
             return
-        point = self.pixel_coords_to_space_coords(x, y)
-        d_point = self.pixel_coords_to_space_coords(dx, dy, relative=True)
-        self.scene.on_mouse_motion(point, d_point)
+        self.queue_mouse_event(EventType.MouseMotionEvent, x, y, dx, dy)
 
     @note_undrawn_event
     def on_mouse_drag(self, x: int, y: int, dx: int, dy: int, buttons: int, modifiers: int) -> None:
         super().on_mouse_drag(x, y, dx, dy, buttons, modifiers)
         if not self.scene:
             return
-        point = self.pixel_coords_to_space_coords(x, y)
-        d_point = self.pixel_coords_to_space_coords(dx, dy, relative=True)
-        self.scene.on_mouse_drag(point, d_point, buttons, modifiers)
+        self.queue_mouse_event(EventType.MouseDragEvent, x, y, dx, dy, buttons, modifiers)
 
     @note_undrawn_event
     def on_mouse_press(self, x: int, y: int, button: int, mods: int) -> None:
         super().on_mouse_press(x, y, button, mods)
         if not self.scene:
             return
+        self.flush_mouse_events()
         point = self.pixel_coords_to_space_coords(x, y)
         self.scene.on_mouse_press(point, button, mods)
 
@@ -182,6 +220,7 @@ class Window(PygletWindow):
         super().on_mouse_release(x, y, button, mods)
         if not self.scene:
             return
+        self.flush_mouse_events()
         point = self.pixel_coords_to_space_coords(x, y)
         self.scene.on_mouse_release(point, button, mods)
 
@@ -190,12 +229,11 @@ class Window(PygletWindow):
         super().on_mouse_scroll(x, y, x_offset, y_offset)
         if not self.scene:
             return
-        point = self.pixel_coords_to_space_coords(x, y)
-        offset = self.pixel_coords_to_space_coords(x_offset, y_offset, relative=True)
-        self.scene.on_mouse_scroll(point, offset, x_offset, y_offset)
+        self.queue_mouse_event(EventType.MouseScrollEvent, x, y, x_offset, y_offset)
 
     @note_undrawn_event
     def on_key_press(self, symbol: int, modifiers: int) -> None:
+        self.flush_mouse_events()
         self.pressed_keys.add(symbol)  # Modifiers?
         super().on_key_press(symbol, modifiers)
         if not self.scene:
@@ -204,6 +242,7 @@ class Window(PygletWindow):
 
     @note_undrawn_event
     def on_key_release(self, symbol: int, modifiers: int) -> None:
+        self.flush_mouse_events()
         self.pressed_keys.difference_update({symbol})  # Modifiers?
         super().on_key_release(symbol, modifiers)
         if not self.scene: